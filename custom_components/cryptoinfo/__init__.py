@@ -2,17 +2,39 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
 
 from .api.crypto_info_data import CryptoInfoData
-from .const import CryptoInfoRuntimeData
+from .api.sessions import SENSOR_TYPE_PROVIDERS, async_acquire_session
+from .const import (
+    API_PLAN_PUBLIC,
+    CONF_API_KEY,
+    CONF_API_PLAN,
+    CONF_CRYPTOCURRENCY_IDS,
+    CONF_ENTITY_METRICS,
+    CONF_ENTITY_PROFILE,
+    CONF_LOOP_WATCHDOG,
+    CONF_MEMPOOL_MIRRORS,
+    CONF_MIN_TIME_BETWEEN_REQUESTS,
+    CONF_MULTIPLIERS,
+    CONF_PROFILING,
+    CONF_SENSOR_TYPE,
+    CONF_UPDATE_FREQUENCY,
+    ENTITY_PROFILE_FULL,
+    SENSOR_TYPE_PRICE,
+    CryptoInfoRuntimeData,
+)
+from .coordinator import CryptoDataCoordinator
 from .exceptions import CryptoInfoConnectionError
+from .helpers import parse_watchlist
+from .mining_sensor import BTCMempoolCoordinator, BTCNetworkCoordinator, CKPoolCoordinator
 
 if TYPE_CHECKING:
     from .const import CryptoInfoConfigEntry
@@ -25,6 +47,23 @@ CONFIG_ENTRY_MINOR_VERSION = 0
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
+# Settings applied to the running coordinators without reloading the entry
+LIVE_SETTINGS = frozenset({CONF_UPDATE_FREQUENCY, CONF_MIN_TIME_BETWEEN_REQUESTS})
+# Coordinators that take a new update interval while running
+LIVE_COORDINATORS = (CryptoDataCoordinator, BTCNetworkCoordinator, BTCMempoolCoordinator, CKPoolCoordinator)
+# Coin list of a price entry, applied by adding and removing the affected coins' sensors
+WATCHLIST_SETTINGS = frozenset({CONF_CRYPTOCURRENCY_IDS, CONF_MULTIPLIERS})
+# Values of the options flow settings when absent, so saving the defaults is not a change
+OPTION_DEFAULTS: dict[str, Any] = {
+    CONF_PROFILING: False,
+    CONF_LOOP_WATCHDOG: False,
+    CONF_MEMPOOL_MIRRORS: "",
+    CONF_API_PLAN: API_PLAN_PUBLIC,
+    CONF_API_KEY: None,
+    CONF_ENTITY_PROFILE: ENTITY_PROFILE_FULL,
+    CONF_ENTITY_METRICS: [],
+}
+
 
 async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Migrate old entry to new version.
@@ -76,8 +115,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: CryptoInfoConfigEntry) -
         shared_data=shared_data,
         coordinator=None,
         coordinators={},
+        config={**entry.data, **entry.options},
     )
 
+    # Dedicated HTTP session of the entry's provider, closed with its last entry
+    provider = SENSOR_TYPE_PROVIDERS.get(entry.data.get(CONF_SENSOR_TYPE, SENSOR_TYPE_PRICE))
+    if provider is not None:
+        entry.async_on_unload(async_acquire_session(hass, provider))
+
     # Forward setup to platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -99,5 +144,47 @@ async def async_unload_entry(hass: HomeAssistant, entry: CryptoInfoConfigEntry)
 
 
 async def async_reload_entry(hass: HomeAssistant, entry: CryptoInfoConfigEntry) -> None:
-    """Reload config entry."""
+    """Apply changed intervals or coin list live; reload the entry for anything else."""
+    config: dict[str, Any] = {**entry.data, **entry.options}
+    running = entry.runtime_data.config
+    changed = {
+        key
+        for key in config.keys() | running.keys()
+        if config.get(key, OPTION_DEFAULTS.get(key)) != running.get(key, OPTION_DEFAULTS.get(key))
+    }
+    if not changed:
+        return
+    if changed <= LIVE_SETTINGS | WATCHLIST_SETTINGS and _async_apply_live_settings(entry, config, changed):
+        entry.runtime_data.config = config
+        _LOGGER.debug("Applied %s to entry %s without reload", sorted(changed), entry.entry_id)
+        return
     await hass.config_entries.async_reload(entry.entry_id)
+
+
+@callback
+def _async_apply_live_settings(entry: CryptoInfoConfigEntry, config: dict[str, Any], changed: set[str]) -> bool:
+    """Apply the changed live settings to the running entry; False when a reload is needed."""
+    runtime_data = entry.runtime_data
+    coordinators = [
+        coordinator for coordinator in runtime_data.coordinators.values() if isinstance(coordinator, LIVE_COORDINATORS)
+    ]
+    if not coordinators or len(coordinators) != len(runtime_data.coordinators):
+        return False
+    watchlist = None
+    if changed & WATCHLIST_SETTINGS:
+        if (watchlist := runtime_data.watchlist) is None:
+            return False
+        crypto_ids, multipliers = parse_watchlist(config)
+        if not crypto_ids or len(crypto_ids) != len(multipliers):
+            # Let the setup report the mismatch.
+            return False
+    if (price_coordinator := runtime_data.coordinator) is not None:
+        # Same precedence as at setup: the entry's value, else the shared one
+        min_time = float(config.get(CONF_MIN_TIME_BETWEEN_REQUESTS, runtime_data.shared_data.min_time_between_requests))
+        price_coordinator.api.min_request_interval = min_time * 60
+    if watchlist is not None:
+        watchlist.async_update(crypto_ids, multipliers)
+    interval = timedelta(minutes=float(config.get(CONF_UPDATE_FREQUENCY, 5)))
+    for coordinator in coordinators:
+        coordinator.async_set_update_interval(interval)
+    return True
@@ -6,18 +6,28 @@ Author: foXaCe
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Sequence
 from datetime import UTC, datetime, timedelta
 import logging
+import math
 import re
+import time
 from typing import TYPE_CHECKING, Any, cast
 
 import aiohttp
-from homeassistant.helpers import aiohttp_client
 
+from ..const import CKPOOL_REGION_AUTO, CKPOOL_REGION_EU, CKPOOL_REGION_GLOBAL
 from ..exceptions import (
     CryptoInfoConnectionError,
     CryptoInfoInvalidResponseError,
 )
+from ..profiling import profile_phase
+from .deadline import Deadline
+from .json_codec import json_loads
+from .offload import async_parse
+from .replay import http_session
+from .sessions import PROVIDER_CKPOOL, PROVIDER_MEMPOOL
+from .telemetry import EndpointStats, RequestTelemetry
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -25,24 +35,99 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 MEMPOOL_SPACE_API = "https://mempool.space/api"
+# Base URL of a CKPool front-end; ``{pool}`` is the pool host (solo / eusolostats).
+CKPOOL_URL = "https://{pool}"
 DEFAULT_TIMEOUT = 30
 MAX_RETRIES = 3
 RETRY_DELAY = 1.0
 CIRCUIT_BREAKER_THRESHOLD = 5
 CIRCUIT_BREAKER_TIMEOUT = 300  # 5 minutes
 BITCOIN_HALVING_INTERVAL = 210_000  # blocks between halvings
+# Mirror hedging: delay (seconds) used while a mirror has fewer than
+# HEDGE_MIN_SAMPLES answers on a route, and the shortest hedge delay.
+HEDGE_DEFAULT_DELAY = 1.0
+HEDGE_MIN_SAMPLES = 5
+HEDGE_MIN_DELAY = 0.05
+# Telemetry route for CKPool user stats; the address is deliberately left out.
+CKPOOL_ENDPOINT = "ckpool/users"
+# Automatic region selection: latency smoothing, failures before a region is
+# avoided, how long it is avoided (seconds) and how often the other one is re-probed.
+REGION_LATENCY_ALPHA = 0.3
+REGION_UNHEALTHY_AFTER = 2
+REGION_COOLDOWN = 300
+CKPOOL_REPROBE_EVERY = 20
+
+# EU pool page: the user blob starts at its first escaped hashrate1m key.
+_CKPOOL_BLOB_MARKER = '\\"hashrate1m\\":'
+# One pass over the blob: a known key with its quoted or bare value, or the end of an array of objects.
+_CKPOOL_FIELD_PATTERN = re.compile(
+    r'\\"(?P<name>hashrate1m|hashrate1hr|hashrate1d|lastShare|bestShare|bestEver|workers|id)\\":'
+    r'(?:\\"(?P<string>[^"\\]*)\\"|(?P<number>-?[\d.eE+]+)|\[\]?)'
+    r"|\}\]"
+)
+# Page key -> extracted key (global pool JSON names).
+_CKPOOL_FIELDS = {
+    "hashrate1m": "hashrate1m",
+    "hashrate1hr": "hashrate1hr",
+    "hashrate1d": "hashrate1d",
+    "lastShare": "lastshare",
+    "bestShare": "bestshare",
+    "bestEver": "bestever",
+}
+_CKPOOL_FLOAT_FIELDS = frozenset({"bestshare", "bestever"})
+
+
+def _attempt_timeout(deadline: Deadline | None, attempt: int, retries: int) -> float:
+    """Return the timeout of attempt ``attempt`` out of ``retries``, fitted to the deadline if any."""
+    if deadline is None:
+        return DEFAULT_TIMEOUT
+    # Exponential backoff before each retry still allowed after this attempt.
+    backoff = sum(RETRY_DELAY * 2**later for later in range(attempt, retries - 1))
+    return deadline.attempt_timeout(retries - attempt, DEFAULT_TIMEOUT, backoff)
+
+
+def _retry_delay(deadline: Deadline | None, backoff: float) -> float | None:
+    """Return the backoff before a retry; None when the deadline leaves no room for it."""
+    if deadline is None:
+        return backoff
+    return deadline.retry_delay(backoff)
+
+
+def worker_name(workername: Any) -> str | None:
+    """Return the rig part of a CKPool worker name (``<address>.<rig>``).
+
+    A miner connecting with the bare address is CKPool's default worker.
+    """
+    if not isinstance(workername, str) or not workername:
+        return None
+    _address, dot, rig = workername.partition(".")
+    return rig if dot and rig else "default"
 
 
 class BlockchainAPI:
-    """Helper class to interact with Mempool.space API for Bitcoin stats."""
+    """Helper class to interact with Mempool.space API for Bitcoin stats.
+
+    ``base_urls`` is an ordered list of mempool API mirrors (mempool.space,
+    public mirrors, a self-hosted instance). With more than one, each attempt
+    goes to a mirror and, if it has not answered within that mirror's observed
+    p90 latency for the route (or fails first), the same request is sent to the
+    next mirror; the first success wins and the other request is cancelled.
+    Retries start from the next mirror in the list.
+    """
 
-    __slots__ = ("_circuit_open_until", "_consecutive_failures", "hass")
+    __slots__ = ("_circuit_open_until", "_consecutive_failures", "_mirror_latency", "base_urls", "hass", "telemetry")
 
-    def __init__(self, hass: HomeAssistant) -> None:
+    provider = PROVIDER_MEMPOOL
+
+    def __init__(self, hass: HomeAssistant, base_urls: Sequence[str] = ()) -> None:
         """Initialize the API helper."""
         self.hass = hass
+        self.base_urls: tuple[str, ...] = tuple(url.rstrip("/") for url in base_urls) or (MEMPOOL_SPACE_API,)
         self._consecutive_failures = 0
         self._circuit_open_until: datetime | None = None
+        self.telemetry = RequestTelemetry()
+        # Successful-response latency per (mirror, route), for the hedge delay.
+        self._mirror_latency: dict[tuple[str, str], EndpointStats] = {}
 
     # =========================================================================
     # CIRCUIT BREAKER
@@ -72,27 +157,29 @@ class BlockchainAPI:
     # REQUEST HANDLING WITH RETRY
     # =========================================================================
 
-    async def _request(self, url: str, *, retry: bool = True, parse_json: bool = True) -> Any:
-        """Make API request with retry and circuit breaker."""
+    async def _request(
+        self, path: str, *, retry: bool = True, parse_json: bool = True, deadline: Deadline | None = None
+    ) -> Any:
+        """Make API request with retry and circuit breaker, fitted to ``deadline`` if given."""
         self._check_circuit_breaker()
 
         last_exception: Exception | None = None
         retries = MAX_RETRIES if retry else 1
+        endpoint = path.strip("/")
 
         for attempt in range(retries):
+            if attempt:
+                self.telemetry.record_retry(endpoint)
             try:
-                session = aiohttp_client.async_get_clientsession(self.hass)
-
-                async with asyncio.timeout(DEFAULT_TIMEOUT):
-                    async with session.get(url) as response:
-                        if response.status >= 400:
-                            raise CryptoInfoConnectionError(f"HTTP error: {response.status}", response.status)
-
-                        self._record_success()
+                data = await self._hedged(
+                    path, endpoint, attempt, parse_json, _attempt_timeout(deadline, attempt, retries)
+                )
 
-                        if parse_json:
-                            return await response.json()
-                        return await response.text()
+            except CryptoInfoInvalidResponseError as err:
+                # Invalid response: record failure and don't retry
+                _LOGGER.debug("Invalid response: %s", err)
+                self._record_failure()
+                raise
 
             except aiohttp.ClientError as err:
                 last_exception = CryptoInfoConnectionError(f"Connection error: {err}")
@@ -102,24 +189,133 @@ class BlockchainAPI:
                 last_exception = CryptoInfoConnectionError("Request timeout")
                 _LOGGER.debug("Request timeout (attempt %d/%d)", attempt + 1, retries)
 
+            else:
+                self._record_success()
+                return data
+
             if attempt < retries - 1:
-                delay = RETRY_DELAY * (2**attempt)  # Exponential backoff
+                delay = _retry_delay(deadline, RETRY_DELAY * (2**attempt))  # Exponential backoff
+                if delay is None:
+                    self.telemetry.record_retry_skipped(endpoint)
+                    _LOGGER.debug("No time left to retry %s before the refresh deadline", endpoint)
+                    break
                 await asyncio.sleep(delay)
 
         self._record_failure()
         raise last_exception or CryptoInfoConnectionError("Request failed")
 
+    async def _hedged(self, path: str, endpoint: str, attempt: int, parse_json: bool, budget: float) -> Any:
+        """Run one attempt, hedged on the next mirror when the first one is slow or fails."""
+        primary_url = self.base_urls[attempt % len(self.base_urls)]
+        if len(self.base_urls) == 1:
+            return await self._fetch(primary_url, path, endpoint, parse_json, budget)
+
+        started = time.monotonic()
+        primary = asyncio.create_task(self._fetch(primary_url, path, endpoint, parse_json, budget))
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=min(self.hedge_delay(primary_url, endpoint), budget))
+            if done and primary.exception() is None:
+                return primary.result()
+
+            # Slow or failed: ask the next mirror with the time left, first success wins.
+            hedge_url = self.base_urls[(attempt + 1) % len(self.base_urls)]
+            self.telemetry.record_hedge(endpoint)
+            hedge = asyncio.create_task(
+                self._fetch(hedge_url, path, endpoint, parse_json, budget - (time.monotonic() - started))
+            )
+            tasks.add(hedge)
+            error = primary.exception() if done else None
+            pending = tasks - done
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if (task_error := task.exception()) is None:
+                        if task is hedge:
+                            self.telemetry.record_hedge(endpoint, won=True)
+                        return task.result()
+                    error = error or task_error
+            raise cast(BaseException, error)
+        finally:
+            # Wait for the cancelled loser so its connection is released before returning.
+            unfinished = [task for task in tasks if not task.done()]
+            for task in unfinished:
+                task.cancel()
+            await asyncio.gather(*unfinished, return_exceptions=True)
+            for task in tasks:
+                if not task.cancelled():
+                    # Retrieve a losing mirror's error so it is not logged as never retrieved.
+                    task.exception()
+
+    async def _fetch(self, base_url: str, path: str, endpoint: str, parse_json: bool, budget: float) -> Any:
+        """Perform one request to a mirror within ``budget`` seconds."""
+        session = http_session(self.hass, self.provider)
+        started = time.monotonic()
+
+        with self.telemetry.track(endpoint) as tracked, profile_phase("network"):
+            async with asyncio.timeout(budget):
+                async with session.get(f"{base_url}{path}") as response:
+                    tracked.response = response
+                    if response.status >= 400:
+                        raise CryptoInfoConnectionError(f"HTTP error: {response.status}", response.status)
+
+                    if not parse_json:
+                        data: Any = await response.text()
+                    else:
+                        raw = await response.read()
+                        try:
+                            with profile_phase("decode"):
+                                data = await async_parse(self.hass, self.telemetry, endpoint, len(raw), json_loads, raw)
+                        except ValueError as err:
+                            raise CryptoInfoInvalidResponseError(f"Invalid JSON response: {err}") from err
+
+        if len(self.base_urls) > 1:
+            self._mirror_stats(base_url, endpoint).observe(time.monotonic() - started, 200, 0, failed=False)
+        return data
+
+    # =========================================================================
+    # MIRROR HEDGING
+    # =========================================================================
+
+    def _mirror_stats(self, base_url: str, endpoint: str) -> EndpointStats:
+        stats = self._mirror_latency.get((base_url, endpoint))
+        if stats is None:
+            stats = self._mirror_latency[(base_url, endpoint)] = EndpointStats()
+        return stats
+
+    def hedge_delay(self, base_url: str, endpoint: str) -> float:
+        """Return how long to wait for ``base_url`` before hedging: its p90 latency on the route."""
+        stats = self._mirror_latency.get((base_url, endpoint))
+        if stats is None or stats.requests < HEDGE_MIN_SAMPLES:
+            return HEDGE_DEFAULT_DELAY
+        return max(stats.latency_quantile(0.9) or HEDGE_DEFAULT_DELAY, HEDGE_MIN_DELAY)
+
+    def mirror_state(self) -> dict[str, Any]:
+        """Return per-mirror answered requests and hedge delays (mirrors by position, not URL)."""
+        state: dict[str, Any] = {}
+        for index, base_url in enumerate(self.base_urls):
+            routes = {
+                endpoint: {
+                    "answered": stats.requests,
+                    "hedge_delay_ms": round(self.hedge_delay(base_url, endpoint) * 1000),
+                }
+                for (url, endpoint), stats in sorted(self._mirror_latency.items())
+                if url == base_url
+            }
+            state[f"mirror_{index}"] = routes
+        return state
+
     # =========================================================================
     # API METHODS
     # =========================================================================
 
-    async def get_network_stats(self) -> dict[str, Any] | None:
+    async def get_network_stats(self, deadline: Deadline | None = None) -> dict[str, Any] | None:
         """Fetch Bitcoin network statistics from mempool.space using parallel requests."""
         try:
             # Parallel requests for better performance
-            mining_task = self._request(f"{MEMPOOL_SPACE_API}/v1/mining/hashrate/3d")
-            blocks_task = self._request(f"{MEMPOOL_SPACE_API}/blocks/tip/height", parse_json=False)
-            difficulty_task = self._request(f"{MEMPOOL_SPACE_API}/v1/difficulty-adjustment")
+            mining_task = self._request("/v1/mining/hashrate/3d", deadline=deadline)
+            blocks_task = self._request("/blocks/tip/height", parse_json=False, deadline=deadline)
+            difficulty_task = self._request("/v1/difficulty-adjustment", deadline=deadline)
 
             results = await asyncio.gather(
                 mining_task,
@@ -158,12 +354,12 @@ class BlockchainAPI:
             _LOGGER.error("Error fetching Bitcoin network stats: %s", err)
             return None
 
-    async def get_mempool_stats(self) -> dict[str, Any] | None:
+    async def get_mempool_stats(self, deadline: Deadline | None = None) -> dict[str, Any] | None:
         """Fetch Bitcoin mempool statistics from mempool.space using parallel requests."""
         try:
             # Parallel requests for better performance
-            mempool_task = self._request(f"{MEMPOOL_SPACE_API}/mempool")
-            fees_task = self._request(f"{MEMPOOL_SPACE_API}/v1/fees/recommended")
+            mempool_task = self._request("/mempool", deadline=deadline)
+            fees_task = self._request("/v1/fees/recommended", deadline=deadline)
 
             results = await asyncio.gather(
                 mempool_task,
@@ -195,153 +391,353 @@ class BlockchainAPI:
             return None
 
 
-class CKPoolAPI:
-    """Helper class to interact with CKPool solo mining API."""
+class RegionHealth:
+    """Latency and success of one CKPool front-end, for automatic region selection."""
+
+    __slots__ = ("consecutive_failures", "failures", "last_failure", "last_used", "latency", "pool_url", "successes")
 
-    __slots__ = ("_circuit_open_until", "_consecutive_failures", "hass", "pool_url")
+    def __init__(self, pool_url: str) -> None:
+        """Initialize empty health."""
+        self.pool_url = pool_url
+        self.latency: float | None = None
+        self.successes = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.last_failure = 0.0
+        self.last_used = 0.0
+
+    def observe(self, latency: float | None, now: float) -> None:
+        """Record one attempt; ``latency`` is None for a failure."""
+        self.last_used = now
+        if latency is None:
+            self.failures += 1
+            self.consecutive_failures += 1
+            self.last_failure = now
+            return
+        self.successes += 1
+        self.consecutive_failures = 0
+        self.latency = (
+            latency if self.latency is None else self.latency + REGION_LATENCY_ALPHA * (latency - self.latency)
+        )
+
+    def healthy(self, now: float) -> bool:
+        """Return False while the region is cooling down after repeated failures."""
+        return self.consecutive_failures < REGION_UNHEALTHY_AFTER or now - self.last_failure >= REGION_COOLDOWN
+
+    def rank(self, now: float) -> tuple[bool, float]:
+        """Return the sort key of the region: healthy first, then fastest.
+
+        A region never tried ranks first so it gets probed; one that has only
+        failed ranks last among the healthy ones.
+        """
+        if self.latency is not None:
+            return (not self.healthy(now), self.latency)
+        return (not self.healthy(now), math.inf if self.failures else 0.0)
+
+    def as_dict(self, now: float) -> dict[str, Any]:
+        """Return a JSON-serialisable snapshot."""
+        attempts = self.successes + self.failures
+        return {
+            "healthy": self.healthy(now),
+            "latency_ms": round(self.latency * 1000, 1) if self.latency is not None else None,
+            "success_rate": round(self.successes / attempts, 3) if attempts else None,
+            "successes": self.successes,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+        }
+
+
+class CKPoolAPI:
+    """Helper class to interact with CKPool solo mining API.
+
+    ``pool_url`` is a front-end host, or ``CKPOOL_REGION_AUTO`` to route each
+    request to the fastest healthy one of the EU and global front-ends. Both
+    formats (EU HTML page, global JSON) are normalized by ``_parse_ckpool_data``.
+    The client is shared by the addresses of a region, so the circuit breaker
+    is kept per address: one address failing does not block the others.
+    """
+
+    __slots__ = (
+        "_circuit_open_until",
+        "_consecutive_failures",
+        "_routed",
+        "hass",
+        "pool_url",
+        "regions",
+        "telemetry",
+    )
+
+    provider = PROVIDER_CKPOOL
 
     def __init__(self, hass: HomeAssistant, pool_url: str = "solo.ckpool.org") -> None:
         """Initialize the API helper."""
         self.hass = hass
         self.pool_url = pool_url
-        self._consecutive_failures = 0
-        self._circuit_open_until: datetime | None = None
+        # Circuit breaker state, by BTC address.
+        self._consecutive_failures: dict[str, int] = {}
+        self._circuit_open_until: dict[str, datetime] = {}
+        self.telemetry = RequestTelemetry()
+        self.regions: dict[str, RegionHealth] | None = None
+        if pool_url == CKPOOL_REGION_AUTO:
+            self.regions = {region: RegionHealth(region) for region in (CKPOOL_REGION_EU, CKPOOL_REGION_GLOBAL)}
+        self._routed = 0
 
     # =========================================================================
     # CIRCUIT BREAKER
     # =========================================================================
 
-    def _check_circuit_breaker(self) -> None:
-        """Check if circuit breaker is open."""
-        if self._circuit_open_until and datetime.now(UTC) < self._circuit_open_until:
-            raise CryptoInfoConnectionError(f"Circuit breaker open until {self._circuit_open_until}")
+    def _check_circuit_breaker(self, btc_address: str) -> None:
+        """Check if the address's circuit breaker is open."""
+        open_until = self._circuit_open_until.get(btc_address)
+        if open_until and datetime.now(UTC) < open_until:
+            raise CryptoInfoConnectionError(f"Circuit breaker open until {open_until}")
 
-    def _record_success(self) -> None:
+    def _record_success(self, btc_address: str) -> None:
         """Record successful request."""
-        self._consecutive_failures = 0
-        self._circuit_open_until = None
-
-    def _record_failure(self) -> None:
-        """Record failed request and potentially open circuit."""
-        self._consecutive_failures += 1
-        if self._consecutive_failures >= CIRCUIT_BREAKER_THRESHOLD:
-            self._circuit_open_until = datetime.now(UTC) + timedelta(seconds=CIRCUIT_BREAKER_TIMEOUT)
-            _LOGGER.warning(
-                "Circuit breaker opened after %d failures",
-                self._consecutive_failures,
-            )
-
-    async def get_user_stats(self, btc_address: str) -> dict[str, Any] | None:
-        """Fetch user mining statistics from CKPool with retry."""
-        self._check_circuit_breaker()
+        self._consecutive_failures.pop(btc_address, None)
+        self._circuit_open_until.pop(btc_address, None)
+
+    def _record_failure(self, btc_address: str) -> None:
+        """Record failed request and potentially open the address's circuit."""
+        failures = self._consecutive_failures[btc_address] = self._consecutive_failures.get(btc_address, 0) + 1
+        if failures >= CIRCUIT_BREAKER_THRESHOLD:
+            self._circuit_open_until[btc_address] = datetime.now(UTC) + timedelta(seconds=CIRCUIT_BREAKER_TIMEOUT)
+            _LOGGER.warning("Circuit breaker opened for %s after %d failures", btc_address, failures)
+
+    def open_circuits(self) -> int:
+        """Return the number of addresses whose circuit breaker is open."""
+        now = datetime.now(UTC)
+        return sum(1 for open_until in self._circuit_open_until.values() if now < open_until)
+
+    async def get_user_stats(self, btc_address: str, deadline: Deadline | None = None) -> dict[str, Any] | None:
+        """Fetch user mining statistics from CKPool with retry, fitted to ``deadline`` if given.
+
+        In automatic mode each attempt goes to the best front-end not yet tried
+        by this call, so a failing region is left after one attempt instead of
+        being retried; the backoff only applies once every region was tried.
+        """
+        self._check_circuit_breaker(btc_address)
 
         last_exception: Exception | None = None
+        tried: list[str] = []
 
         for attempt in range(MAX_RETRIES):
+            if attempt:
+                self.telemetry.record_retry(CKPOOL_ENDPOINT)
+            pool_url = self._route(tried)
+            started = time.monotonic()
             try:
-                session = aiohttp_client.async_get_clientsession(self.hass)
-                url = f"https://{self.pool_url}/users/{btc_address}"
-
-                async with asyncio.timeout(DEFAULT_TIMEOUT):
-                    async with session.get(url) as response:
-                        # 404 means address has no mining history - return empty stats
-                        if response.status == 404:
-                            _LOGGER.debug("No mining history found for %s on CKPool", btc_address)
-                            self._record_success()
-                            return {
-                                "hashrate": 0,
-                                "hashrate_1h": 0,
-                                "hashrate_24h": 0,
-                                "best_share": 0,
-                                "best_ever": 0,
-                                "workers": 0,
-                                "blocks_found": 0,
-                            }
-
-                        if response.status >= 400:
-                            raise CryptoInfoConnectionError(f"HTTP error: {response.status}", response.status)
-
-                        # Check content type
-                        content_type = response.headers.get("Content-Type", "")
-
-                        if "application/json" in content_type:
-                            # Global pool: direct JSON API
-                            data = await response.json()
-                            _LOGGER.debug("Got JSON data from %s: %s", self.pool_url, data)
-                            self._record_success()
-                            return self._parse_ckpool_data(data)
-
-                        if "text/html" in content_type:
-                            # EU pool: Next.js app with embedded JSON
-                            html = await response.text()
-                            _LOGGER.debug("Got HTML response from %s, length: %d", self.pool_url, len(html))
-                            data = self._extract_json_from_html(html)
-                            if data:
-                                self._record_success()
-                                return self._parse_ckpool_data(data)
-                            raise CryptoInfoInvalidResponseError(f"Failed to extract JSON from HTML for {btc_address}")
-
-                        raise CryptoInfoInvalidResponseError(f"Unexpected content type: {content_type}")
+                data = await self._fetch_user_stats(
+                    pool_url, btc_address, _attempt_timeout(deadline, attempt, MAX_RETRIES)
+                )
 
             except CryptoInfoInvalidResponseError as err:
-                # Invalid response: record failure and don't retry
-                _LOGGER.debug("Invalid response: %s", err)
-                self._record_failure()
-                return None
+                # Invalid response: record failure and don't retry this front-end
+                _LOGGER.debug("Invalid response from %s: %s", pool_url, err)
+                self._record_region(pool_url, None)
+                if not self._can_fail_over(tried, pool_url):
+                    self._record_failure(btc_address)
+                    return None
+                last_exception = err
+
+            except CryptoInfoConnectionError as err:
+                # HTTP error status: surfaced as is unless another front-end is left
+                self._record_region(pool_url, None)
+                if not self._can_fail_over(tried, pool_url):
+                    raise
+                last_exception = err
 
             except aiohttp.ClientError as err:
+                self._record_region(pool_url, None)
                 last_exception = CryptoInfoConnectionError(f"Connection error: {err}")
                 _LOGGER.debug("Request failed (attempt %d/%d): %s", attempt + 1, MAX_RETRIES, err)
 
             except TimeoutError:
+                self._record_region(pool_url, None)
                 last_exception = CryptoInfoConnectionError("Request timeout")
                 _LOGGER.debug("Request timeout (attempt %d/%d)", attempt + 1, MAX_RETRIES)
 
-            if attempt < MAX_RETRIES - 1:
-                delay = RETRY_DELAY * (2**attempt)
-                await asyncio.sleep(delay)
+            else:
+                self._record_success(btc_address)
+                self._record_region(pool_url, time.monotonic() - started)
+                return data
 
-        self._record_failure()
+            if pool_url not in tried:
+                tried.append(pool_url)
+            if attempt < MAX_RETRIES - 1:
+                delay = 0.0 if self._can_fail_over(tried) else RETRY_DELAY * (2**attempt)
+                if (fitted := _retry_delay(deadline, delay)) is None:
+                    self.telemetry.record_retry_skipped(CKPOOL_ENDPOINT)
+                    _LOGGER.debug("No time left to retry CKPool before the refresh deadline")
+                    break
+                if fitted:
+                    await asyncio.sleep(fitted)
+
+        self._record_failure(btc_address)
         _LOGGER.error("Error fetching CKPool user stats for %s: %s", btc_address, last_exception)
         return None
 
+    async def _fetch_user_stats(self, pool_url: str, btc_address: str, budget: float) -> dict[str, Any]:
+        """Perform one request to a front-end within ``budget`` seconds and return the normalized statistics."""
+        session = http_session(self.hass, self.provider)
+        url = f"{CKPOOL_URL.format(pool=pool_url)}/users/{btc_address}"
+
+        with self.telemetry.track(CKPOOL_ENDPOINT) as tracked, profile_phase("network"):
+            async with asyncio.timeout(budget):
+                async with session.get(url) as response:
+                    tracked.response = response
+                    # 404 means address has no mining history - return empty stats
+                    if response.status == 404:
+                        _LOGGER.debug("No mining history found for %s on CKPool", btc_address)
+                        return {
+                            "hashrate": 0,
+                            "hashrate_1h": 0,
+                            "hashrate_24h": 0,
+                            "best_share": 0,
+                            "best_ever": 0,
+                            "workers": 0,
+                            "blocks_found": 0,
+                            "worker_stats": {},
+                        }
+
+                    if response.status >= 400:
+                        raise CryptoInfoConnectionError(f"HTTP error: {response.status}", response.status)
+
+                    # Check content type
+                    content_type = response.headers.get("Content-Type", "")
+
+                    if "application/json" in content_type:
+                        # Global pool: direct JSON API
+                        raw = await response.read()
+                        try:
+                            with profile_phase("decode"):
+                                data = await async_parse(
+                                    self.hass, self.telemetry, CKPOOL_ENDPOINT, len(raw), json_loads, raw
+                                )
+                        except ValueError as err:
+                            raise CryptoInfoInvalidResponseError(f"Invalid JSON response: {err}") from err
+                        _LOGGER.debug("Got JSON data from %s: %s", pool_url, data)
+                        with profile_phase("transform"):
+                            return self._parse_ckpool_data(data)
+
+                    if "text/html" in content_type:
+                        # EU pool: Next.js app with embedded JSON
+                        html = await response.text()
+                        _LOGGER.debug("Got HTML response from %s, length: %d", pool_url, len(html))
+                        with profile_phase("decode"):
+                            data = await async_parse(
+                                self.hass,
+                                self.telemetry,
+                                CKPOOL_ENDPOINT,
+                                len(html),
+                                self._extract_json_from_html,
+                                html,
+                            )
+                        if data:
+                            with profile_phase("transform"):
+                                return self._parse_ckpool_data(data)
+                        raise CryptoInfoInvalidResponseError(f"Failed to extract JSON from HTML for {btc_address}")
+
+                    raise CryptoInfoInvalidResponseError(f"Unexpected content type: {content_type}")
+
+    # =========================================================================
+    # REGION SELECTION (automatic mode)
+    # =========================================================================
+
+    def _route(self, tried: list[str]) -> str:
+        """Return the front-end for the next attempt.
+
+        Healthy regions come first, then the lowest latency; a region without a
+        latency sample counts as fastest so both get probed. Every
+        ``CKPOOL_REPROBE_EVERY`` requests the least recently used region is
+        picked instead, keeping the slower region's latency current.
+        """
+        if self.regions is None:
+            return self.pool_url
+        candidates = [region for region in self.regions.values() if region.pool_url not in tried]
+        if not candidates:
+            candidates = list(self.regions.values())
+        self._routed += 1
+        now = time.monotonic()
+        if not tried and self._routed % CKPOOL_REPROBE_EVERY == 0:
+            healthy = [region for region in candidates if region.healthy(now)] or candidates
+            return min(healthy, key=lambda region: region.last_used).pool_url
+        return min(candidates, key=lambda region: region.rank(now)).pool_url
+
+    def _can_fail_over(self, tried: list[str], failed: str | None = None) -> bool:
+        """Return True if automatic mode has a region left to try in this call."""
+        if self.regions is None:
+            return False
+        done = {*tried, failed} if failed else set(tried)
+        return any(pool_url not in done for pool_url in self.regions)
+
+    def _record_region(self, pool_url: str, latency: float | None) -> None:
+        """Record an attempt's outcome for the region; ``latency`` is None on failure."""
+        if self.regions is not None:
+            self.regions[pool_url].observe(latency, time.monotonic())
+
+    def region_state(self) -> dict[str, Any] | None:
+        """Return the per-region health in automatic mode."""
+        if self.regions is None:
+            return None
+        now = time.monotonic()
+        return {pool_url: region.as_dict(now) for pool_url, region in self.regions.items()}
+
     def _extract_json_from_html(self, html: str) -> dict[str, Any] | None:
-        """Extract JSON data from Next.js HTML page."""
-        # EU pool embeds JSON in the HTML within script tags, escaped as JavaScript strings
+        """Extract the user statistics embedded in the EU pool's Next.js page.
+
+        The page carries the user object as escaped JSON in ``self.__next_f.push``
+        scripts; Next.js may split it over several pushes. The markup ahead of the
+        script holding the first ``hashrate1m`` is skipped and a single alternation
+        pattern walks the rest of the page: fields outside ``workers`` belong to the
+        user (first occurrence wins), each ``id`` in the first workers array opens a
+        worker record. Worker records use the global pool's JSON names
+        (``worker``/``workername``).
+        """
+        marker = html.find(_CKPOOL_BLOB_MARKER)
+        if marker < 0:
+            _LOGGER.warning("Failed to extract any mining data from HTML")
+            return None
+        start = max(html.rfind("<script", 0, marker), 0)
+        user: dict[str, Any] = {}
+        workers: list[dict[str, Any]] = []
+        current = user
+        in_workers = workers_done = False
         try:
-            # Extract hashrate fields (always strings in quotes)
-            hashrate1m = re.search(r'\\"hashrate1m\\":\\"(\d+)\\"', html)
-            hashrate1hr = re.search(r'\\"hashrate1hr\\":\\"(\d+)\\"', html)
-            hashrate1d = re.search(r'\\"hashrate1d\\":\\"(\d+)\\"', html)
-
-            # Count workers in the workers array
-            workers_match = re.search(r'\\"workers\\":\[([^\]]+)\]', html)
-            workers_count = 0
-            if workers_match:
-                # Count objects by counting "id" fields
-                worker_ids = re.findall(r'\\"id\\"', workers_match.group(1))
-                workers_count = len(worker_ids)
-
-            # Extract bestShare (JavaScript number, not quoted) and bestEver (quoted string)
-            best_share = re.search(r'\\"bestShare\\":(\d+\.?\d*)', html)
-            best_ever = re.search(r'\\"bestEver\\":\\"(\d+)', html)
-
-            if hashrate1m:
-                data = {
-                    "hashrate1m": int(hashrate1m.group(1)),
-                    "hashrate1hr": int(hashrate1hr.group(1)) if hashrate1hr else 0,
-                    "hashrate1d": int(hashrate1d.group(1)) if hashrate1d else 0,
-                    "workers": workers_count,
-                    "bestshare": float(best_share.group(1)) if best_share else 0,
-                    "bestever": float(best_ever.group(1)) if best_ever else 0,
-                }
-                _LOGGER.debug("Extracted fields from escaped HTML: %s", data)
-                return data
-        except (ValueError, AttributeError) as e:
-            _LOGGER.debug("Field extraction error: %s", e)
-
-        _LOGGER.warning("Failed to extract any mining data from HTML")
-        return None
+            for match in _CKPOOL_FIELD_PATTERN.finditer(html, start):
+                name = match.group("name")
+                if name is None:
+                    # End of an array of objects: later fields belong to the user again.
+                    workers_done = workers_done or in_workers
+                    in_workers = False
+                    current = user
+                elif name == "workers":
+                    in_workers = not workers_done and not match.group(0).endswith("]")
+                    workers_done = workers_done or not in_workers
+                elif in_workers and name == "id":
+                    current = {"workername": match.group("string")}
+                    workers.append(current)
+                elif (key := _CKPOOL_FIELDS.get(name)) is not None and key not in current:
+                    raw = match.group("string") if match.group("string") is not None else match.group("number")
+                    current[key] = float(raw) if key in _CKPOOL_FLOAT_FIELDS else int(raw)
+        except (TypeError, ValueError) as err:
+            _LOGGER.debug("Field extraction error: %s", err)
+            user.pop("hashrate1m", None)
+
+        if "hashrate1m" not in user:
+            _LOGGER.warning("Failed to extract any mining data from HTML")
+            return None
+        data = {
+            "hashrate1m": user["hashrate1m"],
+            "hashrate1hr": user.get("hashrate1hr", 0),
+            "hashrate1d": user.get("hashrate1d", 0),
+            "workers": len(workers),
+            "bestshare": user.get("bestshare", 0),
+            "bestever": user.get("bestever", 0),
+            "worker": workers,
+        }
+        _LOGGER.debug("Extracted fields from escaped HTML: %s", data)
+        return data
 
     def _parse_ckpool_data(self, data: dict[str, Any]) -> dict[str, Any]:
         """Parse CKPool JSON data to extract mining statistics."""
@@ -378,6 +774,20 @@ class CKPoolAPI:
             except (ValueError, IndexError, TypeError):
                 return 0.0
 
+        # Per-worker stats come with the same response (global: "worker", EU: extracted the same way)
+        worker_stats: dict[str, dict[str, Any]] = {}
+        for worker in data.get("worker") or ():
+            if not isinstance(worker, dict) or not (name := worker_name(worker.get("workername"))):
+                continue
+            last_share = worker.get("lastshare")
+            worker_stats[name] = {
+                "hashrate": convert_hashrate(worker.get("hashrate1m", 0)),
+                "hashrate_1h": convert_hashrate(worker.get("hashrate1hr", 0)),
+                "hashrate_24h": convert_hashrate(worker.get("hashrate1d", 0)),
+                "best_share": float(worker.get("bestshare", 0)),
+                "last_share": datetime.fromtimestamp(last_share, UTC) if isinstance(last_share, int | float) else None,
+            }
+
         return {
             "hashrate": convert_hashrate(data.get("hashrate1m", 0)),
             "hashrate_1h": convert_hashrate(data.get("hashrate1hr", 0)),
@@ -386,4 +796,5 @@ class CKPoolAPI:
             "best_ever": float(data.get("bestever", 0)),
             "workers": int(data.get("workers", 0)),
             "blocks_found": 0,  # Not available in JSON
+            "worker_stats": worker_stats,
         }
@@ -0,0 +1,150 @@
+"""Compact, searchable index of the CoinGecko coin list.
+
+``/coins/list`` returns ~15k ``{"id", "symbol", "name"}`` records (about 1 MB
+of JSON). ``parse_coin_list`` decodes the body in one pass with
+``json_codec.json_loads`` (orjson when available) and copies the records into a
+``CoinIndex``, which keeps the data in parallel lists (symbols interned) so the
+decoded dicts can be dropped right away. It is a pure function of the body, so
+the client runs it in the executor when the body is large (see ``offload``).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+import sys
+from typing import Any, overload
+
+from ..exceptions import CryptoInfoInvalidResponseError
+from .json_codec import json_loads
+
+
+class CoinIndex(Sequence[dict[str, str]]):
+    """Read-only sequence of coins stored as parallel arrays.
+
+    Items are materialised as ``{"id", "name", "symbol"}`` dicts on access so the
+    index can be used wherever the raw coin list used to be.
+    """
+
+    __slots__ = ("_haystacks", "_ids", "_names", "_positions", "_symbols")
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._ids: list[str] = []
+        self._names: list[str] = []
+        self._symbols: list[str] = []
+        # Lower-cased "id\nname\nsymbol" per coin: one substring test per coin on search.
+        self._haystacks: list[str] = []
+        self._positions: dict[str, int] = {}
+
+    @classmethod
+    def from_records(cls, records: Iterable[Mapping[str, Any]]) -> CoinIndex:
+        """Build an index from already decoded coin records."""
+        index = cls()
+        for record in records:
+            index.add_record(record)
+        return index
+
+    def add_record(self, record: Mapping[str, Any]) -> None:
+        """Append a decoded coin record, skipping malformed entries."""
+        coin_id = record.get("id")
+        if not isinstance(coin_id, str) or not coin_id:
+            return
+        self.add(coin_id, str(record.get("symbol") or ""), str(record.get("name") or ""))
+
+    def add(self, coin_id: str, symbol: str, name: str) -> None:
+        """Append a coin to the index."""
+        # Symbols repeat a lot across the list (wrapped/bridged tokens), interning dedupes them.
+        symbol = sys.intern(symbol)
+        self._positions.setdefault(coin_id.lower(), len(self._ids))
+        self._ids.append(coin_id)
+        self._names.append(name)
+        self._symbols.append(symbol)
+        self._haystacks.append(f"{coin_id}\n{name}\n{symbol}".lower())
+
+    def __len__(self) -> int:
+        """Return the number of coins."""
+        return len(self._ids)
+
+    @overload
+    def __getitem__(self, index: int) -> dict[str, str]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[dict[str, str]]: ...
+
+    def __getitem__(self, index: int | slice) -> dict[str, str] | list[dict[str, str]]:
+        """Return the coin(s) at the given position as dicts."""
+        if isinstance(index, slice):
+            return [self._record(i) for i in range(*index.indices(len(self._ids)))]
+        if index < 0:
+            index += len(self._ids)
+        if not 0 <= index < len(self._ids):
+            raise IndexError("coin index out of range")
+        return self._record(index)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare equal to any sequence holding the same coin dicts."""
+        if isinstance(other, CoinIndex):
+            return self._ids == other._ids and self._names == other._names and self._symbols == other._symbols
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return len(self) == len(other) and all(mine == theirs for mine, theirs in zip(self, other, strict=True))
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __iter__(self) -> Iterator[dict[str, str]]:
+        """Iterate over the coins as dicts."""
+        return (self._record(i) for i in range(len(self._ids)))
+
+    def _record(self, position: int) -> dict[str, str]:
+        """Materialise the coin at ``position``."""
+        return {"id": self._ids[position], "name": self._names[position], "symbol": self._symbols[position]}
+
+    def has_id(self, coin_id: str) -> bool:
+        """Return True if the (case-insensitive) coin id is known."""
+        return coin_id.lower() in self._positions
+
+    def get(self, coin_id: str) -> dict[str, str] | None:
+        """Return the coin with the given id, if any."""
+        position = self._positions.get(coin_id.lower())
+        return None if position is None else self._record(position)
+
+    def search(self, query: str, limit: int = 10) -> list[dict[str, str]]:
+        """Return up to ``limit`` coins whose id, name or symbol contains ``query``."""
+        query_lower = query.lower()
+        matches: list[dict[str, str]] = []
+        if limit <= 0:
+            return matches
+        for position, haystack in enumerate(self._haystacks):
+            if query_lower in haystack:
+                matches.append(self._record(position))
+                if len(matches) >= limit:
+                    break
+        return matches
+
+
+def parse_coin_list(raw: bytes) -> CoinIndex:
+    """Parse a ``/coins/list`` body into a ``CoinIndex``.
+
+    Non-object entries and records without an id are skipped. Raises
+    ``CryptoInfoInvalidResponseError`` telling a body cut short apart from one
+    that is not valid JSON.
+    """
+    try:
+        records = json_loads(raw)
+    except ValueError as err:
+        if _is_truncated(raw, err):
+            raise CryptoInfoInvalidResponseError(f"Truncated coin list response ({len(raw)} bytes)") from err
+        raise CryptoInfoInvalidResponseError(f"Invalid JSON in coin list: {err}") from err
+    if not isinstance(records, list):
+        raise CryptoInfoInvalidResponseError("Unexpected coin list response from CoinGecko")
+    return CoinIndex.from_records(record for record in records if isinstance(record, dict))
+
+
+def _is_truncated(raw: bytes, err: ValueError) -> bool:
+    """Return True when decoding failed because the body ended early."""
+    # Both decoders report the failing position; the stdlib one points an
+    # unterminated string at its opening quote instead of the end of the body.
+    position = getattr(err, "pos", None)
+    if position is None:
+        return False
+    return position >= len(raw.rstrip()) or str(getattr(err, "msg", "")).startswith("Unterminated string")
@@ -6,19 +6,35 @@ Author: Johnny Visser
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 import logging
 from typing import TYPE_CHECKING, Any
 
 import aiohttp
-from homeassistant.helpers import aiohttp_client
 
-from ..const import API_ENDPOINT
+from ..const import (
+    API_ENDPOINT,
+    API_PLAN_ANALYST,
+    API_PLAN_DEMO,
+    API_PLAN_LITE,
+    API_PLAN_PRO,
+    API_PLAN_PUBLIC,
+    PRO_API_ENDPOINT,
+)
 from ..exceptions import (
     CryptoInfoConnectionError,
     CryptoInfoInvalidResponseError,
     CryptoInfoRateLimitError,
 )
+from ..profiling import profile_phase
+from .coin_index import CoinIndex, parse_coin_list
+from .json_codec import json_loads
+from .offload import async_parse
+from .replay import http_session
+from .sessions import PROVIDER_COINGECKO
+from .telemetry import RequestTelemetry, endpoint_name
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -32,6 +48,61 @@ RATE_LIMIT_CALLS = 10  # CoinGecko free tier: 10-30 calls/min
 RATE_LIMIT_PERIOD = 60  # seconds
 CIRCUIT_BREAKER_THRESHOLD = 5
 CIRCUIT_BREAKER_TIMEOUT = 300  # 5 minutes
+# price_change_percentage windows supported by /coins/markets, in request order.
+PRICE_CHANGE_WINDOWS: tuple[str, ...] = ("1h", "24h", "7d", "14d", "30d", "1y")
+# Ids per request: /coins/markets pages are capped at 250 records, /simple/price
+# has no page size and only URL length bounds it.
+MARKETS_BATCH_SIZE = 250
+SIMPLE_PRICE_BATCH_SIZE = 500
+# Market record fields /simple/price can provide (see _normalize_simple_price).
+SIMPLE_PRICE_FIELDS = frozenset(
+    {
+        "id",
+        "current_price",
+        "market_cap",
+        "total_volume",
+        "price_change_percentage_24h_in_currency",
+        "last_updated",
+    }
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ApiPlan:
+    """Throughput and authentication of a CoinGecko plan."""
+
+    rate_limit_calls: int  # per RATE_LIMIT_PERIOD
+    paid: bool = False  # served from PRO_API_ENDPOINT, key sent as x-cg-pro-api-key
+
+
+API_PLANS: dict[str, ApiPlan] = {
+    API_PLAN_PUBLIC: ApiPlan(RATE_LIMIT_CALLS),
+    API_PLAN_DEMO: ApiPlan(30),
+    API_PLAN_ANALYST: ApiPlan(500, paid=True),
+    API_PLAN_LITE: ApiPlan(500, paid=True),
+    API_PLAN_PRO: ApiPlan(1000, paid=True),
+}
+
+
+def _split_ids(cryptocurrency_ids: str, batch_size: int) -> list[str]:
+    """Split a comma-separated id string into comma-joined batches."""
+    ids = [coin_id.strip() for coin_id in cryptocurrency_ids.split(",") if coin_id.strip()]
+    return [",".join(ids[i : i + batch_size]) for i in range(0, len(ids), batch_size)]
+
+
+def _normalize_simple_price(coin_id: str, prices: dict[str, Any], vs_currency: str) -> dict[str, Any]:
+    """Map a /simple/price entry onto the /coins/markets record shape."""
+    record: dict[str, Any] = {"id": coin_id, "current_price": prices.get(vs_currency)}
+    for source, target in (
+        (f"{vs_currency}_market_cap", "market_cap"),
+        (f"{vs_currency}_24h_vol", "total_volume"),
+        (f"{vs_currency}_24h_change", "price_change_percentage_24h_in_currency"),
+    ):
+        if source in prices:
+            record[target] = prices[source]
+    if isinstance(updated_at := prices.get("last_updated_at"), int | float):
+        record["last_updated"] = datetime.fromtimestamp(updated_at, UTC).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+    return record
 
 
 class CoinGeckoAPI:
@@ -41,22 +112,60 @@ class CoinGeckoAPI:
         "_circuit_open_until",
         "_coin_list_cache",
         "_consecutive_failures",
+        "_queued_requests",
         "_request_timestamps",
+        "api_key",
         "hass",
         "min_request_interval",
+        "plan",
+        "telemetry",
     )
 
+    provider = PROVIDER_COINGECKO
+
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the API helper."""
         self.hass = hass
-        self._coin_list_cache: list[dict[str, Any]] | None = None
+        self._coin_list_cache: CoinIndex | None = None
         # Rate limiting
         self._request_timestamps: list[datetime] = []
+        # Requests currently sleeping in the limiter
+        self._queued_requests = 0
         # Minimum delay (seconds) between consecutive requests (0 = sliding window only)
         self.min_request_interval: float = 0.0
+        # Plan and its key (none on the public API)
+        self.plan = API_PLAN_PUBLIC
+        self.api_key: str | None = None
         # Circuit breaker
         self._consecutive_failures = 0
         self._circuit_open_until: datetime | None = None
+        self.telemetry = RequestTelemetry()
+
+    # =========================================================================
+    # PLAN
+    # =========================================================================
+
+    def configure(self, api_key: str | None, plan: str) -> None:
+        """Use ``api_key`` with the throughput of ``plan`` (public API without a key)."""
+        self.api_key = api_key or None
+        self.plan = plan if self.api_key and plan in API_PLANS else API_PLAN_PUBLIC
+
+    @property
+    def rate_limit_calls(self) -> int:
+        """Return the requests allowed per sliding window by the plan."""
+        return API_PLANS[self.plan].rate_limit_calls
+
+    @property
+    def base_url(self) -> str:
+        """Return the API root of the plan."""
+        return PRO_API_ENDPOINT if API_PLANS[self.plan].paid else API_ENDPOINT
+
+    def _auth_headers(self) -> dict[str, str] | None:
+        """Return the header carrying the API key, None on the public API."""
+        if self.api_key is None:
+            return None
+        header = "x-cg-pro-api-key" if API_PLANS[self.plan].paid else "x-cg-demo-api-key"
+        return {header: self.api_key}
 
     # =========================================================================
     # RATE LIMITING
@@ -76,20 +185,82 @@ class CoinGeckoAPI:
             wait = self.min_request_interval - elapsed
             if wait > 0:
                 _LOGGER.debug("Min-interval throttle, waiting %.1f seconds", wait)
-                await asyncio.sleep(wait)
+                await self._queue_wait(wait)
                 now = datetime.now(UTC)
 
         # Sliding-window rate limit
-        if len(self._request_timestamps) >= RATE_LIMIT_CALLS:
+        if len(self._request_timestamps) >= self.rate_limit_calls:
             oldest = self._request_timestamps[0]
             wait_time = (oldest + timedelta(seconds=RATE_LIMIT_PERIOD) - now).total_seconds()
             if wait_time > 0:
                 _LOGGER.warning("Rate limited, waiting %.1f seconds", wait_time)
-                await asyncio.sleep(wait_time)
+                await self._queue_wait(wait_time)
                 now = datetime.now(UTC)
 
         self._request_timestamps.append(now)
 
+    async def _queue_wait(self, seconds: float) -> None:
+        """Sleep in the limiter, counted as a queued request."""
+        self._queued_requests += 1
+        try:
+            with profile_phase("rate_limit_wait"):
+                await asyncio.sleep(seconds)
+        finally:
+            self._queued_requests -= 1
+
+    def _window(self, now: datetime) -> list[datetime]:
+        """Return the request timestamps inside the sliding window ending at ``now``."""
+        cutoff = now - timedelta(seconds=RATE_LIMIT_PERIOD)
+        return [ts for ts in self._request_timestamps if ts > cutoff]
+
+    def calls_in_window(self) -> int:
+        """Return the number of requests made in the current sliding window."""
+        return len(self._window(datetime.now(UTC)))
+
+    def rate_budget_remaining(self) -> int:
+        """Return how many requests the sliding window still allows right now."""
+        return max(0, self.rate_limit_calls - self.calls_in_window())
+
+    @property
+    def queued_requests(self) -> int:
+        """Return the number of requests waiting in the limiter."""
+        return self._queued_requests
+
+    @property
+    def circuit_open(self) -> bool:
+        """Return True while the circuit breaker rejects requests."""
+        return self._circuit_open_until is not None and datetime.now(UTC) < self._circuit_open_until
+
+    def next_request_allowed(self) -> datetime:
+        """Return when the next request may be sent without waiting.
+
+        Accounts for the minimum interval, the sliding window and an open
+        circuit breaker; returns now when nothing holds requests back.
+        """
+        now = datetime.now(UTC)
+        window = self._window(now)
+        candidates = [now]
+        if self.min_request_interval > 0 and window:
+            candidates.append(window[-1] + timedelta(seconds=self.min_request_interval))
+        if len(window) >= self.rate_limit_calls:
+            candidates.append(window[-self.rate_limit_calls] + timedelta(seconds=RATE_LIMIT_PERIOD))
+        if self.circuit_open and self._circuit_open_until is not None:
+            candidates.append(self._circuit_open_until)
+        return max(candidates)
+
+    def limiter_state(self) -> dict[str, Any]:
+        """Return a JSON-serialisable snapshot of the limiter and circuit breaker."""
+        return {
+            "plan": self.plan,
+            "rate_limit_calls": self.rate_limit_calls,
+            "calls_in_window": self.calls_in_window(),
+            "rate_budget_remaining": self.rate_budget_remaining(),
+            "queued_requests": self._queued_requests,
+            "circuit_open": self.circuit_open,
+            "consecutive_failures": self._consecutive_failures,
+            "next_request_allowed": self.next_request_allowed().isoformat(),
+        }
+
     # =========================================================================
     # CIRCUIT BREAKER
     # =========================================================================
@@ -124,21 +295,33 @@ class CoinGeckoAPI:
         url: str,
         *,
         retry: bool = True,
+        parser: Callable[[bytes], Any] = json_loads,
     ) -> Any:
-        """Make API request with retry, rate limiting, and circuit breaker."""
+        """Make API request with retry, rate limiting, and circuit breaker.
+
+        ``parser`` replaces the default JSON decoding of the body, e.g. to build
+        a compact index from large payloads. It must be a pure function of the
+        body: large bodies are parsed in the executor.
+        """
         self._check_circuit_breaker()
         await self._check_rate_limit()
 
         last_exception: Exception | None = None
         retries = MAX_RETRIES if retry else 1
+        endpoint = endpoint_name(url, self.base_url)
+        headers = self._auth_headers()
 
         for attempt in range(retries):
+            if attempt:
+                self.telemetry.record_retry(endpoint)
             try:
-                session = aiohttp_client.async_get_clientsession(self.hass)
+                session = http_session(self.hass, self.provider)
 
-                async with asyncio.timeout(DEFAULT_TIMEOUT):
-                    async with session.get(url) as response:
-                        return await self._handle_response(response)
+                with self.telemetry.track(endpoint) as tracked, profile_phase("network"):
+                    async with asyncio.timeout(DEFAULT_TIMEOUT):
+                        async with session.get(url, headers=headers) as response:
+                            tracked.response = response
+                            return await self._handle_response(response, endpoint, parser)
 
             except CryptoInfoRateLimitError as err:
                 # Rate limit: wait for retry_after and retry
@@ -183,8 +366,13 @@ class CoinGeckoAPI:
         self._record_failure()
         raise last_exception or CryptoInfoConnectionError("Request failed")
 
-    async def _handle_response(self, response: aiohttp.ClientResponse) -> Any:
-        """Handle API response."""
+    async def _handle_response(
+        self,
+        response: aiohttp.ClientResponse,
+        endpoint: str,
+        parser: Callable[[bytes], Any] = json_loads,
+    ) -> Any:
+        """Handle API response; large bodies are decoded in the executor."""
         if response.status == 429:
             retry_after = int(response.headers.get("Retry-After", 60))
             raise CryptoInfoRateLimitError("Rate limit exceeded", retry_after=retry_after)
@@ -196,9 +384,14 @@ class CoinGeckoAPI:
             raise CryptoInfoConnectionError(f"Client error: {response.status}", response.status)
 
         try:
-            data = await response.json()
+            # Decode from raw bytes: skips aiohttp's str round-trip and uses orjson when available.
+            raw = await response.read()
+            with profile_phase("decode"):
+                data = await async_parse(self.hass, self.telemetry, endpoint, len(raw), parser, raw)
             self._record_success()
             return data
+        except CryptoInfoInvalidResponseError:
+            raise
         except Exception as err:
             raise CryptoInfoInvalidResponseError(f"Invalid JSON response: {err}") from err
 
@@ -206,35 +399,99 @@ class CoinGeckoAPI:
     # API METHODS
     # =========================================================================
 
-    async def get_coin_list(self) -> list[dict[str, Any]]:
-        """Fetch the list of all available cryptocurrencies from CoinGecko."""
+    async def get_coin_list(self) -> CoinIndex:
+        """Fetch the list of all available cryptocurrencies from CoinGecko.
+
+        The body is decoded into a compact ``CoinIndex``, in the executor when
+        large; the decoded records are not kept.
+        """
         if self._coin_list_cache:
             return self._coin_list_cache
 
         try:
-            url = f"{API_ENDPOINT}coins/list"
-            self._coin_list_cache = await self._request(url)
-            return self._coin_list_cache or []
+            url = f"{self.base_url}coins/list"
+            self._coin_list_cache = await self._request(url, parser=parse_coin_list)
+            return self._coin_list_cache or CoinIndex()
         except Exception as err:
             _LOGGER.error("Error fetching coin list from CoinGecko: %s", err)
-            return []
+            return CoinIndex()
 
-    async def get_coins_markets(self, cryptocurrency_ids: str, vs_currency: str) -> list[dict[str, Any]]:
+    async def get_coins_markets(
+        self,
+        cryptocurrency_ids: str,
+        vs_currency: str,
+        price_change_windows: Iterable[str] | None = None,
+    ) -> list[dict[str, Any]]:
         """Fetch market data for the given cryptocurrencies.
 
+        ``price_change_windows`` limits the requested change percentages (all
+        windows when None, none when empty) to keep the payload small.
+
         Uses the shared resilience layer (retry, rate limiting, circuit breaker).
         Raises CryptoInfoError subclasses on failure so callers can convert to UpdateFailed.
         """
-        url = (
-            f"{API_ENDPOINT}coins/markets"
-            f"?ids={cryptocurrency_ids}"
-            f"&vs_currency={vs_currency}"
-            f"&price_change_percentage=1h,24h,7d,14d,30d,1y"
+        if price_change_windows is None:
+            windows = PRICE_CHANGE_WINDOWS
+        else:
+            wanted = set(price_change_windows)
+            windows = tuple(window for window in PRICE_CHANGE_WINDOWS if window in wanted)
+        records: list[dict[str, Any]] = []
+        for batch in _split_ids(cryptocurrency_ids, MARKETS_BATCH_SIZE):
+            url = (
+                f"{self.base_url}coins/markets?ids={batch}&vs_currency={vs_currency}"
+                f"&per_page={MARKETS_BATCH_SIZE}&sparkline=false"
+            )
+            if windows:
+                url += f"&price_change_percentage={','.join(windows)}"
+            data = await self._request(url)
+            if not isinstance(data, list):
+                raise CryptoInfoInvalidResponseError("Unexpected markets response from CoinGecko")
+            records.extend(data)
+        return records
+
+    async def get_simple_price(
+        self,
+        cryptocurrency_ids: str,
+        vs_currency: str,
+        *,
+        include_market_cap: bool = False,
+        include_24h_vol: bool = False,
+        include_24h_change: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Fetch prices from the lightweight /simple/price endpoint.
+
+        Records are normalized to the /coins/markets shape, restricted to the
+        fields in SIMPLE_PRICE_FIELDS. Identity fields (name, symbol, image) are
+        not available from this endpoint.
+        """
+        vs_currency = vs_currency.lower()
+        flags = (
+            f"&include_market_cap={str(include_market_cap).lower()}"
+            f"&include_24hr_vol={str(include_24h_vol).lower()}"
+            f"&include_24hr_change={str(include_24h_change).lower()}"
+            "&include_last_updated_at=true"
         )
-        data = await self._request(url)
-        if not isinstance(data, list):
-            raise CryptoInfoInvalidResponseError("Unexpected markets response from CoinGecko")
-        return data
+        records: list[dict[str, Any]] = []
+        for batch in _split_ids(cryptocurrency_ids, SIMPLE_PRICE_BATCH_SIZE):
+            data = await self._request(f"{self.base_url}simple/price?ids={batch}&vs_currencies={vs_currency}{flags}")
+            if not isinstance(data, dict):
+                raise CryptoInfoInvalidResponseError("Unexpected simple price response from CoinGecko")
+            records.extend(
+                _normalize_simple_price(coin_id, prices, vs_currency)
+                for coin_id, prices in data.items()
+                if isinstance(prices, dict) and vs_currency in prices
+            )
+        return records
+
+    async def async_validate_api_key(self) -> bool:
+        """Return whether CoinGecko accepts the configured key (one ``/ping``)."""
+        try:
+            await self._request(f"{self.base_url}ping", retry=False)
+        except CryptoInfoConnectionError as err:
+            if err.status_code in (400, 401, 403):
+                return False
+            raise
+        return True
 
     async def validate_cryptocurrency_ids(self, crypto_ids: list[str]) -> dict[str, bool]:
         """Validate if cryptocurrency IDs exist in CoinGecko.
@@ -246,8 +503,7 @@ class CoinGeckoAPI:
             # If we can't fetch the list, assume all IDs are valid (fallback)
             return dict.fromkeys(crypto_ids, True)
 
-        valid_ids = {coin["id"].lower() for coin in coin_list}
-        return {crypto_id: crypto_id.lower() in valid_ids for crypto_id in crypto_ids}
+        return {crypto_id: coin_list.has_id(crypto_id) for crypto_id in crypto_ids}
 
     async def search_cryptocurrencies(self, query: str, limit: int = 10) -> list[dict[str, Any]]:
         """Search for cryptocurrencies by name or symbol.
@@ -258,16 +514,7 @@ class CoinGeckoAPI:
         if not coin_list:
             return []
 
-        query_lower = query.lower()
-        matches = [
-            coin
-            for coin in coin_list
-            if query_lower in coin["id"].lower()
-            or query_lower in coin["name"].lower()
-            or query_lower in coin["symbol"].lower()
-        ]
-
-        return matches[:limit]
+        return coin_list.search(query, limit)
 
     async def get_top_cryptocurrencies(self, limit: int = 10) -> list[dict[str, Any]]:
         """Fetch top cryptocurrencies by market cap from CoinGecko.
@@ -275,7 +522,7 @@ class CoinGeckoAPI:
         Returns a list of top coins sorted by market cap rank.
         """
         try:
-            url = f"{API_ENDPOINT}coins/markets?vs_currency=usd&order=market_cap_desc&per_page={limit}&page=1&sparkline=false"
+            url = f"{self.base_url}coins/markets?vs_currency=usd&order=market_cap_desc&per_page={limit}&page=1&sparkline=false"
             data = await self._request(url)
             # Return simplified format matching coin_list
             return [{"id": coin["id"], "name": coin["name"], "symbol": coin["symbol"]} for coin in data]
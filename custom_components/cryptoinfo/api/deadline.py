@@ -0,0 +1,51 @@
+"""Time budget shared by the attempts of one refresh.
+
+The mining coordinators bound each refresh with ``asyncio.timeout``. Without a
+budget the clients' retry loops size every attempt to the full per-request
+timeout and back off regardless of the time left, so a retry is typically cut
+by the coordinator mid-flight. A coordinator now hands its client a
+``Deadline``: an attempt gets the time left minus what the retries after it
+need (``MIN_ATTEMPT_TIMEOUT`` each plus their backoff), capped at the client's
+own timeout, so a slow first answer is not cut to an even share of the budget.
+The backoff is shortened, or the retry skipped, when the next attempt could not
+get that floor before the deadline.
+"""
+
+from __future__ import annotations
+
+import time
+
+# Shortest attempt worth starting (seconds).
+MIN_ATTEMPT_TIMEOUT = 2.0
+# Kept between the client's deadline and the coordinator's timeout for parsing.
+DEADLINE_MARGIN = 1.0
+
+
+class Deadline:
+    """Absolute end of a refresh, on the monotonic clock."""
+
+    __slots__ = ("expires",)
+
+    def __init__(self, budget: float) -> None:
+        """Initialize a deadline ``budget`` seconds from now."""
+        self.expires = time.monotonic() + budget
+
+    def remaining(self) -> float:
+        """Return the seconds left, never negative."""
+        return max(0.0, self.expires - time.monotonic())
+
+    def attempt_timeout(self, attempts_left: int, cap: float, backoff: float = 0.0) -> float:
+        """Return the timeout of the next attempt, ``attempts_left`` included.
+
+        ``backoff`` is the total wait before the retries after this attempt.
+        """
+        remaining = self.remaining()
+        reserved = (max(attempts_left, 1) - 1) * MIN_ATTEMPT_TIMEOUT + backoff
+        return min(cap, remaining, max(remaining - reserved, MIN_ATTEMPT_TIMEOUT))
+
+    def retry_delay(self, backoff: float) -> float | None:
+        """Return the backoff before a retry, shortened to fit; None when no retry fits."""
+        spare = self.remaining() - MIN_ATTEMPT_TIMEOUT
+        if spare < 0:
+            return None
+        return min(backoff, spare)
@@ -0,0 +1,32 @@
+"""JSON decoding for API payloads.
+
+orjson is preferred when importable (Home Assistant ships it): it decodes
+straight from the raw response bytes and is several times faster than the
+stdlib decoder on large payloads such as ``/coins/list`` or big markets pages.
+The stdlib decoder is kept as a fallback so the integration never depends on it.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import json
+from typing import Any
+
+
+def json_loads_stdlib(raw: bytes | str) -> Any:
+    """Decode JSON with the standard library decoder."""
+    return json.loads(raw)
+
+
+# Both orjson.JSONDecodeError and json.JSONDecodeError subclass ValueError,
+# so callers only need to catch ValueError whichever decoder is active.
+json_loads: Callable[[bytes | str], Any]
+
+try:
+    import orjson
+
+    json_loads = orjson.loads
+    FAST_JSON_AVAILABLE = True
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    json_loads = json_loads_stdlib
+    FAST_JSON_AVAILABLE = False
@@ -0,0 +1,38 @@
+"""Size-aware offloading of payload parsing to the executor.
+
+Decoding a multi-megabyte markets page or scanning a full CKPool Next.js page
+holds the event loop for milliseconds. Payloads of at least ``OFFLOAD_THRESHOLD``
+bytes are therefore parsed in Home Assistant's thread pool; smaller ones stay
+inline, where the executor hand-off would cost more than the parse itself. The
+parser must be a pure function of its argument. Each parse is counted per
+endpoint in the client's telemetry (``parsed_inline`` / ``parsed_offloaded``).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .telemetry import RequestTelemetry
+
+# Payload size (bytes) from which parsing moves to the executor.
+OFFLOAD_THRESHOLD = 128 * 1024
+
+
+async def async_parse[T, R](
+    hass: HomeAssistant,
+    telemetry: RequestTelemetry,
+    endpoint: str,
+    size: int,
+    parser: Callable[[T], R],
+    payload: T,
+) -> R:
+    """Return ``parser(payload)``, run in the executor when ``size`` reaches the threshold."""
+    if size >= OFFLOAD_THRESHOLD:
+        telemetry.record_parse(endpoint, offloaded=True)
+        return await hass.async_add_executor_job(parser, payload)
+    telemetry.record_parse(endpoint, offloaded=False)
+    return parser(payload)
@@ -0,0 +1,338 @@
+"""Record-and-replay HTTP layer for reproducible benchmark and soak runs.
+
+Off by default. With ``CRYPTOINFO_HTTP_MODE=record`` every response received by
+the API clients is appended to the cassette ``CRYPTOINFO_HTTP_CASSETTE`` (one
+JSON object per line: URL, status, the headers the clients read, when the
+request was sent, its latency and the body). With ``CRYPTOINFO_HTTP_MODE=replay``
+no request leaves the process: each URL is answered from the cassette in
+recorded order, cycling once exhausted, and each response is delivered at its
+recorded time since the start of the run, scaled by
+``CRYPTOINFO_HTTP_REPLAY_SPEED`` (1 keeps the original timing, 10 is ten times
+faster, 0 answers immediately). A URL that was never recorded fails like a
+connection error. The cassette defaults to ``cryptoinfo_cassette.jsonl``; it
+and relative paths resolve in the Home Assistant configuration directory.
+
+The clients get their session from ``http_session()``, which returns the
+provider's dedicated session (see ``sessions``) unless a mode is set, so the
+layer costs nothing in normal use. The variables are read when the recording or
+replaying session is created.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+import json
+import logging
+import os
+from pathlib import Path
+import threading
+import time
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, cast
+
+import aiohttp
+from multidict import CIMultiDict, CIMultiDictProxy
+
+from ..const import DOMAIN
+from .sessions import provider_session
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+ENV_HTTP_MODE = "CRYPTOINFO_HTTP_MODE"
+ENV_HTTP_CASSETTE = "CRYPTOINFO_HTTP_CASSETTE"
+ENV_HTTP_REPLAY_SPEED = "CRYPTOINFO_HTTP_REPLAY_SPEED"
+DEFAULT_CASSETTE = "cryptoinfo_cassette.jsonl"
+
+MODE_RECORD = "record"
+MODE_REPLAY = "replay"
+CASSETTE_VERSION = 1
+
+# Only the headers the API clients read are recorded.
+RECORDED_HEADERS = ("Content-Type", "Retry-After")
+# Chunk size of the replayed body stream (``iter_chunked`` callers pass their own).
+REPLAY_CHUNK_SIZE = 65536
+
+_DATA_KEY = f"{DOMAIN}_http_cassette"
+
+
+class Interaction:
+    """One recorded request and its response."""
+
+    __slots__ = ("body", "elapsed", "headers", "offset", "status", "url")
+
+    def __init__(
+        self,
+        url: str,
+        status: int,
+        headers: dict[str, str],
+        body: bytes,
+        elapsed: float,
+        offset: float = 0.0,
+    ) -> None:
+        """Initialize the interaction."""
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.elapsed = elapsed
+        self.offset = offset
+
+    def to_json(self) -> str:
+        """Return the cassette line of the interaction."""
+        try:
+            body, encoding = self.body.decode(), "utf-8"
+        except UnicodeDecodeError:
+            body, encoding = base64.b64encode(self.body).decode(), "base64"
+        return json.dumps(
+            {
+                "url": self.url,
+                "status": self.status,
+                "headers": self.headers,
+                "elapsed": round(self.elapsed, 4),
+                "offset": round(self.offset, 4),
+                "encoding": encoding,
+                "body": body,
+            },
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_json(cls, line: str) -> Interaction:
+        """Build an interaction from a cassette line."""
+        item = json.loads(line)
+        body = item["body"].encode() if item["encoding"] == "utf-8" else base64.b64decode(item["body"])
+        return cls(item["url"], item["status"], item["headers"], body, item["elapsed"], item["offset"])
+
+
+class ReplayContent:
+    """The part of ``aiohttp.StreamReader`` the clients and telemetry use."""
+
+    __slots__ = ("_body", "total_bytes")
+
+    def __init__(self, body: bytes) -> None:
+        """Initialize the body stream."""
+        self._body = body
+        self.total_bytes = len(body)
+
+    async def iter_chunked(self, n: int = REPLAY_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """Yield the body in chunks of ``n`` bytes."""
+        for start in range(0, len(self._body), n):
+            yield self._body[start : start + n]
+
+
+class ReplayResponse:
+    """A fully buffered response standing in for ``aiohttp.ClientResponse``."""
+
+    __slots__ = ("_body", "content", "headers", "status", "url")
+
+    def __init__(self, interaction: Interaction) -> None:
+        """Initialize the response from an interaction."""
+        self.url = interaction.url
+        self.status = interaction.status
+        self.headers = CIMultiDictProxy(CIMultiDict(interaction.headers))
+        self._body = interaction.body
+        self.content = ReplayContent(interaction.body)
+
+    async def read(self) -> bytes:
+        """Return the body."""
+        return self._body
+
+    async def text(self, encoding: str = "utf-8") -> str:
+        """Return the decoded body."""
+        return self._body.decode(encoding, errors="replace")
+
+    async def __aenter__(self) -> ReplayResponse:
+        """Return the response itself."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Nothing to release: the body is in memory."""
+
+
+class _Request:
+    """Awaitable context manager returned by the sessions' ``get``."""
+
+    __slots__ = ("_coro", "_response")
+
+    def __init__(self, coro: Any) -> None:
+        self._coro = coro
+        self._response: ReplayResponse | None = None
+
+    async def __aenter__(self) -> ReplayResponse:
+        self._response = await self._coro
+        return self._response
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        return None
+
+
+class RecordingSession:
+    """Append the responses received through the provider sessions to the cassette."""
+
+    mode = MODE_RECORD
+
+    def __init__(self, hass: HomeAssistant, path: Path) -> None:
+        """Initialize the recorder; the cassette is truncated on the first response."""
+        self._hass = hass
+        self._path = path
+        self._write_lock = threading.Lock()
+        self._opened = False
+        self._started = time.monotonic()
+        self.recorded = 0
+
+    def through(self, session: aiohttp.ClientSession) -> RecordingView:
+        """Return a recorder sending its requests through ``session``."""
+        return RecordingView(self, session)
+
+    async def record(self, session: aiohttp.ClientSession, url: str, **kwargs: Any) -> ReplayResponse:
+        """Perform a GET request through ``session`` and record its response."""
+        started = time.monotonic()
+        async with session.get(url, **kwargs) as response:
+            body = await response.read()
+            headers = {name: response.headers[name] for name in RECORDED_HEADERS if name in response.headers}
+            status = response.status
+        interaction = Interaction(url, status, headers, body, time.monotonic() - started, started - self._started)
+        await self._hass.async_add_executor_job(self._append, interaction.to_json())
+        self.recorded += 1
+        return ReplayResponse(interaction)
+
+    def _append(self, line: str) -> None:
+        """Append one line to the cassette (executor)."""
+        with self._write_lock:
+            if not self._opened:
+                header = {"cassette": CASSETTE_VERSION, "recorded": datetime.now(UTC).isoformat()}
+                self._path.write_text(json.dumps(header) + "\n", encoding="utf-8")
+                self._opened = True
+            with self._path.open("a", encoding="utf-8") as cassette:
+                cassette.write(line + "\n")
+
+
+class RecordingView:
+    """A provider's session recording into the shared cassette."""
+
+    __slots__ = ("_recorder", "_session")
+
+    def __init__(self, recorder: RecordingSession, session: aiohttp.ClientSession) -> None:
+        """Initialize the view."""
+        self._recorder = recorder
+        self._session = session
+
+    def get(self, url: str, **kwargs: Any) -> _Request:
+        """Perform a GET request and record it."""
+        return _Request(self._recorder.record(self._session, url, **kwargs))
+
+
+class ReplaySession:
+    """Answer requests from a cassette, without network access."""
+
+    mode = MODE_REPLAY
+
+    def __init__(self, hass: HomeAssistant, path: Path, speed: float = 1.0) -> None:
+        """Initialize the player; the cassette is loaded on the first request."""
+        self._hass = hass
+        self._path = path
+        self._speed = speed
+        self._interactions: dict[str, list[Interaction]] | None = None
+        # Responses served per URL, to cycle through its recordings
+        self._served: dict[str, int] = {}
+        # Recorded length of the run, the period of the cycled schedule
+        self._duration = 0.0
+        self._started: float | None = None
+        self._load_lock = asyncio.Lock()
+        self.replayed = 0
+        self.misses = 0
+
+    def get(self, url: str, **kwargs: Any) -> _Request:
+        """Return the next recorded response for ``url``."""
+        return _Request(self._replay(url))
+
+    async def _replay(self, url: str) -> ReplayResponse:
+        interactions = await self._load()
+        if self._started is None:
+            self._started = time.monotonic()
+        recordings = interactions.get(url)
+        if not recordings:
+            self.misses += 1
+            raise aiohttp.ClientConnectionError(f"No recorded response for {url}")
+        served = self._served.get(url, 0)
+        self._served[url] = served + 1
+        interaction = recordings[served % len(recordings)]
+        if self._speed > 0:
+            # Deliver at the recorded time of the response (one run later per pass over the URL).
+            due = served // len(recordings) * self._duration + interaction.offset + interaction.elapsed
+            if (delay := self._started + due / self._speed - time.monotonic()) > 0:
+                await asyncio.sleep(delay)
+        self.replayed += 1
+        return ReplayResponse(interaction)
+
+    async def _load(self) -> dict[str, list[Interaction]]:
+        if self._interactions is None:
+            async with self._load_lock:
+                if self._interactions is None:
+                    interactions = await self._hass.async_add_executor_job(load_cassette, self._path)
+                    self._duration = max(
+                        (item.offset + item.elapsed for recordings in interactions.values() for item in recordings),
+                        default=0.0,
+                    )
+                    self._interactions = interactions
+                    _LOGGER.info(
+                        "Replaying %d recorded responses for %d URLs from %s",
+                        sum(len(recordings) for recordings in self._interactions.values()),
+                        len(self._interactions),
+                        self._path,
+                    )
+        return self._interactions
+
+
+def load_cassette(path: Path) -> dict[str, list[Interaction]]:
+    """Read a cassette, grouping interactions by URL in recorded order."""
+    interactions: dict[str, list[Interaction]] = {}
+    with path.open(encoding="utf-8") as cassette:
+        header = json.loads(next(cassette, "{}"))
+        if header.get("cassette") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette format in {path}")
+        for line in cassette:
+            if line.strip():
+                interaction = Interaction.from_json(line)
+                interactions.setdefault(interaction.url, []).append(interaction)
+    return interactions
+
+
+def http_session(hass: HomeAssistant, provider: str | None = None) -> aiohttp.ClientSession:
+    """Return the session the API clients send requests through.
+
+    ``provider``'s dedicated session (Home Assistant's shared one when it is not
+    open), or a recording / replaying wrapper when ``CRYPTOINFO_HTTP_MODE`` is
+    set. The wrappers only implement ``get``.
+    """
+    mode = os.environ.get(ENV_HTTP_MODE, "").lower()
+    if mode not in (MODE_RECORD, MODE_REPLAY):
+        return provider_session(hass, provider)
+    session: RecordingSession | ReplaySession | None = hass.data.get(_DATA_KEY)
+    if session is None or session.mode != mode:
+        path = Path(hass.config.path(os.environ.get(ENV_HTTP_CASSETTE) or DEFAULT_CASSETTE))
+        if mode == MODE_RECORD:
+            session = RecordingSession(hass, path)
+        else:
+            session = ReplaySession(hass, path, float(os.environ.get(ENV_HTTP_REPLAY_SPEED) or 1))
+        hass.data[_DATA_KEY] = session
+        _LOGGER.warning("HTTP %s mode active, cassette %s", mode, path)
+    if isinstance(session, RecordingSession):
+        return cast(aiohttp.ClientSession, session.through(provider_session(hass, provider)))
+    return cast(aiohttp.ClientSession, session)
@@ -0,0 +1,201 @@
+"""Dedicated HTTP session per provider.
+
+Home Assistant's shared session sits on one connector for every integration,
+with its own per-host limit, keep-alive and DNS settings. Each provider the
+integration talks to (CoinGecko, mempool, CKPool) gets its own session instead,
+tuned for its traffic: its own connector with connections per host, a DNS
+cache and a longer keep-alive so the next poll reuses the socket, and
+compressed responses (``Accept-Encoding``; ``br`` only when a Brotli decoder is
+installed). The connector uses Home Assistant's client SSL context.
+
+A session is created when the first entry using the provider sets up and closed
+when the last one unloads (or when Home Assistant stops). Until then the clients
+fall back to the shared session, as in the config flow. Each session counts its
+requests and the connections it opened and reused, exported in diagnostics.
+"""
+
+from __future__ import annotations
+
+from importlib.util import find_spec
+import logging
+import platform
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+from homeassistant import const as ha_const
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.helpers import aiohttp_client
+from homeassistant.helpers.json import json_dumps
+from homeassistant.util import ssl as ssl_util
+
+from ..const import (
+    DOMAIN,
+    SENSOR_TYPE_BTC_MEMPOOL,
+    SENSOR_TYPE_BTC_NETWORK,
+    SENSOR_TYPE_CKPOOL_MINING,
+    SENSOR_TYPE_PRICE,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine
+
+    from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+PROVIDER_COINGECKO = "coingecko"
+PROVIDER_MEMPOOL = "mempool"
+PROVIDER_CKPOOL = "ckpool"
+
+SENSOR_TYPE_PROVIDERS = {
+    SENSOR_TYPE_PRICE: PROVIDER_COINGECKO,
+    SENSOR_TYPE_BTC_NETWORK: PROVIDER_MEMPOOL,
+    SENSOR_TYPE_BTC_MEMPOOL: PROVIDER_MEMPOOL,
+    SENSOR_TYPE_CKPOOL_MINING: PROVIDER_CKPOOL,
+}
+
+# Connections per host: CoinGecko is rate limited and CKPool polls are fanned
+# out at most 4 at a time; mempool requests are doubled on hedged mirrors.
+LIMIT_PER_HOST = {
+    PROVIDER_COINGECKO: 2,
+    PROVIDER_MEMPOOL: 6,
+    PROVIDER_CKPOOL: 4,
+}
+CONNECTION_LIMIT = 20
+# Seconds a resolved host is cached.
+DNS_CACHE_TTL = 300
+# Seconds an idle connection is kept for the next poll (aiohttp default: 15).
+KEEPALIVE_TIMEOUT = 120
+
+# aiohttp decodes br responses only when one of these Brotli packages is installed.
+ACCEPT_ENCODING = "gzip, deflate, br" if find_spec("brotli") or find_spec("brotlicffi") else "gzip, deflate"
+# Identify as Home Assistant, like its shared session does.
+USER_AGENT = f"HomeAssistant/{ha_const.__version__} aiohttp/{aiohttp.__version__} Python/{platform.python_version()}"
+
+_DATA_KEY = f"{DOMAIN}_http_sessions"
+
+
+class ProviderSession:
+    """A provider's session, its users and its connection counters."""
+
+    __slots__ = (
+        "_unsub_close",
+        "connections_created",
+        "connections_reused",
+        "provider",
+        "refs",
+        "requests",
+        "session",
+    )
+
+    def __init__(self, hass: HomeAssistant, provider: str) -> None:
+        """Initialize and open the session; it is closed at the latest when Home Assistant stops."""
+        self.provider = provider
+        self.refs = 0
+        self.requests = 0
+        self.connections_created = 0
+        self.connections_reused = 0
+        self.session = create_session(hass, provider, self._trace_config())
+        self._unsub_close: CALLBACK_TYPE | None = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_CLOSE, self._async_close_on_stop
+        )
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        trace = aiohttp.TraceConfig()
+        # aiohttp's signal annotations do not accept plain callbacks.
+        trace.on_request_start.append(self._on_request_start)  # type: ignore[arg-type]
+        trace.on_connection_create_end.append(self._on_connection_create_end)  # type: ignore[arg-type]
+        trace.on_connection_reuseconn.append(self._on_connection_reuseconn)  # type: ignore[arg-type]
+        return trace
+
+    async def _on_request_start(self, _session: aiohttp.ClientSession, _ctx: SimpleNamespace, _params: Any) -> None:
+        self.requests += 1
+
+    async def _on_connection_create_end(
+        self, _session: aiohttp.ClientSession, _ctx: SimpleNamespace, _params: Any
+    ) -> None:
+        self.connections_created += 1
+
+    async def _on_connection_reuseconn(
+        self, _session: aiohttp.ClientSession, _ctx: SimpleNamespace, _params: Any
+    ) -> None:
+        self.connections_reused += 1
+
+    async def _async_close_on_stop(self, _event: Event) -> None:
+        self._unsub_close = None
+        await self.session.close()
+
+    async def async_close(self) -> None:
+        """Close the session."""
+        if self._unsub_close is not None:
+            self._unsub_close()
+            self._unsub_close = None
+        await self.session.close()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable snapshot."""
+        connections = self.connections_created + self.connections_reused
+        return {
+            "provider": self.provider,
+            "entries": self.refs,
+            "requests": self.requests,
+            "connections_created": self.connections_created,
+            "connections_reused": self.connections_reused,
+            "reuse_ratio": round(self.connections_reused / connections, 3) if connections else None,
+            "limit_per_host": LIMIT_PER_HOST[self.provider],
+            "accept_encoding": ACCEPT_ENCODING,
+        }
+
+
+def create_session(hass: HomeAssistant, provider: str, trace: aiohttp.TraceConfig) -> aiohttp.ClientSession:
+    """Create the tuned session of ``provider``; closing it closes its connector."""
+    connector = aiohttp.TCPConnector(
+        limit=CONNECTION_LIMIT,
+        limit_per_host=LIMIT_PER_HOST[provider],
+        ttl_dns_cache=DNS_CACHE_TTL,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+        ssl=ssl_util.client_context(),
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        headers={
+            aiohttp.hdrs.USER_AGENT: USER_AGENT,
+            aiohttp.hdrs.ACCEPT_ENCODING: ACCEPT_ENCODING,
+        },
+        json_serialize=json_dumps,
+        trace_configs=[trace],
+    )
+
+
+def async_acquire_session(hass: HomeAssistant, provider: str) -> Callable[[], Coroutine[Any, Any, None]]:
+    """Open (or share) ``provider``'s session; return the coroutine function releasing it."""
+    sessions: dict[str, ProviderSession] = hass.data.setdefault(_DATA_KEY, {})
+    if (shared := sessions.get(provider)) is None:
+        shared = sessions[provider] = ProviderSession(hass, provider)
+        _LOGGER.debug("Opened dedicated HTTP session for %s", provider)
+    shared.refs += 1
+
+    async def _release() -> None:
+        shared.refs -= 1
+        if shared.refs or sessions.get(provider) is not shared:
+            return
+        del sessions[provider]
+        await shared.async_close()
+        _LOGGER.debug("Closed dedicated HTTP session for %s", provider)
+
+    return _release
+
+
+def provider_session(hass: HomeAssistant, provider: str | None) -> aiohttp.ClientSession:
+    """Return ``provider``'s session, or Home Assistant's shared one when none is open."""
+    shared: ProviderSession | None = hass.data.get(_DATA_KEY, {}).get(provider) if provider is not None else None
+    if shared is not None:
+        return shared.session
+    return aiohttp_client.async_get_clientsession(hass)
+
+
+def session_state(hass: HomeAssistant, provider: str) -> dict[str, Any] | None:
+    """Return the snapshot of ``provider``'s session, None when it is not open."""
+    shared: ProviderSession | None = hass.data.get(_DATA_KEY, {}).get(provider)
+    return shared.as_dict() if shared is not None else None
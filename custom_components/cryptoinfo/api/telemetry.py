@@ -0,0 +1,231 @@
+"""Per-endpoint request telemetry for the API clients.
+
+Every API client owns a ``RequestTelemetry`` and wraps each HTTP attempt in
+``telemetry.track(endpoint)``. The tracker records the attempt latency in a
+fixed-bucket histogram, the response status (429 and 5xx are tallied apart),
+the bytes received and whether the attempt failed. It also counts retries
+skipped for lack of time (see ``deadline``), requests hedged on a mirror, and
+payload parses run inline or in the executor (see ``offload``).
+
+Counters are plain ints updated on the event loop, so recording costs a handful
+of attribute writes. Diagnostics and the optional diagnostic sensors read
+``as_dict()`` snapshots.
+
+Endpoint names are route templates (``coins/markets``, ``ckpool/users``), never
+raw URLs, so snapshots carry neither query strings nor Bitcoin addresses.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+import time
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+    import aiohttp
+
+# Upper bounds (seconds) of the latency histogram buckets; one overflow bucket follows.
+LATENCY_BUCKETS: tuple[float, ...] = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def endpoint_name(url: str, base_url: str) -> str:
+    """Return the route of ``url`` relative to ``base_url``, without query string."""
+    path = urlsplit(url).path
+    base_path = urlsplit(base_url).path
+    return path.removeprefix(base_path).strip("/") or "/"
+
+
+class EndpointStats:
+    """Counters and latency histogram for one endpoint."""
+
+    __slots__ = (
+        "bytes_received",
+        "errors",
+        "hedge_wins",
+        "hedged",
+        "latency_buckets",
+        "latency_max",
+        "latency_sum",
+        "parsed_inline",
+        "parsed_offloaded",
+        "rate_limited",
+        "requests",
+        "retries",
+        "retries_skipped",
+        "server_errors",
+    )
+
+    def __init__(self) -> None:
+        """Initialize empty counters."""
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.retries_skipped = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.rate_limited = 0
+        self.server_errors = 0
+        self.bytes_received = 0
+        self.parsed_inline = 0
+        self.parsed_offloaded = 0
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def observe(self, latency: float, status: int | None, size: int, *, failed: bool) -> None:
+        """Record one finished attempt."""
+        self.requests += 1
+        self.bytes_received += size
+        self.latency_sum += latency
+        self.latency_max = max(self.latency_max, latency)
+        self.latency_buckets[bisect_left(LATENCY_BUCKETS, latency)] += 1
+        if status == 429:
+            self.rate_limited += 1
+        elif status is not None and status >= 500:
+            self.server_errors += 1
+        if failed:
+            self.errors += 1
+
+    def latency_quantile(self, quantile: float) -> float | None:
+        """Return the upper bound (seconds) of the bucket holding ``quantile``.
+
+        None when nothing was recorded; the observed maximum for the overflow bucket.
+        """
+        if not self.requests:
+            return None
+        rank = quantile * self.requests
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.latency_buckets, strict=False):
+            seen += count
+            if seen >= rank:
+                return bound
+        return self.latency_max
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable snapshot."""
+        histogram = {
+            f"le_{bound:g}s": count for bound, count in zip(LATENCY_BUCKETS, self.latency_buckets, strict=False)
+        }
+        histogram["inf"] = self.latency_buckets[-1]
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "retries_skipped": self.retries_skipped,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "rate_limited": self.rate_limited,
+            "server_errors": self.server_errors,
+            "bytes_received": self.bytes_received,
+            "parsed_inline": self.parsed_inline,
+            "parsed_offloaded": self.parsed_offloaded,
+            "latency_mean_ms": round(self.latency_sum / self.requests * 1000, 1) if self.requests else None,
+            "latency_max_ms": round(self.latency_max * 1000, 1),
+            "latency_p90_ms": None if (p90 := self.latency_quantile(0.9)) is None else round(p90 * 1000, 1),
+            "latency_histogram": histogram,
+        }
+
+
+class RequestAttempt:
+    """Context manager timing one HTTP attempt; set ``response`` once received."""
+
+    __slots__ = ("_endpoint", "_started", "_telemetry", "response")
+
+    def __init__(self, telemetry: RequestTelemetry, endpoint: str) -> None:
+        """Initialize the attempt."""
+        self._telemetry = telemetry
+        self._endpoint = endpoint
+        self._started = 0.0
+        self.response: aiohttp.ClientResponse | None = None
+
+    def __enter__(self) -> RequestAttempt:
+        """Start the clock."""
+        self._started = time.monotonic()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Record the attempt; an exception leaving the block counts as a failure."""
+        latency = time.monotonic() - self._started
+        response = self.response
+        status = response.status if response is not None else None
+        size = response.content.total_bytes if response is not None else 0
+        self._telemetry.endpoint(self._endpoint).observe(latency, status, size, failed=exc_type is not None)
+
+
+class RequestTelemetry:
+    """Request statistics of one API client, keyed by endpoint."""
+
+    __slots__ = ("_endpoints",)
+
+    def __init__(self) -> None:
+        """Initialize empty telemetry."""
+        self._endpoints: dict[str, EndpointStats] = {}
+
+    def endpoint(self, name: str) -> EndpointStats:
+        """Return (creating if needed) the stats of an endpoint."""
+        stats = self._endpoints.get(name)
+        if stats is None:
+            stats = self._endpoints[name] = EndpointStats()
+        return stats
+
+    def track(self, endpoint: str) -> RequestAttempt:
+        """Return a context manager recording one attempt against ``endpoint``."""
+        return RequestAttempt(self, endpoint)
+
+    def record_retry(self, endpoint: str) -> None:
+        """Count a retry of a request to ``endpoint``."""
+        self.endpoint(endpoint).retries += 1
+
+    def record_retry_skipped(self, endpoint: str) -> None:
+        """Count a retry of ``endpoint`` given up because the refresh deadline was too close."""
+        self.endpoint(endpoint).retries_skipped += 1
+
+    def record_hedge(self, endpoint: str, *, won: bool = False) -> None:
+        """Count a hedged request to ``endpoint``, or (``won``) a hedge that answered first."""
+        stats = self.endpoint(endpoint)
+        if won:
+            stats.hedge_wins += 1
+        else:
+            stats.hedged += 1
+
+    def record_parse(self, endpoint: str, *, offloaded: bool) -> None:
+        """Count a payload of ``endpoint`` parsed inline or in the executor."""
+        stats = self.endpoint(endpoint)
+        if offloaded:
+            stats.parsed_offloaded += 1
+        else:
+            stats.parsed_inline += 1
+
+    @property
+    def requests(self) -> int:
+        """Return the number of attempts across endpoints."""
+        return sum(stats.requests for stats in self._endpoints.values())
+
+    @property
+    def errors(self) -> int:
+        """Return the number of failed attempts across endpoints."""
+        return sum(stats.errors for stats in self._endpoints.values())
+
+    @property
+    def rate_limited(self) -> int:
+        """Return the number of 429 responses across endpoints."""
+        return sum(stats.rate_limited for stats in self._endpoints.values())
+
+    @property
+    def latency_mean_ms(self) -> float | None:
+        """Return the mean attempt latency across endpoints, in milliseconds."""
+        requests = self.requests
+        if not requests:
+            return None
+        return round(sum(stats.latency_sum for stats in self._endpoints.values()) / requests * 1000, 1)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable snapshot of every endpoint."""
+        return {name: stats.as_dict() for name, stats in sorted(self._endpoints.items())}
@@ -0,0 +1,171 @@
+"""Per-region polling of CKPool addresses.
+
+Every CKPool entry keeps its own ``CKPoolCoordinator`` (and so its entities),
+but the entries of one pool region share a ``CKPoolRegionGroup``: one
+``CKPoolAPI`` (telemetry and front-end routing for the region, a circuit
+breaker per address) and one poll timer. Each poll fans out over the
+registered addresses with at most ``CKPOOL_MAX_CONCURRENCY`` requests in
+flight; each address's result is pushed to its coordinators as soon as it
+arrives, and a failing or slow address only marks its own coordinators failed.
+Addresses tracked by several entries are fetched once per poll.
+
+The group polls at the shortest update interval of its members. It is created
+by the first coordinator of a region and dropped when the last one unloads.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from .api.blockchain_api import CKPoolAPI
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .mining_sensor import CKPoolCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Requests in flight per region during a poll.
+CKPOOL_MAX_CONCURRENCY = 4
+
+_DATA_KEY = f"{DOMAIN}_ckpool_groups"
+
+
+class CKPoolRegionGroup:
+    """Shared client and bounded-concurrency poller for one CKPool region."""
+
+    __slots__ = (
+        "_hass",
+        "_members",
+        "_polling",
+        "_unsub_timer",
+        "api",
+        "last_poll_duration",
+        "polls",
+        "pool_region",
+        "semaphore",
+        "update_interval",
+    )
+
+    def __init__(self, hass: HomeAssistant, pool_region: str) -> None:
+        """Initialize the group."""
+        self._hass = hass
+        self.pool_region = pool_region
+        self.api = CKPoolAPI(hass, pool_region)
+        self.semaphore = asyncio.Semaphore(CKPOOL_MAX_CONCURRENCY)
+        self.update_interval: timedelta | None = None
+        self.polls = 0
+        self.last_poll_duration: float | None = None
+        self._members: list[CKPoolCoordinator] = []
+        self._polling = False
+        self._unsub_timer: CALLBACK_TYPE | None = None
+
+    @property
+    def addresses(self) -> dict[str, list[CKPoolCoordinator]]:
+        """Return the registered coordinators by address."""
+        by_address: dict[str, list[CKPoolCoordinator]] = {}
+        for member in self._members:
+            by_address.setdefault(member.btc_address, []).append(member)
+        return by_address
+
+    @callback
+    def async_register(self, member: CKPoolCoordinator) -> CALLBACK_TYPE:
+        """Poll ``member``'s address with the group; return the unregister callback."""
+        self._members.append(member)
+        self.async_schedule()
+
+        @callback
+        def _unregister() -> None:
+            self._members.remove(member)
+            if self._members:
+                self.async_schedule()
+                return
+            self._cancel_timer()
+            if self._hass.data.get(_DATA_KEY, {}).get(self.pool_region) is self:
+                del self._hass.data[_DATA_KEY][self.pool_region]
+
+        return _unregister
+
+    @callback
+    def async_schedule(self) -> None:
+        """(Re)start the poll timer at the shortest interval of the members."""
+        interval = min(member.poll_interval for member in self._members)
+        if interval == self.update_interval and self._unsub_timer is not None:
+            return
+        self._cancel_timer()
+        self.update_interval = interval
+        self._unsub_timer = async_track_time_interval(
+            self._hass,
+            self._async_poll_tick,
+            interval,
+            name=f"{DOMAIN} ckpool {self.pool_region} poll",
+            cancel_on_shutdown=True,
+        )
+
+    def _cancel_timer(self) -> None:
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+    async def _async_poll_tick(self, _now: Any) -> None:
+        await self.async_poll()
+
+    async def async_poll(self) -> None:
+        """Refresh every registered address; a poll still running is not overlapped."""
+        if self._polling or not self._members:
+            return
+        self._polling = True
+        started = time.monotonic()
+        try:
+            await asyncio.gather(
+                *(self._async_poll_address(members) for members in self.addresses.values()),
+            )
+        finally:
+            self._polling = False
+            self.polls += 1
+            self.last_poll_duration = time.monotonic() - started
+
+    async def _async_poll_address(self, members: list[CKPoolCoordinator]) -> None:
+        """Fetch one address and push the result to its coordinators."""
+        try:
+            async with self.semaphore:
+                data = await members[0].async_fetch()
+        except UpdateFailed as err:
+            for member in members:
+                member.async_set_update_error(err)
+            return
+        for member in members:
+            member.async_set_updated_data(data)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable snapshot (addresses are not included)."""
+        return {
+            "pool_region": self.pool_region,
+            "addresses": len(self.addresses),
+            "entries": len(self._members),
+            "max_concurrency": CKPOOL_MAX_CONCURRENCY,
+            "update_interval": str(self.update_interval),
+            "polls": self.polls,
+            "last_poll_duration": round(self.last_poll_duration, 3) if self.last_poll_duration is not None else None,
+            "open_circuits": self.api.open_circuits(),
+            "regions": self.api.region_state(),
+        }
+
+
+def ckpool_group(hass: HomeAssistant, pool_region: str) -> CKPoolRegionGroup:
+    """Return the group of ``pool_region``, creating it on first use."""
+    groups: dict[str, CKPoolRegionGroup] = hass.data.setdefault(_DATA_KEY, {})
+    if (group := groups.get(pool_region)) is None:
+        group = groups[pool_region] = CKPoolRegionGroup(hass, pool_region)
+        _LOGGER.debug("Created CKPool polling group for %s", pool_region)
+    return group
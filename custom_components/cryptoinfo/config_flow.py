@@ -14,15 +14,19 @@ from homeassistant import config_entries
 from homeassistant.helpers import config_validation as cv, entity_registry as er
 import voluptuous as vol
 
+from .api.coin_index import CoinIndex
 from .api.coingecko_api import CoinGeckoAPI
 from .api.crypto_info_data import CryptoInfoData
 from .const import (
+    CKPOOL_REGION_AUTO,
     CKPOOL_REGION_EU,
     CKPOOL_REGION_GLOBAL,
     CONF_BTC_ADDRESS,
     CONF_CKPOOL_REGION,
     CONF_CRYPTOCURRENCY_IDS,
     CONF_CURRENCY_NAME,
+    CONF_ENTITY_METRICS,
+    CONF_ENTITY_PROFILE,
     CONF_ID,
     CONF_MIN_TIME_BETWEEN_REQUESTS,
     CONF_MULTIPLIERS,
@@ -30,13 +34,16 @@ from .const import (
     CONF_UNIT_OF_MEASUREMENT,
     CONF_UPDATE_FREQUENCY,
     DOMAIN,
+    ENTITY_PROFILE_STANDARD,
     SENSOR_TYPE_BTC_MEMPOOL,
     SENSOR_TYPE_BTC_NETWORK,
     SENSOR_TYPE_CKPOOL_MINING,
     SENSOR_TYPE_PRICE,
 )
 from .helpers import build_price_unique_id
-from .options_flow import CryptoInfoOptionsFlow
+from .options_flow import ENTITY_PROFILE_OPTIONS, PRICE_METRIC_OPTIONS, CryptoInfoOptionsFlow
+from .request_budget import budget_summary
+from .sensor_descriptions import PRICE_DESCRIPTIONS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -50,7 +57,7 @@ class CryptoInfoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def __init__(self) -> None:
         """Initialize the config flow."""
         super().__init__()
-        self._coin_list: list[dict[str, Any]] = []
+        self._coin_list = CoinIndex()
         self._selected_cryptos: list[str] = []
         self._config_data: dict[str, Any] = {}
 
@@ -202,6 +209,7 @@ class CryptoInfoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         {
                             CKPOOL_REGION_EU: "🇪🇺 EU Pool (eusolostats.ckpool.org)",
                             CKPOOL_REGION_GLOBAL: "🌍 Global Pool (solo.ckpool.org)",
+                            CKPOOL_REGION_AUTO: "⚡ Automatic (fastest available pool)",
                         }
                     ),
                     vol.Required(
@@ -251,21 +259,16 @@ class CryptoInfoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if search_query:
             # Search mode: show search results + ALWAYS include existing cryptos
-            search_results = [
-                coin
-                for coin in self._coin_list
-                if search_query in coin["id"].lower()
-                or search_query in coin["name"].lower()
-                or search_query in coin["symbol"].lower()
-            ][:100]
+            search_results = self._coin_list.search(search_query, limit=100)
 
             # Merge search results with existing cryptos (avoid duplicates)
             seen = {coin["id"] for coin in search_results}
             filtered_coins = search_results.copy()
 
             # Add existing cryptos that aren't in search results
-            for coin in self._coin_list:
-                if coin["id"] in existing_ids and coin["id"] not in seen:
+            for existing_id in existing_ids:
+                coin = self._coin_list.get(existing_id)
+                if coin is not None and coin["id"] not in seen:
                     filtered_coins.append(coin)
                     seen.add(coin["id"])
         else:
@@ -278,8 +281,9 @@ class CryptoInfoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             filtered_coins = top_coins.copy()
 
             # Add existing cryptos that aren't in top 10
-            for coin in self._coin_list:
-                if coin["id"] in existing_ids and coin["id"] not in seen:
+            for existing_id in existing_ids:
+                coin = self._coin_list.get(existing_id)
+                if coin is not None and coin["id"] not in seen:
                     filtered_coins.append(coin)
                     seen.add(coin["id"])
 
@@ -342,41 +346,29 @@ class CryptoInfoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     CONF_UPDATE_FREQUENCY: user_input[CONF_UPDATE_FREQUENCY],
                     CONF_MIN_TIME_BETWEEN_REQUESTS: user_input[CONF_MIN_TIME_BETWEEN_REQUESTS],
                 }
+                # Keep the entity profile chosen when the entry was created (options override it)
+                for key in (CONF_ENTITY_PROFILE, CONF_ENTITY_METRICS):
+                    if key in entry.data:
+                        final_config[key] = entry.data[key]
 
-                # Capture the previously configured cryptos BEFORE updating the entry so
-                # that entities for cryptos dropped from the selection can be removed.
+                # Remove the entities of cryptos dropped from the selection BEFORE updating the
+                # entry, while their unique ids can still be built from the current data.
                 old_crypto_ids = [c.strip() for c in entry.data.get(CONF_CRYPTOCURRENCY_IDS, "").split(",")]
+                removed_cryptos = [c for c in old_crypto_ids if c and c not in self._selected_cryptos]
+                if removed_cryptos:
+                    self._async_remove_crypto_entities(entry, removed_cryptos)
 
                 # Update shared data
                 self.hass.data[DOMAIN].min_time_between_requests = final_config[CONF_MIN_TIME_BETWEEN_REQUESTS]
 
-                # Update entry data
+                # Update entry data; a loaded entry applies it from its update listener,
+                # adding only the sensors of the added cryptos (or reloading when needed).
                 self.hass.config_entries.async_update_entry(
                     entry,
                     data=final_config,
                 )
-
-                # Remove orphaned entities (cryptos that were removed from selection)
-                entity_reg = er.async_get(self.hass)
-
-                removed_cryptos = [c for c in old_crypto_ids if c not in self._selected_cryptos]
-
-                if removed_cryptos:
-                    _LOGGER.debug("Removing entities for removed cryptos: %s", removed_cryptos)
-                    for crypto_id in removed_cryptos:
-                        # Build unique_id for this crypto
-                        unique_id = build_price_unique_id(
-                            final_config[CONF_ID], crypto_id, final_config[CONF_CURRENCY_NAME]
-                        )
-                        # Find entity by unique_id
-                        for entity_id, entity_entry in entity_reg.entities.items():
-                            if entity_entry.unique_id == unique_id:
-                                entity_reg.async_remove(entity_id)
-                                _LOGGER.debug("Removed entity %s with unique_id %s", entity_id, unique_id)
-                                break
-
-                # Reload the entry
-                await self.hass.config_entries.async_reload(entry.entry_id)
+                if entry.state is not config_entries.ConfigEntryState.LOADED:
+                    await self.hass.config_entries.async_reload(entry.entry_id)
 
                 return self.async_abort(reason="reconfigure_successful")
 
@@ -430,10 +422,29 @@ class CryptoInfoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors=errors,
             description_placeholders={
                 "selected_cryptos": crypto_names,
+                "budget": budget_summary(self.hass),
                 **count_context,
             },
         )
 
+    def _async_remove_crypto_entities(self, entry: config_entries.ConfigEntry, crypto_ids: list[str]) -> None:
+        """Remove the price and metric entities of ``crypto_ids`` from the entity registry."""
+        _LOGGER.debug("Removing entities for removed cryptos: %s", crypto_ids)
+        entity_reg = er.async_get(self.hass)
+        for crypto_id in crypto_ids:
+            # Same normalisation as the sensor platform
+            base_unique_id = build_price_unique_id(
+                (entry.data.get(CONF_ID) or "").strip(), crypto_id, entry.data.get(CONF_CURRENCY_NAME, "").strip()
+            )
+            unique_ids = [
+                base_unique_id,
+                *(f"{base_unique_id}_{description.key}" for description in PRICE_DESCRIPTIONS),
+            ]
+            for unique_id in unique_ids:
+                if entity_id := entity_reg.async_get_entity_id("sensor", DOMAIN, unique_id):
+                    entity_reg.async_remove(entity_id)
+                    _LOGGER.debug("Removed entity %s with unique_id %s", entity_id, unique_id)
+
     async def async_step_user(self, user_input: dict[str, Any] | None = None) -> config_entries.ConfigFlowResult:
         """Handle a flow initialized by the user - Step 1: Choose sensor type."""
         if user_input is not None:
@@ -525,13 +536,7 @@ class CryptoInfoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if search_query:
             # Search mode: show search results
-            filtered_coins = [
-                coin
-                for coin in self._coin_list
-                if search_query in coin["id"].lower()
-                or search_query in coin["name"].lower()
-                or search_query in coin["symbol"].lower()
-            ][:100]  # Limit to 100 results
+            filtered_coins = self._coin_list.search(search_query, limit=100)
         else:
             # Default mode: show top 10 by market cap
             api = CoinGeckoAPI(self.hass)
@@ -590,6 +595,8 @@ class CryptoInfoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     CONF_UNIT_OF_MEASUREMENT: user_input.get(CONF_UNIT_OF_MEASUREMENT, ""),
                     CONF_UPDATE_FREQUENCY: user_input[CONF_UPDATE_FREQUENCY],
                     CONF_MIN_TIME_BETWEEN_REQUESTS: user_input[CONF_MIN_TIME_BETWEEN_REQUESTS],
+                    CONF_ENTITY_PROFILE: user_input.get(CONF_ENTITY_PROFILE, ENTITY_PROFILE_STANDARD),
+                    CONF_ENTITY_METRICS: list(user_input.get(CONF_ENTITY_METRICS, [])),
                 }
 
                 # Build a stable unique id (fall back to cryptos+currency when no id is given)
@@ -639,6 +646,14 @@ class CryptoInfoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     CONF_MIN_TIME_BETWEEN_REQUESTS,
                     default=default_min_time,
                 ): cv.positive_float,
+                vol.Required(
+                    CONF_ENTITY_PROFILE,
+                    default=ENTITY_PROFILE_STANDARD,
+                ): vol.In(ENTITY_PROFILE_OPTIONS),
+                vol.Optional(
+                    CONF_ENTITY_METRICS,
+                    default=[],
+                ): cv.multi_select(PRICE_METRIC_OPTIONS),
             }
         )
 
@@ -648,6 +663,7 @@ class CryptoInfoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors=errors,
             description_placeholders={
                 "selected_cryptos": crypto_names,
+                "budget": budget_summary(self.hass),
                 **count_context,
             },
         )
@@ -730,6 +746,7 @@ class CryptoInfoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         {
                             CKPOOL_REGION_EU: "🇪🇺 EU Pool (eusolostats.ckpool.org)",
                             CKPOOL_REGION_GLOBAL: "🌍 Global Pool (solo.ckpool.org)",
+                            CKPOOL_REGION_AUTO: "⚡ Automatic (fastest available pool)",
                         }
                     ),
                     vol.Required(CONF_UPDATE_FREQUENCY, default=5): cv.positive_float,
@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Final, TypeAlias
+from typing import TYPE_CHECKING, Any, Final, TypeAlias
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
+    from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
     from .api.crypto_info_data import CryptoInfoData
     from .coordinator import CryptoDataCoordinator
+    from .sensor import PriceWatchlist
 
 DOMAIN: Final = "cryptoinfo"
 
@@ -23,7 +25,11 @@ class CryptoInfoRuntimeData:
 
     shared_data: CryptoInfoData
     coordinator: CryptoDataCoordinator | None = None
-    coordinators: dict[str, CryptoDataCoordinator] = field(default_factory=dict)
+    coordinators: dict[str, DataUpdateCoordinator[dict[str, Any]]] = field(default_factory=dict)
+    # Entry data and options the running coordinators were set up with
+    config: dict[str, Any] = field(default_factory=dict)
+    # Coin sensors of a price entry, diffed when the coin list is reconfigured
+    watchlist: PriceWatchlist | None = None
 
 
 # Price sensor configuration
@@ -34,15 +40,40 @@ CONF_MULTIPLIERS = "multipliers"
 CONF_UPDATE_FREQUENCY = "update_frequency"
 CONF_UNIT_OF_MEASUREMENT = "unit_of_measurement"
 CONF_MIN_TIME_BETWEEN_REQUESTS = "min_time_between_requests"
+CONF_PROFILING = "profiling"
+CONF_LOOP_WATCHDOG = "loop_watchdog"
+# CoinGecko API key (Demo or paid plan) and the plan it belongs to (price sensors)
+CONF_API_KEY = "api_key"
+CONF_API_PLAN = "api_plan"
+# Metric entities created per coin: a preset, or the metric keys of a custom list
+CONF_ENTITY_PROFILE = "entity_profile"
+CONF_ENTITY_METRICS = "entity_metrics"
+
+# CoinGecko plans
+API_PLAN_PUBLIC = "public"
+API_PLAN_DEMO = "demo"
+API_PLAN_ANALYST = "analyst"
+API_PLAN_LITE = "lite"
+API_PLAN_PRO = "pro"
+
+# Entity profiles (entries created before profiles existed keep every metric)
+ENTITY_PROFILE_MINIMAL = "minimal"
+ENTITY_PROFILE_STANDARD = "standard"
+ENTITY_PROFILE_FULL = "full"
+ENTITY_PROFILE_CUSTOM = "custom"
 
 # Mining sensor configuration
 CONF_SENSOR_TYPE = "sensor_type"
 CONF_BTC_ADDRESS = "btc_address"
 CONF_CKPOOL_REGION = "ckpool_region"
+# Ordered, comma-separated mempool API base URLs (network / mempool sensors)
+CONF_MEMPOOL_MIRRORS = "mempool_mirrors"
 
 # CKPool regions
 CKPOOL_REGION_GLOBAL = "solo.ckpool.org"
 CKPOOL_REGION_EU = "eusolostats.ckpool.org"
+# Route each refresh to the fastest healthy front-end
+CKPOOL_REGION_AUTO = "auto"
 
 # Sensor types
 SENSOR_TYPE_PRICE = "price"
@@ -77,3 +108,5 @@ ATTR_RANK = "rank"
 ATTR_IMAGE = "image"
 
 API_ENDPOINT = "https://api.coingecko.com/api/v3/"
+# Paid plans (Analyst, Lite, Pro) are served from a separate host.
+PRO_API_ENDPOINT = "https://pro-api.coingecko.com/api/v3/"
@@ -5,10 +5,18 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any
 
+from homeassistant.core import callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
+from .api.coingecko_api import MARKETS_BATCH_SIZE, SIMPLE_PRICE_BATCH_SIZE, SIMPLE_PRICE_FIELDS
 from .const import DOMAIN
 from .exceptions import CryptoInfoError, CryptoInfoRateLimitError
+from .helpers import price_change_windows, records_by_id
+from .profiling import RefreshProfiler, profile_phase
+from .sensor_descriptions import PRICE_DESCRIPTIONS, PRICE_RECORD_FIELDS
+from .watchdog import LoopWatchdog
 
 if TYPE_CHECKING:
     from datetime import timedelta
@@ -16,9 +24,21 @@ if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
     from .api.coingecko_api import CoinGeckoAPI
+    from .const import CryptoInfoConfigEntry
+    from .request_budget import RequestBudget
 
 _LOGGER = logging.getLogger(__name__)
 
+# Entity translation_key -> record fields read by that entity.
+_FIELDS_BY_TRANSLATION_KEY: dict[str, tuple[str, ...]] = {
+    description.translation_key: description.source_fields
+    for description in PRICE_DESCRIPTIONS
+    if description.translation_key
+}
+
+# Identity fields /simple/price cannot provide; carried over from the last markets record.
+_IDENTITY_FIELDS: tuple[str, ...] = ("symbol", "name", "image")
+
 
 class CryptoDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator for cryptocurrency price data from CoinGecko.
@@ -36,26 +56,178 @@ class CryptoDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         currency_name: str,
         update_frequency: timedelta,
         id_name: str,
+        config_entry: CryptoInfoConfigEntry | None = None,
+        profiling: bool = False,
+        loop_watchdog: bool = False,
     ) -> None:
         """Initialize the coordinator."""
         super().__init__(
             hass,
             _LOGGER,
+            config_entry=config_entry,
             name=f"{DOMAIN}_{id_name or 'default'}",
             update_interval=update_frequency,
         )
         self.api = api
+        # Interval asked for by the entry; update_interval is the one planned by the budget.
+        self.requested_interval = update_frequency
+        self.budget: RequestBudget | None = None
         self.cryptocurrency_ids = cryptocurrency_ids
         self.currency_name = currency_name
         self.id_name = id_name
+        # True when the last refresh was served by the /simple/price fast path.
+        self.simple_price_active = False
+        # Coins whose record changed in the last refresh; None means every coin.
+        self.changed_ids: frozenset[str] | None = None
+        self.profiler = RefreshProfiler(profiling)
+        self.watchdog = LoopWatchdog(self.name, loop_watchdog)
+
+    @callback
+    def async_set_update_interval(self, interval: timedelta) -> None:
+        """Poll at ``interval`` after the next refresh, as planned by the request budget."""
+        self.requested_interval = interval
+        if self.budget is not None:
+            self.budget.async_plan()
+        else:
+            self.update_interval = interval
+
+    @callback
+    def async_set_cryptocurrency_ids(self, cryptocurrency_ids: str) -> None:
+        """Track ``cryptocurrency_ids`` from now on, fetching at once when coins were added."""
+        previous = self.coin_ids()
+        self.cryptocurrency_ids = cryptocurrency_ids
+        coin_ids = self.coin_ids()
+        if self.data:
+            # Dropped coins are not fetched anymore; do not keep their last record.
+            self.data = {coin_id: record for coin_id, record in self.data.items() if coin_id in coin_ids}
+        if self.budget is not None:
+            # The pages per refresh may have changed.
+            self.budget.async_plan()
+        if coin_ids - previous and self.config_entry is not None:
+            self.config_entry.async_create_background_task(
+                self.hass, self.async_request_refresh(), f"{self.name} watchlist refresh"
+            )
+
+    def coin_ids(self) -> frozenset[str]:
+        """Return the ids of the tracked coins."""
+        return frozenset(coin_id.strip() for coin_id in self.cryptocurrency_ids.split(",") if coin_id.strip())
+
+    def requests_per_refresh(self) -> int:
+        """Return the CoinGecko requests of one refresh (one per page of the endpoint last used)."""
+        count = sum(1 for coin_id in self.cryptocurrency_ids.split(",") if coin_id.strip())
+        batch_size = SIMPLE_PRICE_BATCH_SIZE if self.simple_price_active else MARKETS_BATCH_SIZE
+        return max(1, -(-count // batch_size))
+
+    def required_fields(self) -> frozenset[str] | None:
+        """Return the record fields read by the entry's enabled entities.
+
+        Derived entities disabled in the entity registry do not contribute their
+        fields. Returns None (no projection) when the entities are not known yet.
+        """
+        if self.config_entry is None:
+            return None
+        registry_entries = er.async_entries_for_config_entry(er.async_get(self.hass), self.config_entry.entry_id)
+        if not registry_entries:
+            return None
+        fields = set(PRICE_RECORD_FIELDS)
+        for registry_entry in registry_entries:
+            if registry_entry.disabled_by is None and registry_entry.translation_key:
+                fields.update(_FIELDS_BY_TRANSLATION_KEY.get(registry_entry.translation_key, ()))
+        return frozenset(fields)
+
+    def _can_use_simple_price(self, fields: frozenset[str] | None) -> bool:
+        """Return True when /simple/price can serve every field in use.
+
+        That is the case when no enabled entity needs more than price, market
+        cap, 24h volume/change, and every coin's identity fields are already
+        known from a previous /coins/markets refresh.
+        """
+        if fields is None or not self.data or not fields <= SIMPLE_PRICE_FIELDS.union(_IDENTITY_FIELDS):
+            return False
+        coin_ids = (coin_id.strip() for coin_id in self.cryptocurrency_ids.split(","))
+        return all(coin_id in self.data for coin_id in coin_ids if coin_id)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update listeners, timed as the fan-out phase when profiling."""
+        with self.profiler.fan_out(), self.watchdog.watch("fan_out"):
+            super().async_update_listeners()
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch market data from CoinGecko via the shared resilient client."""
+        with self.profiler.refresh(), self.watchdog.watch("update"):
+            return await self._async_fetch()
+
+    async def _async_fetch(self) -> dict[str, Any]:
+        """Fetch and shape one market data snapshot."""
+        fields = self.required_fields()
+        use_simple_price = fields is not None and self._can_use_simple_price(fields)
         try:
-            data = await self.api.get_coins_markets(self.cryptocurrency_ids, self.currency_name)
+            if fields is not None and use_simple_price:
+                data = await self.api.get_simple_price(
+                    self.cryptocurrency_ids,
+                    self.currency_name,
+                    include_market_cap="market_cap" in fields,
+                    include_24h_vol="total_volume" in fields,
+                    include_24h_change="price_change_percentage_24h_in_currency" in fields,
+                )
+            else:
+                windows = None if fields is None else price_change_windows(fields)
+                data = await self.api.get_coins_markets(self.cryptocurrency_ids, self.currency_name, windows)
         except CryptoInfoRateLimitError as err:
+            self.changed_ids = None
             raise UpdateFailed(f"Rate limited by CoinGecko: {err}", retry_after=err.retry_after) from err
         except CryptoInfoError as err:
+            self.changed_ids = None
             raise UpdateFailed(f"Error fetching data from CoinGecko: {err}") from err
 
-        return {coin["id"]: coin for coin in data if isinstance(coin, dict) and "id" in coin}
+        if use_simple_price != self.simple_price_active:
+            self.simple_price_active = use_simple_price
+            if self.budget is not None:
+                # The pages per refresh may have changed.
+                self.budget.async_plan()
+        with profile_phase("transform"):
+            if use_simple_price:
+                previous = self.data
+                data = [
+                    {key: previous[coin["id"]][key] for key in _IDENTITY_FIELDS if key in previous.get(coin["id"], {})}
+                    | coin
+                    for coin in data
+                ]
+            records = records_by_id(data, fields)
+            self.changed_ids = self._changed_coins(records)
+        return records
+
+    def _changed_coins(self, records: dict[str, Any]) -> frozenset[str] | None:
+        """Return the coins whose record differs from the current snapshot.
+
+        Coins are compared by ``last_updated``: CoinGecko only bumps it when the
+        coin's market data moved. A record without it, or whose field set changed,
+        counts as changed, and so does a coin that vanished from the payload.
+        Returns None (everything changed) on the first refresh or after a failure.
+        """
+        previous = self.data
+        if not previous or not self.last_update_success:
+            return None
+        changed = {
+            coin_id
+            for coin_id, record in records.items()
+            if (old := previous.get(coin_id)) is None
+            or record.get("last_updated") is None
+            or record.get("last_updated") != old.get("last_updated")
+            or record.keys() != old.keys()
+        }
+        changed.update(previous.keys() - records.keys())
+        return frozenset(changed)
+
+    def coin_changed(self, coin_id: str) -> bool:
+        """Return True if the coin's entities must write their state."""
+        return self.changed_ids is None or coin_id in self.changed_ids
+
+    def data_age(self, coin_id: str) -> float | None:
+        """Return the age in seconds of the coin's market data, if known."""
+        record = self.data.get(coin_id) if self.data else None
+        last_updated = record.get("last_updated") if record else None
+        if not isinstance(last_updated, str) or (parsed := dt_util.parse_datetime(last_updated)) is None:
+            return None
+        return (dt_util.utcnow() - parsed).total_seconds()
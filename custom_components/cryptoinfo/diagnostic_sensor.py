@@ -0,0 +1,139 @@
+"""Diagnostic sensors exposing an entry's API client internals.
+
+They are disabled by default and only read in-memory state (request telemetry,
+rate limiter, circuit breaker), so enabling them adds no request. Telemetry
+sensors refresh with the entry's coordinator. The limiter state also changes
+between refreshes (queued requests, the sliding window draining), so limiter
+sensors are bound to the CoinGecko client and re-read it every
+``LIMITER_REFRESH_INTERVAL``.
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.sensor import SensorEntity
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.update_coordinator import CoordinatorEntity, DataUpdateCoordinator
+
+from .sensor_descriptions import (
+    LIMITER_DESCRIPTIONS,
+    TELEMETRY_DESCRIPTIONS,
+    LimiterSensorEntityDescription,
+    TelemetrySensorEntityDescription,
+)
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from homeassistant.helpers.device_registry import DeviceInfo
+
+    from .api.coingecko_api import CoinGeckoAPI
+    from .api.telemetry import RequestTelemetry
+
+# How often the limiter sensors re-read the client's limiter state.
+LIMITER_REFRESH_INTERVAL = timedelta(seconds=5)
+
+
+def telemetry_sensors(
+    coordinator: DataUpdateCoordinator[dict[str, Any]],
+    telemetry: RequestTelemetry,
+    base_unique_id: str,
+    device_info: DeviceInfo,
+) -> list[SensorEntity]:
+    """Build the request telemetry sensors of one API client."""
+    return [
+        TelemetrySensor(coordinator, telemetry, description, base_unique_id, device_info)
+        for description in TELEMETRY_DESCRIPTIONS
+    ]
+
+
+def limiter_sensors(api: CoinGeckoAPI, base_unique_id: str, device_info: DeviceInfo) -> list[SensorEntity]:
+    """Build the rate limiter and circuit breaker sensors of the CoinGecko client."""
+    return [LimiterSensor(api, description, base_unique_id, device_info) for description in LIMITER_DESCRIPTIONS]
+
+
+class TelemetrySensor(CoordinatorEntity[DataUpdateCoordinator[dict[str, Any]]], SensorEntity):
+    """Request telemetry counter of an API client."""
+
+    _attr_has_entity_name = True
+    entity_description: TelemetrySensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator[dict[str, Any]],
+        telemetry: RequestTelemetry,
+        description: TelemetrySensorEntityDescription,
+        base_unique_id: str,
+        device_info: DeviceInfo,
+    ) -> None:
+        """Initialize the telemetry sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._telemetry = telemetry
+        self._attr_unique_id = f"{base_unique_id}_{description.key}"
+        self._attr_device_info = device_info
+
+    @property
+    def available(self) -> bool:
+        """Return True: telemetry is local and survives failed refreshes."""
+        return True
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the telemetry value."""
+        return self.entity_description.value_fn(self._telemetry)
+
+
+class LimiterSensor(SensorEntity):
+    """Rate limiter or circuit breaker state of the CoinGecko client.
+
+    The state is re-read from the client every ``LIMITER_REFRESH_INTERVAL`` and
+    written only when it changed; price refreshes do not drive it.
+    """
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    entity_description: LimiterSensorEntityDescription
+
+    def __init__(
+        self,
+        api: CoinGeckoAPI,
+        description: LimiterSensorEntityDescription,
+        base_unique_id: str,
+        device_info: DeviceInfo,
+    ) -> None:
+        """Initialize the limiter sensor."""
+        self.entity_description = description
+        self._api = api
+        self._attr_unique_id = f"{base_unique_id}_{description.key}"
+        self._attr_device_info = device_info
+        self._written: datetime | int | str | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Start re-reading the limiter state."""
+        await super().async_added_to_hass()
+        self._written = self.native_value
+        self.async_on_remove(
+            async_track_time_interval(
+                self.hass,
+                self._async_refresh,
+                LIMITER_REFRESH_INTERVAL,
+                name=f"{self.entity_id} limiter refresh",
+                cancel_on_shutdown=True,
+            )
+        )
+
+    @callback
+    def _async_refresh(self, _now: datetime) -> None:
+        value = self.native_value
+        if value != self._written:
+            self._written = value
+            self.async_write_ha_state()
+
+    @property
+    def native_value(self) -> datetime | int | str | None:
+        """Return the limiter value."""
+        return self.entity_description.value_fn(self._api)
@@ -7,10 +7,18 @@ from typing import Any
 from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.core import HomeAssistant
 
+from .api.blockchain_api import BlockchainAPI
+from .api.sessions import session_state
+from .ckpool_group import CKPoolRegionGroup
 from .const import (
     CONF_BTC_ADDRESS,
+    CONF_MEMPOOL_MIRRORS,
     CryptoInfoConfigEntry,
 )
+from .coordinator import CryptoDataCoordinator
+from .helpers import mempool_mirrors
+from .profiling import RefreshProfiler
+from .watchdog import LoopWatchdog
 
 # Keys to redact from diagnostics
 TO_REDACT = {
@@ -23,6 +31,15 @@ TO_REDACT = {
 }
 
 
+def _redact_config(config: dict[str, Any]) -> dict[str, Any]:
+    """Redact ``config``; mempool mirrors (often LAN hosts) become the mirror keys of ``mirrors``."""
+    redacted = async_redact_data(config, TO_REDACT)
+    if CONF_MEMPOOL_MIRRORS in redacted:
+        mirrors = mempool_mirrors(redacted[CONF_MEMPOOL_MIRRORS])
+        redacted[CONF_MEMPOOL_MIRRORS] = [f"mirror_{index}" for index in range(len(mirrors))]
+    return redacted
+
+
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant,
     entry: CryptoInfoConfigEntry,
@@ -32,19 +49,54 @@ async def async_get_config_entry_diagnostics(
 
     # Collect coordinator data
     coordinator_data: dict[str, Any] = {}
-    if runtime_data.coordinator:
+    if (price_coordinator := runtime_data.coordinator) is not None:
+        changed_ids = price_coordinator.changed_ids
         coordinator_data["main"] = {
-            "last_update_success": runtime_data.coordinator.last_update_success,
-            "update_interval": str(runtime_data.coordinator.update_interval),
-            "data_keys": list(runtime_data.coordinator.data.keys()) if runtime_data.coordinator.data else [],
+            "last_update_success": price_coordinator.last_update_success,
+            "update_interval": str(price_coordinator.update_interval),
+            "data_keys": list(price_coordinator.data.keys()) if price_coordinator.data else [],
+            "simple_price_active": price_coordinator.simple_price_active,
+            "changed_ids": sorted(changed_ids) if changed_ids is not None else None,
+            "coin_data_age": {coin_id: price_coordinator.data_age(coin_id) for coin_id in price_coordinator.data or {}},
         }
+        if price_coordinator.budget is not None:
+            coordinator_data["main"]["request_budget"] = price_coordinator.budget.as_dict()
 
     for name, coordinator in runtime_data.coordinators.items():
+        # CKPool coordinators are polled by their region group and have no timer of their own.
+        interval = getattr(coordinator, "poll_interval", None) or coordinator.update_interval
         coordinator_data[name] = {
             "last_update_success": coordinator.last_update_success,
-            "update_interval": str(coordinator.update_interval),
+            "update_interval": str(interval),
             "data_available": coordinator.data is not None,
         }
+        profiler: RefreshProfiler | None = getattr(coordinator, "profiler", None)
+        if profiler is not None and profiler.enabled:
+            coordinator_data[name]["profiling"] = profiler.as_dict()
+        watchdog: LoopWatchdog | None = getattr(coordinator, "watchdog", None)
+        if watchdog is not None and watchdog.enabled:
+            coordinator_data[name]["loop_watchdog"] = watchdog.as_dict()
+        group: CKPoolRegionGroup | None = getattr(coordinator, "group", None)
+        if group is not None:
+            coordinator_data[name]["ckpool_group"] = group.as_dict()
+
+    # Request telemetry of the API clients used by this entry
+    api_telemetry: dict[str, Any] = {}
+    if price_coordinator is not None:
+        api_telemetry["coingecko"] = {
+            "limiter": price_coordinator.api.limiter_state(),
+            "endpoints": price_coordinator.api.telemetry.as_dict(),
+            "session": session_state(hass, price_coordinator.api.provider),
+        }
+    for name, coordinator in runtime_data.coordinators.items():
+        api = getattr(coordinator, "api", None)
+        if api is not None and not isinstance(coordinator, CryptoDataCoordinator):
+            api_telemetry[name] = {
+                "endpoints": api.telemetry.as_dict(),
+                "session": session_state(hass, api.provider),
+            }
+            if isinstance(api, BlockchainAPI) and len(api.base_urls) > 1:
+                api_telemetry[name]["mirrors"] = api.mirror_state()
 
     # Collect shared data info
     shared_data_info = {}
@@ -59,11 +111,12 @@ async def async_get_config_entry_diagnostics(
             "version": entry.version,
             "domain": entry.domain,
             "title": entry.title,
-            "data": async_redact_data(dict(entry.data), TO_REDACT),
-            "options": async_redact_data(dict(entry.options), TO_REDACT),
+            "data": _redact_config(dict(entry.data)),
+            "options": _redact_config(dict(entry.options)),
         },
         "runtime_data": {
             "shared_data": shared_data_info,
             "coordinators": coordinator_data,
+            "api_telemetry": api_telemetry,
         },
     }
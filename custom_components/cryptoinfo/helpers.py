@@ -6,7 +6,13 @@ testable in isolation.
 
 from __future__ import annotations
 
-from .const import SENSOR_PREFIX
+from collections.abc import Iterable, Mapping
+import re
+from typing import Any
+
+from .const import CONF_CRYPTOCURRENCY_IDS, CONF_MULTIPLIERS, SENSOR_PREFIX
+
+_PRICE_CHANGE_FIELD = re.compile(r"^price_change_percentage_([0-9a-z]+)_in_currency$")
 
 
 def build_price_unique_id(id_name: str, cryptocurrency_id: str, currency_name: str) -> str:
@@ -17,3 +23,44 @@ def build_price_unique_id(id_name: str, cryptocurrency_id: str, currency_name: s
     flow computes this id to look entities up in the registry.
     """
     return f"{SENSOR_PREFIX}{id_name}_{cryptocurrency_id}_{currency_name}".lower().replace(" ", "_")
+
+
+def mempool_mirrors(value: str | None) -> list[str]:
+    """Return the mempool API base URLs of a comma-separated option value, in order."""
+    return [url.strip().rstrip("/") for url in (value or "").split(",") if url.strip()]
+
+
+def parse_watchlist(config: Mapping[str, Any]) -> tuple[list[str], list[str]]:
+    """Return the coin ids and multipliers of a price entry's configuration."""
+    cryptocurrency_ids = config.get(CONF_CRYPTOCURRENCY_IDS, "").lower().strip()
+    multipliers = config.get(CONF_MULTIPLIERS, "1").strip()
+    crypto_list = [crypto.strip() for crypto in cryptocurrency_ids.split(",") if crypto.strip()]
+    multipliers_list = [mult.strip() for mult in multipliers.split(",")]
+    return crypto_list, multipliers_list
+
+
+def price_change_windows(fields: Iterable[str]) -> set[str]:
+    """Return the CoinGecko ``price_change_percentage`` windows needed for ``fields``.
+
+    ``price_change_percentage_7d_in_currency`` maps to ``7d``; other fields are ignored.
+    """
+    return {match.group(1) for field in fields if (match := _PRICE_CHANGE_FIELD.match(field))}
+
+
+def project_record(record: Mapping[str, Any], fields: frozenset[str]) -> dict[str, Any]:
+    """Return a copy of ``record`` restricted to ``fields``."""
+    return {key: value for key, value in record.items() if key in fields}
+
+
+def records_by_id(records: Iterable[Any], fields: frozenset[str] | None) -> dict[str, dict[str, Any]]:
+    """Key API records by coin id, projected onto ``fields`` unless it is None.
+
+    Entries that are not dicts or lack an ``id`` are skipped.
+    """
+    if fields is None:
+        return {record["id"]: record for record in records if isinstance(record, dict) and "id" in record}
+    return {
+        record["id"]: project_record(record, fields)
+        for record in records
+        if isinstance(record, dict) and "id" in record
+    }
@@ -6,24 +6,33 @@ Author: foXaCe
 from __future__ import annotations
 
 import asyncio
-from datetime import timedelta
+from collections.abc import Sequence
+from datetime import datetime, timedelta
 import logging
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.core import callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
     UpdateFailed,
 )
+from homeassistant.util import dt as dt_util
 
-from .api.blockchain_api import BlockchainAPI, CKPoolAPI
+from .api.blockchain_api import BlockchainAPI
+from .api.deadline import DEADLINE_MARGIN, Deadline
+from .ckpool_group import ckpool_group
 from .const import (
     CKPOOL_REGION_EU,
     CONF_BTC_ADDRESS,
     CONF_CKPOOL_REGION,
     CONF_ID,
+    CONF_LOOP_WATCHDOG,
+    CONF_MEMPOOL_MIRRORS,
+    CONF_PROFILING,
     CONF_SENSOR_TYPE,
     CONF_UPDATE_FREQUENCY,
     DOMAIN,
@@ -33,12 +42,18 @@ from .const import (
     SENSOR_TYPE_CKPOOL_MINING,
     CryptoInfoConfigEntry,
 )
+from .diagnostic_sensor import telemetry_sensors
+from .exceptions import CryptoInfoError
+from .helpers import mempool_mirrors
+from .profiling import RefreshProfiler
 from .sensor_descriptions import (
     CKPOOL_DESCRIPTIONS,
+    CKPOOL_WORKER_DESCRIPTIONS,
     MINING_MEMPOOL_DESCRIPTIONS,
     MINING_NETWORK_DESCRIPTIONS,
     CryptoSensorEntityDescription,
 )
+from .watchdog import LoopWatchdog
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -49,9 +64,12 @@ _LOGGER = logging.getLogger(__name__)
 # Coordinator-driven entities do not perform their own I/O.
 PARALLEL_UPDATES = 0
 
-# Default timeout for API requests (seconds)
+# Timeout of a whole refresh (seconds); the clients fit their retries inside it.
 DEFAULT_TIMEOUT = 30
 
+# How long a worker missing from the responses keeps its (unavailable) sensors.
+WORKER_REMOVAL_DELAY = timedelta(days=1)
+
 
 async def async_setup_mining_sensors(
     hass: HomeAssistant,
@@ -63,9 +81,13 @@ async def async_setup_mining_sensors(
     sensor_type = config.get(CONF_SENSOR_TYPE)
     id_name = (config.get(CONF_ID) or "").strip()
     update_frequency = timedelta(minutes=float(config.get(CONF_UPDATE_FREQUENCY, 5)))
+    profiling = bool(config.get(CONF_PROFILING, False))
+    loop_watchdog = bool(config.get(CONF_LOOP_WATCHDOG, False))
+    mirrors = mempool_mirrors(config.get(CONF_MEMPOOL_MIRRORS))
 
     if sensor_type == SENSOR_TYPE_BTC_NETWORK:
-        network_coordinator = BTCNetworkCoordinator(hass, update_frequency)
+        network_coordinator = BTCNetworkCoordinator(hass, update_frequency, profiling, loop_watchdog, mirrors)
+        entry.runtime_data.coordinators[entry.entry_id] = network_coordinator
         async_add_entities(
             [BTCNetworkSensor(network_coordinator, id_name), *network_derived_sensors(network_coordinator, id_name)]
         )
@@ -76,7 +98,8 @@ async def async_setup_mining_sensors(
         )
 
     elif sensor_type == SENSOR_TYPE_BTC_MEMPOOL:
-        mempool_coordinator = BTCMempoolCoordinator(hass, update_frequency)
+        mempool_coordinator = BTCMempoolCoordinator(hass, update_frequency, profiling, loop_watchdog, mirrors)
+        entry.runtime_data.coordinators[entry.entry_id] = mempool_coordinator
         async_add_entities(
             [BTCMempoolSensor(mempool_coordinator, id_name), *mempool_derived_sensors(mempool_coordinator, id_name)]
         )
@@ -92,13 +115,20 @@ async def async_setup_mining_sensors(
             _LOGGER.error("BTC address is required for CKPool mining sensor")
             return False
         pool_region = config.get(CONF_CKPOOL_REGION, CKPOOL_REGION_EU)
-        ckpool_coordinator = CKPoolCoordinator(hass, btc_address, pool_region, update_frequency)
+        ckpool_coordinator = CKPoolCoordinator(
+            hass, btc_address, pool_region, update_frequency, profiling, loop_watchdog
+        )
+        entry.runtime_data.coordinators[entry.entry_id] = ckpool_coordinator
+        entry.async_on_unload(ckpool_coordinator.group.async_register(ckpool_coordinator))
         async_add_entities(
             [
                 CKPoolMiningSensor(ckpool_coordinator, id_name, btc_address),
                 *ckpool_derived_sensors(ckpool_coordinator, btc_address),
             ]
         )
+        # Per-worker sensors follow the workers listed in each response
+        worker_tracker = CKPoolWorkerTracker(hass, ckpool_coordinator, async_add_entities, btc_address, entry.entry_id)
+        entry.async_on_unload(ckpool_coordinator.async_add_listener(worker_tracker.async_sync))
         entry.async_create_background_task(
             hass,
             ckpool_coordinator.async_refresh(),
@@ -109,7 +139,7 @@ async def async_setup_mining_sensors(
 
 
 def network_derived_sensors(coordinator: BTCNetworkCoordinator, id_name: str) -> list[SensorEntity]:
-    """Build the derived Bitcoin network sensors."""
+    """Build the derived Bitcoin network sensors and the API telemetry sensors."""
     base = f"{SENSOR_PREFIX}btc_network_{id_name}".lower().replace(" ", "_")
     device_info = DeviceInfo(
         identifiers={(DOMAIN, "btc_network")},
@@ -118,12 +148,16 @@ def network_derived_sensors(coordinator: BTCNetworkCoordinator, id_name: str) ->
         model="Network Statistics",
     )
     return [
-        MiningDerivedSensor(coordinator, description, base, device_info) for description in MINING_NETWORK_DESCRIPTIONS
+        *(
+            MiningDerivedSensor(coordinator, description, base, device_info)
+            for description in MINING_NETWORK_DESCRIPTIONS
+        ),
+        *telemetry_sensors(coordinator, coordinator.api.telemetry, base, device_info),
     ]
 
 
 def mempool_derived_sensors(coordinator: BTCMempoolCoordinator, id_name: str) -> list[SensorEntity]:
-    """Build the derived Bitcoin mempool sensors."""
+    """Build the derived Bitcoin mempool sensors and the API telemetry sensors."""
     base = f"{SENSOR_PREFIX}btc_mempool_{id_name}".lower().replace(" ", "_")
     device_info = DeviceInfo(
         identifiers={(DOMAIN, "btc_mempool")},
@@ -132,12 +166,16 @@ def mempool_derived_sensors(coordinator: BTCMempoolCoordinator, id_name: str) ->
         model="Mempool Statistics",
     )
     return [
-        MiningDerivedSensor(coordinator, description, base, device_info) for description in MINING_MEMPOOL_DESCRIPTIONS
+        *(
+            MiningDerivedSensor(coordinator, description, base, device_info)
+            for description in MINING_MEMPOOL_DESCRIPTIONS
+        ),
+        *telemetry_sensors(coordinator, coordinator.api.telemetry, base, device_info),
     ]
 
 
-def ckpool_derived_sensors(coordinator: CKPoolCoordinator, btc_address: str) -> list[SensorEntity]:
-    """Build the derived CKPool mining sensors."""
+def ckpool_device(btc_address: str) -> tuple[str, DeviceInfo]:
+    """Return the base unique id and the device of a CKPool address's sensors."""
     base = f"{SENSOR_PREFIX}ckpool_{btc_address[:8]}".lower().replace(" ", "_")
     device_info = DeviceInfo(
         identifiers={(DOMAIN, f"ckpool_{btc_address[:8]}")},
@@ -145,13 +183,29 @@ def ckpool_derived_sensors(coordinator: CKPoolCoordinator, btc_address: str) ->
         manufacturer="CKPool",
         model="Solo Mining",
     )
-    return [MiningDerivedSensor(coordinator, description, base, device_info) for description in CKPOOL_DESCRIPTIONS]
+    return base, device_info
+
+
+def ckpool_derived_sensors(coordinator: CKPoolCoordinator, btc_address: str) -> list[SensorEntity]:
+    """Build the derived CKPool mining sensors and the API telemetry sensors."""
+    base, device_info = ckpool_device(btc_address)
+    return [
+        *(MiningDerivedSensor(coordinator, description, base, device_info) for description in CKPOOL_DESCRIPTIONS),
+        *telemetry_sensors(coordinator, coordinator.api.telemetry, base, device_info),
+    ]
 
 
 class BTCNetworkCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator to fetch Bitcoin network statistics."""
 
-    def __init__(self, hass: HomeAssistant, update_interval: timedelta) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        update_interval: timedelta,
+        profiling: bool = False,
+        loop_watchdog: bool = False,
+        mirrors: Sequence[str] = (),
+    ) -> None:
         """Initialize the coordinator."""
         super().__init__(
             hass,
@@ -159,14 +213,28 @@ class BTCNetworkCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             name="Bitcoin Network Stats",
             update_interval=update_interval,
         )
-        self.api = BlockchainAPI(hass)
+        self.api = BlockchainAPI(hass, mirrors)
+        self.profiler = RefreshProfiler(profiling)
+        self.watchdog = LoopWatchdog(self.name, loop_watchdog)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update listeners, timed as the fan-out phase when profiling."""
+        with self.profiler.fan_out(), self.watchdog.watch("fan_out"):
+            super().async_update_listeners()
+
+    @callback
+    def async_set_update_interval(self, interval: timedelta) -> None:
+        """Poll at ``interval`` after the next refresh."""
+        self.update_interval = interval
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from blockchain API."""
         try:
-            async with asyncio.timeout(DEFAULT_TIMEOUT):
-                data = await self.api.get_network_stats()
-                return data or {}
+            with self.profiler.refresh(), self.watchdog.watch("update"):
+                async with asyncio.timeout(DEFAULT_TIMEOUT):
+                    data = await self.api.get_network_stats(Deadline(DEFAULT_TIMEOUT - DEADLINE_MARGIN))
+                    return data or {}
         except TimeoutError as err:
             raise UpdateFailed("Request timeout") from err
 
@@ -174,7 +242,14 @@ class BTCNetworkCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 class BTCMempoolCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator to fetch Bitcoin mempool statistics."""
 
-    def __init__(self, hass: HomeAssistant, update_interval: timedelta) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        update_interval: timedelta,
+        profiling: bool = False,
+        loop_watchdog: bool = False,
+        mirrors: Sequence[str] = (),
+    ) -> None:
         """Initialize the coordinator."""
         super().__init__(
             hass,
@@ -182,40 +257,91 @@ class BTCMempoolCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             name="Bitcoin Mempool Stats",
             update_interval=update_interval,
         )
-        self.api = BlockchainAPI(hass)
+        self.api = BlockchainAPI(hass, mirrors)
+        self.profiler = RefreshProfiler(profiling)
+        self.watchdog = LoopWatchdog(self.name, loop_watchdog)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update listeners, timed as the fan-out phase when profiling."""
+        with self.profiler.fan_out(), self.watchdog.watch("fan_out"):
+            super().async_update_listeners()
+
+    @callback
+    def async_set_update_interval(self, interval: timedelta) -> None:
+        """Poll at ``interval`` after the next refresh."""
+        self.update_interval = interval
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from mempool API."""
         try:
-            async with asyncio.timeout(DEFAULT_TIMEOUT):
-                data = await self.api.get_mempool_stats()
-                return data or {}
+            with self.profiler.refresh(), self.watchdog.watch("update"):
+                async with asyncio.timeout(DEFAULT_TIMEOUT):
+                    data = await self.api.get_mempool_stats(Deadline(DEFAULT_TIMEOUT - DEADLINE_MARGIN))
+                    return data or {}
         except TimeoutError as err:
             raise UpdateFailed("Request timeout") from err
 
 
 class CKPoolCoordinator(DataUpdateCoordinator[dict[str, Any]]):
-    """Coordinator to fetch CKPool mining statistics."""
+    """Coordinator holding one address's CKPool mining statistics.
+
+    Scheduled polling is done by the region's ``CKPoolRegionGroup`` once the
+    coordinator is registered with it; the group pushes each result here. An
+    explicit refresh fetches the address alone, within the group's concurrency.
+    """
 
-    def __init__(self, hass: HomeAssistant, btc_address: str, pool_region: str, update_interval: timedelta) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        btc_address: str,
+        pool_region: str,
+        update_interval: timedelta,
+        profiling: bool = False,
+        loop_watchdog: bool = False,
+    ) -> None:
         """Initialize the coordinator."""
         super().__init__(
             hass,
             _LOGGER,
             name=f"CKPool Stats {btc_address[:8]}...",
-            update_interval=update_interval,
+            update_interval=None,
         )
-        self.api = CKPoolAPI(hass, pool_region)
+        self.group = ckpool_group(hass, pool_region)
+        self.api = self.group.api
         self.btc_address = btc_address
+        self.poll_interval = update_interval
+        self.profiler = RefreshProfiler(profiling)
+        self.watchdog = LoopWatchdog(self.name, loop_watchdog)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update listeners, timed as the fan-out phase when profiling."""
+        with self.profiler.fan_out(), self.watchdog.watch("fan_out"):
+            super().async_update_listeners()
+
+    @callback
+    def async_set_update_interval(self, interval: timedelta) -> None:
+        """Poll at ``interval`` from now on; the region group is rescheduled."""
+        self.poll_interval = interval
+        self.group.async_schedule()
 
     async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from CKPool API."""
+        """Fetch data from CKPool API, sharing the region's concurrency limit."""
+        async with self.group.semaphore:
+            return await self.async_fetch()
+
+    async def async_fetch(self) -> dict[str, Any]:
+        """Fetch the address's statistics."""
         try:
-            async with asyncio.timeout(DEFAULT_TIMEOUT):
-                data = await self.api.get_user_stats(self.btc_address)
-                return data or {}
+            with self.profiler.refresh(), self.watchdog.watch("update"):
+                async with asyncio.timeout(DEFAULT_TIMEOUT):
+                    data = await self.api.get_user_stats(self.btc_address, Deadline(DEFAULT_TIMEOUT - DEADLINE_MARGIN))
+                    return data or {}
         except TimeoutError as err:
             raise UpdateFailed("Request timeout") from err
+        except CryptoInfoError as err:
+            raise UpdateFailed(f"Error fetching data from CKPool: {err}") from err
 
 
 class BTCNetworkSensor(CoordinatorEntity[BTCNetworkCoordinator], SensorEntity):
@@ -325,6 +451,128 @@ class CKPoolMiningSensor(CoordinatorEntity[CKPoolCoordinator], SensorEntity):
         return {"btc_address": self.btc_address}
 
 
+class CKPoolWorkerTracker:
+    """Add and remove per-worker sensors as workers appear in or leave CKPool responses.
+
+    Workers are diffed by name after each successful refresh; nothing happens
+    while the set is unchanged, and a failed refresh never removes entities.
+    A worker missing from the response keeps its sensors, unavailable, until it
+    has been missing for ``WORKER_REMOVAL_DELAY``; they are then deleted from the
+    entity registry. Sensors of workers that left while Home Assistant was
+    stopped are found in the registry on the first response and deleted after
+    the same delay unless the worker comes back.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: CKPoolCoordinator,
+        async_add_entities: AddEntitiesCallback,
+        btc_address: str,
+        config_entry_id: str,
+    ) -> None:
+        """Initialize the tracker."""
+        self._hass = hass
+        self._coordinator = coordinator
+        self._async_add_entities = async_add_entities
+        self._config_entry_id = config_entry_id
+        self._base, self._device_info = ckpool_device(btc_address)
+        self.entities: dict[str, list[CKPoolWorkerSensor]] = {}
+        # When each worker still having sensors was first seen missing.
+        self._missing_since: dict[str, datetime] = {}
+        # Registry unique ids of worker sensors left from a previous run; None before the first response.
+        self._stale_since: dict[str, datetime] | None = None
+
+    @callback
+    def async_sync(self) -> None:
+        """Reconcile the per-worker sensors with the last response."""
+        if not self._coordinator.last_update_success or not self._coordinator.data:
+            return
+        workers = self._coordinator.data.get("worker_stats", {}).keys()
+        for worker in self._missing_since.keys() & workers:
+            del self._missing_since[worker]
+        if workers == self.entities.keys() and self._stale_since is not None and not self._stale_since:
+            return
+        now = dt_util.utcnow()
+
+        added: list[SensorEntity] = []
+        for worker in sorted(workers - self.entities.keys()):
+            sensors = [
+                CKPoolWorkerSensor(self._coordinator, description, worker, self._base, self._device_info)
+                for description in CKPOOL_WORKER_DESCRIPTIONS
+            ]
+            self.entities[worker] = sensors
+            added.extend(sensors)
+        if added:
+            self._async_add_entities(added)
+
+        registry = er.async_get(self._hass)
+        if self._stale_since is None:
+            listed = {sensor.unique_id for sensors in self.entities.values() for sensor in sensors}
+            self._stale_since = {
+                registry_entry.unique_id: now
+                for registry_entry in er.async_entries_for_config_entry(registry, self._config_entry_id)
+                if registry_entry.unique_id.startswith(f"{self._base}_worker_")
+                and registry_entry.unique_id not in listed
+            }
+        for sensor in added:
+            self._stale_since.pop(sensor.unique_id or "", None)
+        for unique_id, since in list(self._stale_since.items()):
+            if now - since >= WORKER_REMOVAL_DELAY:
+                del self._stale_since[unique_id]
+                if entity_id := registry.async_get_entity_id("sensor", DOMAIN, unique_id):
+                    registry.async_remove(entity_id)
+
+        for worker in self.entities.keys() - workers:
+            if now - self._missing_since.setdefault(worker, now) < WORKER_REMOVAL_DELAY:
+                continue
+            del self._missing_since[worker]
+            for sensor in self.entities.pop(worker):
+                if sensor.registry_entry is not None:
+                    registry.async_remove(sensor.entity_id)
+                elif sensor.hass is not None:
+                    self._hass.async_create_task(sensor.async_remove())
+
+
+class CKPoolWorkerSensor(CoordinatorEntity[CKPoolCoordinator], SensorEntity):
+    """A metric of one CKPool worker (rig), read from the address's response."""
+
+    _attr_has_entity_name = True
+    entity_description: CryptoSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: CKPoolCoordinator,
+        description: CryptoSensorEntityDescription,
+        worker: str,
+        base_unique_id: str,
+        device_info: DeviceInfo,
+    ) -> None:
+        """Initialize the worker sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self.worker = worker
+        self._attr_unique_id = f"{base_unique_id}_worker_{worker}_{description.key}".lower().replace(" ", "_")
+        self._attr_device_info = device_info
+        self._attr_translation_placeholders = {"worker": worker}
+
+    def _worker_stats(self) -> dict[str, Any] | None:
+        data = self.coordinator.data or {}
+        stats: dict[str, Any] | None = data.get("worker_stats", {}).get(self.worker)
+        return stats
+
+    @property
+    def available(self) -> bool:
+        """Return True while the worker is listed in a successful response."""
+        return self.coordinator.last_update_success and self._worker_stats() is not None
+
+    @property
+    def native_value(self) -> Any:
+        """Return the worker metric."""
+        stats = self._worker_stats()
+        return None if stats is None else self.entity_description.value_fn(stats)
+
+
 class MiningDerivedSensor(CoordinatorEntity[DataUpdateCoordinator[dict[str, Any]]], SensorEntity):
     """A derived metric sensor for mining statistics."""
 
@@ -6,14 +6,68 @@ from typing import Any
 
 from homeassistant import config_entries
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.selector import TextSelector, TextSelectorConfig, TextSelectorType
 import voluptuous as vol
 
+from .api.coingecko_api import CoinGeckoAPI
 from .const import (
+    API_PLAN_ANALYST,
+    API_PLAN_DEMO,
+    API_PLAN_LITE,
+    API_PLAN_PRO,
+    API_PLAN_PUBLIC,
+    CONF_API_KEY,
+    CONF_API_PLAN,
+    CONF_ENTITY_METRICS,
+    CONF_ENTITY_PROFILE,
+    CONF_LOOP_WATCHDOG,
+    CONF_MEMPOOL_MIRRORS,
     CONF_MIN_TIME_BETWEEN_REQUESTS,
+    CONF_PROFILING,
     CONF_SENSOR_TYPE,
     CONF_UPDATE_FREQUENCY,
+    ENTITY_PROFILE_CUSTOM,
+    ENTITY_PROFILE_FULL,
+    ENTITY_PROFILE_MINIMAL,
+    ENTITY_PROFILE_STANDARD,
+    SENSOR_TYPE_BTC_MEMPOOL,
+    SENSOR_TYPE_BTC_NETWORK,
     SENSOR_TYPE_PRICE,
 )
+from .exceptions import CryptoInfoError
+from .helpers import mempool_mirrors
+from .request_budget import budget_summary
+
+API_PLAN_OPTIONS = {
+    API_PLAN_PUBLIC: "Public API (no key, ~10 calls/min)",
+    API_PLAN_DEMO: "Demo (30 calls/min)",
+    API_PLAN_ANALYST: "Analyst (500 calls/min)",
+    API_PLAN_LITE: "Lite (500 calls/min)",
+    API_PLAN_PRO: "Pro (1000 calls/min)",
+}
+
+ENTITY_PROFILE_OPTIONS = {
+    ENTITY_PROFILE_MINIMAL: "Minimal (price, 24h change)",
+    ENTITY_PROFILE_STANDARD: "Standard (price, market cap, volume, 1h to 30d changes)",
+    ENTITY_PROFILE_FULL: "Full (every metric)",
+    ENTITY_PROFILE_CUSTOM: "Custom (metrics picked below)",
+}
+
+PRICE_METRIC_OPTIONS = {
+    "market_cap": "Market cap",
+    "volume_24h": "24h volume",
+    "change_1h": "1h change",
+    "change_24h": "24h change",
+    "change_7d": "7d change",
+    "change_14d": "14d change",
+    "change_30d": "30d change",
+    "change_1y": "1y change",
+    "circulating_supply": "Circulating supply",
+    "total_supply": "Total supply",
+    "ath": "All-time high",
+    "ath_change": "Change from all-time high",
+    "rank": "Market cap rank",
+}
 
 
 class CryptoInfoOptionsFlow(config_entries.OptionsFlow):
@@ -28,8 +82,14 @@ class CryptoInfoOptionsFlow(config_entries.OptionsFlow):
         sensor_type = entry.data.get(CONF_SENSOR_TYPE, SENSOR_TYPE_PRICE)
 
         if user_input is not None:
-            # Update options
-            return self.async_create_entry(title="", data=user_input)
+            mirrors = mempool_mirrors(user_input.get(CONF_MEMPOOL_MIRRORS))
+            if not all(url.startswith(("http://", "https://")) for url in mirrors):
+                errors[CONF_MEMPOOL_MIRRORS] = "invalid_mirror"
+            if sensor_type == SENSOR_TYPE_PRICE:
+                user_input = await self._async_validate_api_key(user_input, errors)
+            if not errors:
+                # Update options
+                return self.async_create_entry(title="", data=user_input)
 
         # Get current values
         current_update_freq = entry.data.get(CONF_UPDATE_FREQUENCY, 5)
@@ -55,9 +115,74 @@ class CryptoInfoOptionsFlow(config_entries.OptionsFlow):
                 }
             )
 
+        # CoinGecko plan and its key (stored in the entry options, redacted from diagnostics)
+        if sensor_type == SENSOR_TYPE_PRICE:
+            options_schema = options_schema.extend(
+                {
+                    vol.Required(CONF_API_PLAN, default=entry.options.get(CONF_API_PLAN, API_PLAN_PUBLIC)): vol.In(
+                        API_PLAN_OPTIONS
+                    ),
+                    vol.Optional(
+                        CONF_API_KEY, description={"suggested_value": entry.options.get(CONF_API_KEY)}
+                    ): TextSelector(TextSelectorConfig(type=TextSelectorType.PASSWORD)),
+                }
+            )
+
+        # Metric entities created per coin: a preset or a custom list
+        if sensor_type == SENSOR_TYPE_PRICE:
+            config = {**entry.data, **entry.options}
+            options_schema = options_schema.extend(
+                {
+                    vol.Required(
+                        CONF_ENTITY_PROFILE, default=config.get(CONF_ENTITY_PROFILE, ENTITY_PROFILE_FULL)
+                    ): vol.In(ENTITY_PROFILE_OPTIONS),
+                    vol.Optional(
+                        CONF_ENTITY_METRICS, default=list(config.get(CONF_ENTITY_METRICS, []))
+                    ): cv.multi_select(PRICE_METRIC_OPTIONS),
+                }
+            )
+
+        # Ordered mempool API mirrors, hedged against each other (mempool.space when empty)
+        if sensor_type in (SENSOR_TYPE_BTC_NETWORK, SENSOR_TYPE_BTC_MEMPOOL):
+            options_schema = options_schema.extend(
+                {
+                    vol.Optional(CONF_MEMPOOL_MIRRORS, default=entry.options.get(CONF_MEMPOOL_MIRRORS, "")): cv.string,
+                }
+            )
+
+        # Refresh profiling and loop lag watchdog (dumped in diagnostics), off by default
+        options_schema = options_schema.extend(
+            {
+                vol.Optional(CONF_PROFILING, default=entry.options.get(CONF_PROFILING, False)): cv.boolean,
+                vol.Optional(CONF_LOOP_WATCHDOG, default=entry.options.get(CONF_LOOP_WATCHDOG, False)): cv.boolean,
+            }
+        )
+
+        info = "Configure update intervals for this sensor."
+        if sensor_type == SENSOR_TYPE_PRICE:
+            info += f"\n\n{budget_summary(self.hass, entry.options.get(CONF_API_KEY))}"
+
         return self.async_show_form(
             step_id="init",
             data_schema=options_schema,
             errors=errors,
-            description_placeholders={"info": "Configure update intervals for this sensor."},
+            description_placeholders={"info": info},
         )
+
+    async def _async_validate_api_key(self, user_input: dict[str, Any], errors: dict[str, str]) -> dict[str, Any]:
+        """Check the CoinGecko key against its plan; the public plan keeps no key."""
+        plan = user_input.get(CONF_API_PLAN, API_PLAN_PUBLIC)
+        api_key = (user_input.get(CONF_API_KEY) or "").strip()
+        if plan == API_PLAN_PUBLIC:
+            return {key: value for key, value in user_input.items() if key != CONF_API_KEY}
+        if not api_key:
+            errors[CONF_API_KEY] = "api_key_required"
+            return user_input
+        api = CoinGeckoAPI(self.hass)
+        api.configure(api_key, plan)
+        try:
+            if not await api.async_validate_api_key():
+                errors[CONF_API_KEY] = "invalid_api_key"
+        except CryptoInfoError:
+            errors["base"] = "cannot_connect"
+        return {**user_input, CONF_API_KEY: api_key}
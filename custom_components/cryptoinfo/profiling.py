@@ -0,0 +1,193 @@
+"""Opt-in refresh profiling for the coordinators.
+
+With the ``profiling`` option on, every coordinator refresh is timed phase by
+phase: ``rate_limit_wait`` (sleeping in the CoinGecko limiter), ``network``
+(request until the body is read), ``decode`` (JSON decoding / HTML extraction),
+``transform`` (shaping API payloads into coordinator data) and ``fan_out``
+(entity listeners called after the refresh). The last ``PROFILE_WINDOW``
+refreshes are kept and dumped in diagnostics.
+
+API clients mark phases with ``profile_phase()``, which finds the refresh being
+profiled through a context variable, so nothing has to be threaded through the
+call chain; with profiling off it costs one ``ContextVar.get``. Nested phases are
+exclusive (decoding inside a network phase is not counted as network), but
+phases of concurrent requests (mempool gathers several endpoints) overlap, so
+their sum may exceed the refresh duration. Phases are also reported to the loop
+lag watchdog (``watchdog.py``) of the refresh, when it runs one.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from contextlib import AbstractContextManager, nullcontext
+from contextvars import ContextVar, Token
+from datetime import UTC, datetime
+import time
+from types import TracebackType
+from typing import Any
+
+from .watchdog import LoopWatchdog, current_watchdog
+
+# Number of refreshes kept per coordinator.
+PROFILE_WINDOW = 50
+
+PHASES: tuple[str, ...] = ("rate_limit_wait", "network", "decode", "transform", "fan_out")
+
+_NO_PROFILE: AbstractContextManager[None] = nullcontext()
+
+
+class RefreshProfile:
+    """Timings of one coordinator refresh."""
+
+    __slots__ = ("duration", "phases", "started", "success")
+
+    def __init__(self) -> None:
+        """Initialize an empty profile."""
+        self.started = datetime.now(UTC)
+        self.duration = 0.0
+        self.success = True
+        self.phases: dict[str, float] = {}
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Add ``seconds`` to ``phase``."""
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable snapshot."""
+        return {
+            "started": self.started.isoformat(),
+            "success": self.success,
+            "duration_ms": round(self.duration * 1000, 2),
+            "phases_ms": {phase: round(seconds * 1000, 2) for phase, seconds in self.phases.items()},
+        }
+
+
+_current_profile: ContextVar[RefreshProfile | None] = ContextVar("cryptoinfo_refresh_profile", default=None)
+_current_phase: ContextVar[_PhaseTimer | None] = ContextVar("cryptoinfo_refresh_phase", default=None)
+
+
+class _PhaseTimer:
+    """Time one phase, pausing the enclosing phase of the same task meanwhile."""
+
+    __slots__ = ("_outer", "_phase", "_profile", "_started", "_token", "_watchdog")
+
+    def __init__(self, profile: RefreshProfile, phase: str, watchdog: LoopWatchdog | None = None) -> None:
+        self._profile = profile
+        self._phase = phase
+        self._watchdog = watchdog
+        self._started = 0.0
+        self._outer: _PhaseTimer | None = None
+        self._token: Token[_PhaseTimer | None] | None = None
+
+    def __enter__(self) -> None:
+        now = time.perf_counter()
+        self._outer = _current_phase.get()
+        if self._outer is not None:
+            self._outer.pause(now)
+        self._token = _current_phase.set(self)
+        self._started = now
+        if self._watchdog is not None:
+            self._watchdog.enter_stage(self._phase)
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if self._watchdog is not None:
+            self._watchdog.exit_stage(self._phase)
+        now = time.perf_counter()
+        self.pause(now)
+        if self._token is not None:
+            _current_phase.reset(self._token)
+        if self._outer is not None:
+            self._outer.resume(now)
+
+    def pause(self, now: float) -> None:
+        self._profile.add(self._phase, now - self._started)
+        self._started = now
+
+    def resume(self, now: float) -> None:
+        self._started = now
+
+
+def profile_phase(phase: str) -> AbstractContextManager[None]:
+    """Return a context manager timing ``phase`` of the refresh being profiled, if any."""
+    profile = _current_profile.get()
+    watchdog = current_watchdog()
+    if profile is None:
+        return _NO_PROFILE if watchdog is None else watchdog.watch(phase)
+    return _PhaseTimer(profile, phase, watchdog)
+
+
+class _RefreshTimer:
+    """Profile one refresh and publish it as the current profile meanwhile."""
+
+    __slots__ = ("_profile", "_profiler", "_started", "_token")
+
+    def __init__(self, profiler: RefreshProfiler) -> None:
+        self._profiler = profiler
+        self._profile = RefreshProfile()
+        self._started = 0.0
+        self._token: Token[RefreshProfile | None] | None = None
+
+    def __enter__(self) -> None:
+        self._token = _current_profile.set(self._profile)
+        self._started = time.perf_counter()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._profile.duration = time.perf_counter() - self._started
+        self._profile.success = exc_type is None
+        if self._token is not None:
+            _current_profile.reset(self._token)
+        self._profiler.profiles.append(self._profile)
+
+
+class RefreshProfiler:
+    """Rolling window of refresh profiles for one coordinator."""
+
+    __slots__ = ("enabled", "profiles")
+
+    def __init__(self, enabled: bool = False) -> None:
+        """Initialize the profiler."""
+        self.enabled = enabled
+        self.profiles: deque[RefreshProfile] = deque(maxlen=PROFILE_WINDOW)
+
+    def refresh(self) -> AbstractContextManager[None]:
+        """Return a context manager profiling one ``_async_update_data`` call."""
+        if not self.enabled:
+            return _NO_PROFILE
+        return _RefreshTimer(self)
+
+    def fan_out(self) -> AbstractContextManager[None]:
+        """Return a context manager timing the listener fan-out of the last refresh."""
+        if not self.enabled or not self.profiles:
+            return _NO_PROFILE
+        return _PhaseTimer(self.profiles[-1], "fan_out")
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the window and per-phase mean/max, in milliseconds."""
+        summary: dict[str, dict[str, float]] = {}
+        for phase in ("duration", *PHASES):
+            values = [
+                profile.duration if phase == "duration" else profile.phases[phase]
+                for profile in self.profiles
+                if phase == "duration" or phase in profile.phases
+            ]
+            if values:
+                summary[phase] = {
+                    "mean_ms": round(sum(values) / len(values) * 1000, 2),
+                    "max_ms": round(max(values) * 1000, 2),
+                }
+        return {
+            "enabled": self.enabled,
+            "window": len(self.profiles),
+            "summary": summary,
+            "refreshes": [profile.as_dict() for profile in self.profiles],
+        }
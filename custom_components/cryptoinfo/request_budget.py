@@ -0,0 +1,184 @@
+"""CoinGecko request budget shared by the price entries.
+
+Each price entry polls on its own update interval, but CoinGecko counts the
+requests of all of them against one limit: the public API's per-IP limit, or
+the plan of the API key. The entries using the same key (or no key) share a
+``RequestBudget``, which plans their refresh intervals so the total stays within
+``BUDGET_HEADROOM`` of the plan's rate, leaving the rest for the config flow and
+retries.
+
+When the requested intervals fit, they are used unchanged. When they do not,
+intervals are stretched with weighted max-min fairness, the weight of an entry
+being its requests per refresh: entries polling slower than the fair share keep
+their interval, the others are stretched to one common interval. The plan is
+recomputed whenever an entry is added, removed or changed.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import timedelta
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+from .api.coingecko_api import API_PLANS, RATE_LIMIT_PERIOD
+from .const import API_PLAN_PUBLIC, DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .api.coingecko_api import CoinGeckoAPI
+    from .coordinator import CryptoDataCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Share of the plan's rate planned for scheduled refreshes.
+BUDGET_HEADROOM = 0.8
+
+_DATA_KEY = f"{DOMAIN}_request_budgets"
+
+
+def plan_intervals(capacity: float, demands: Sequence[tuple[int, float]]) -> list[float]:
+    """Return the planned interval (seconds) of each ``(requests per refresh, interval)`` demand.
+
+    ``capacity`` is in requests per second. Requested intervals are kept when
+    their total rate fits; otherwise the capacity is water-filled, weighted by
+    requests per refresh, so every stretched demand ends up on the same interval.
+    """
+    rates = [requests / interval for requests, interval in demands]
+    if sum(rates) <= capacity:
+        return [interval for _, interval in demands]
+    allocated = list(rates)
+    remaining = capacity
+    active = set(range(len(demands)))
+    while active:
+        level = remaining / sum(demands[index][0] for index in active)
+        # Demands below their weighted share keep their rate; the rest is shared again.
+        satisfied = {index for index in active if rates[index] <= level * demands[index][0]}
+        if not satisfied:
+            for index in active:
+                allocated[index] = level * demands[index][0]
+            break
+        remaining -= sum(rates[index] for index in satisfied)
+        active -= satisfied
+    return [requests / rate for (requests, _), rate in zip(demands, allocated, strict=True)]
+
+
+class RequestBudget:
+    """Refresh plan of the price entries sharing one CoinGecko limit."""
+
+    __slots__ = ("_hass", "_members", "key")
+
+    def __init__(self, hass: HomeAssistant, key: str) -> None:
+        """Initialize the budget of the entries using ``key`` (empty: public API)."""
+        self._hass = hass
+        self.key = key
+        self._members: list[CryptoDataCoordinator] = []
+
+    @property
+    def plan(self) -> str:
+        """Return the plan of the members (public when there are none)."""
+        plans = [member.api.plan for member in self._members]
+        # Members sharing a key share its plan; keep the tightest if they disagree.
+        return min(plans, key=lambda plan: API_PLANS[plan].rate_limit_calls, default=API_PLAN_PUBLIC)
+
+    @property
+    def capacity(self) -> float:
+        """Return the requests per second planned for refreshes."""
+        return API_PLANS[self.plan].rate_limit_calls / RATE_LIMIT_PERIOD * BUDGET_HEADROOM
+
+    @staticmethod
+    def _demand(member: CryptoDataCoordinator) -> tuple[int, float]:
+        """Return a member's requests per refresh and requested interval, spaced by its client."""
+        requests = member.requests_per_refresh()
+        interval = member.requested_interval.total_seconds()
+        return requests, max(interval, requests * member.api.min_request_interval, 1.0)
+
+    def demand(self) -> float:
+        """Return the requests per second the requested intervals would need."""
+        return sum(requests / interval for requests, interval in map(self._demand, self._members))
+
+    @callback
+    def async_register(self, member: CryptoDataCoordinator) -> CALLBACK_TYPE:
+        """Plan ``member`` with the budget; return the unregister callback."""
+        self._members.append(member)
+        member.budget = self
+        self.async_plan()
+
+        @callback
+        def _unregister() -> None:
+            self._members.remove(member)
+            if self._members:
+                self.async_plan()
+            elif self._hass.data.get(_DATA_KEY, {}).get(self.key) is self:
+                del self._hass.data[_DATA_KEY][self.key]
+
+        return _unregister
+
+    @callback
+    def async_plan(self) -> None:
+        """Recompute the plan and apply it to the members' update intervals."""
+        demands = [self._demand(member) for member in self._members]
+        intervals = plan_intervals(self.capacity, demands)
+        for member, (_, wanted), seconds in zip(self._members, demands, intervals, strict=True):
+            if seconds > wanted:
+                _LOGGER.info(
+                    "CoinGecko budget exceeded, %s refreshes every %s instead of %s",
+                    member.name,
+                    timedelta(seconds=round(seconds)),
+                    member.requested_interval,
+                )
+            interval = max(timedelta(seconds=seconds), member.requested_interval)
+            # Applies from the member's next refresh, which schedules the one after it.
+            member.update_interval = interval
+
+    def summary(self) -> str:
+        """Return a one-line description of the budget for the config and options flows."""
+        limit = API_PLANS[self.plan].rate_limit_calls
+        capacity = self.capacity * 60
+        demand = self.demand() * 60
+        text = (
+            f"CoinGecko {self.plan} plan ({limit} calls/min, {capacity:.0f} planned for refreshes): "
+            f"{len(self._members)} price entries request {demand:.1f} calls/min."
+        )
+        if demand > capacity:
+            text += " Update intervals are stretched to fit."
+        return text
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable snapshot (the key is not included)."""
+        return {
+            "plan": self.plan,
+            "rate_limit_calls": API_PLANS[self.plan].rate_limit_calls,
+            "capacity_per_minute": round(self.capacity * 60, 2),
+            "demand_per_minute": round(self.demand() * 60, 2),
+            "oversubscribed": self.demand() > self.capacity,
+            "entries": [
+                {
+                    "name": member.name,
+                    "requests_per_refresh": member.requests_per_refresh(),
+                    "requested_interval": str(member.requested_interval),
+                    "planned_interval": str(member.update_interval),
+                }
+                for member in self._members
+            ],
+        }
+
+
+def request_budget(hass: HomeAssistant, api: CoinGeckoAPI) -> RequestBudget:
+    """Return the budget of ``api``'s key, creating it on first use."""
+    budgets: dict[str, RequestBudget] = hass.data.setdefault(_DATA_KEY, {})
+    key = api.api_key or ""
+    if (budget := budgets.get(key)) is None:
+        budget = budgets[key] = RequestBudget(hass, key)
+    return budget
+
+
+def budget_summary(hass: HomeAssistant, api_key: str | None = None) -> str:
+    """Return the summary of the budget of ``api_key`` (public API by default)."""
+    budget: RequestBudget | None = hass.data.get(_DATA_KEY, {}).get(api_key or "")
+    if budget is None:
+        budget = RequestBudget(hass, api_key or "")
+    return budget.summary()
@@ -7,35 +7,49 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.core import callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
+    API_PLAN_PUBLIC,
     ATTR_CRYPTOCURRENCY_ID,
     ATTR_CRYPTOCURRENCY_NAME,
     ATTR_CRYPTOCURRENCY_SYMBOL,
     ATTR_CURRENCY_NAME,
     ATTR_IMAGE,
+    ATTR_LAST_UPDATE,
     ATTR_MULTIPLIER,
+    CONF_API_KEY,
+    CONF_API_PLAN,
     CONF_CRYPTOCURRENCY_IDS,
     CONF_CURRENCY_NAME,
+    CONF_ENTITY_METRICS,
+    CONF_ENTITY_PROFILE,
     CONF_ID,
+    CONF_LOOP_WATCHDOG,
     CONF_MIN_TIME_BETWEEN_REQUESTS,
-    CONF_MULTIPLIERS,
+    CONF_PROFILING,
     CONF_SENSOR_TYPE,
     CONF_UNIT_OF_MEASUREMENT,
     CONF_UPDATE_FREQUENCY,
     DOMAIN,
+    ENTITY_PROFILE_FULL,
+    SENSOR_PREFIX,
     SENSOR_TYPE_BTC_MEMPOOL,
     SENSOR_TYPE_BTC_NETWORK,
     SENSOR_TYPE_CKPOOL_MINING,
     SENSOR_TYPE_PRICE,
 )
 from .coordinator import CryptoDataCoordinator
-from .helpers import build_price_unique_id
+from .diagnostic_sensor import limiter_sensors, telemetry_sensors
+from .helpers import build_price_unique_id, parse_watchlist
+from .request_budget import request_budget
 from .sensor_descriptions import (
     PRICE_DESCRIPTIONS,
     CryptoSensorEntityDescription,
+    price_descriptions,
     resolve_price_unit,
 )
 
@@ -77,12 +91,13 @@ async def async_setup_entry(
     cryptocurrency_ids = config.get(CONF_CRYPTOCURRENCY_IDS, "").lower().strip()
     currency_name = config.get(CONF_CURRENCY_NAME, "").strip()
     unit_of_measurement = (config.get(CONF_UNIT_OF_MEASUREMENT) or "").strip()
-    multipliers = config.get(CONF_MULTIPLIERS, "1").strip()
     update_frequency = timedelta(minutes=float(config.get(CONF_UPDATE_FREQUENCY, 5)))
     min_time = float(config.get(CONF_MIN_TIME_BETWEEN_REQUESTS, shared.min_time_between_requests))
 
     # Apply the (shared) minimum delay between CoinGecko requests.
     shared.api.min_request_interval = min_time * 60
+    # Key and throughput of the CoinGecko plan (public API without a key).
+    shared.api.configure(config.get(CONF_API_KEY), config.get(CONF_API_PLAN, API_PLAN_PUBLIC))
 
     coordinator = CryptoDataCoordinator(
         hass,
@@ -91,16 +106,20 @@ async def async_setup_entry(
         currency_name,
         update_frequency,
         id_name,
+        config_entry=entry,
+        profiling=bool(config.get(CONF_PROFILING, False)),
+        loop_watchdog=bool(config.get(CONF_LOOP_WATCHDOG, False)),
     )
 
+    # Plan the refresh interval within the CoinGecko budget shared with the other entries
+    entry.async_on_unload(request_budget(hass, shared.api).async_register(coordinator))
+
     # Store coordinator in runtime_data
     entry.runtime_data.coordinator = coordinator
     entry.runtime_data.coordinators[entry.entry_id] = coordinator
 
     # Create entities
-    crypto_list = [crypto.strip() for crypto in cryptocurrency_ids.split(",") if crypto.strip()]
-    multipliers_list = [mult.strip() for mult in multipliers.split(",")]
-
+    crypto_list, multipliers_list = parse_watchlist(config)
     if len(crypto_list) != len(multipliers_list):
         _LOGGER.error(
             "Length mismatch: %d cryptocurrencies but %d multipliers",
@@ -109,31 +128,28 @@ async def async_setup_entry(
         )
         return
 
-    entities: list[SensorEntity] = []
-    for i, crypto_id in enumerate(crypto_list):
-        entities.append(
-            CryptoinfoSensor(
-                coordinator=coordinator,
-                cryptocurrency_id=crypto_id,
-                currency_name=currency_name,
-                unit_of_measurement=unit_of_measurement,
-                multiplier=multipliers_list[i],
-                id_name=id_name,
-            )
-        )
-        base_unique_id = build_price_unique_id(id_name, crypto_id, currency_name)
-        for description in PRICE_DESCRIPTIONS:
-            entities.append(
-                CryptoinfoDerivedSensor(
-                    coordinator=coordinator,
-                    description=description,
-                    cryptocurrency_id=crypto_id,
-                    currency_name=currency_name,
-                    unit_of_measurement=unit_of_measurement,
-                    base_unique_id=base_unique_id,
-                    id_name=id_name,
-                )
-            )
+    # Metric entities of the entry's profile (entries without one keep every metric)
+    descriptions = price_descriptions(
+        config.get(CONF_ENTITY_PROFILE, ENTITY_PROFILE_FULL), config.get(CONF_ENTITY_METRICS, ())
+    )
+
+    # Coin sensors are added and removed by the watchlist when the coin list is reconfigured
+    watchlist = PriceWatchlist(
+        hass, coordinator, async_add_entities, descriptions, currency_name, unit_of_measurement, id_name
+    )
+    entry.runtime_data.watchlist = watchlist
+    watchlist.async_remove_excluded(crypto_list)
+    entities: list[SensorEntity] = watchlist.build(crypto_list, multipliers_list)
+
+    diagnostic_base = f"{SENSOR_PREFIX}{id_name or 'default'}".lower().replace(" ", "_")
+    device_info = DeviceInfo(
+        identifiers={(DOMAIN, f"cryptoinfo_{id_name or 'default'}")},
+        name=f"Cryptoinfo {id_name or 'Wallet'}",
+        manufacturer="CoinGecko",
+        model="Cryptocurrency Tracker",
+    )
+    entities.extend(telemetry_sensors(coordinator, shared.api.telemetry, diagnostic_base, device_info))
+    entities.extend(limiter_sensors(shared.api, diagnostic_base, device_info))
 
     async_add_entities(entities)
 
@@ -145,6 +161,108 @@ async def async_setup_entry(
     )
 
 
+class PriceWatchlist:
+    """Add and remove the price and metric sensors of a price entry's coins.
+
+    Reconfiguring the coin list is diffed by coin id: sensors of added coins are
+    created, those of dropped coins are deleted from the entity registry and the
+    multipliers of kept coins are updated in place. The coordinator keeps running
+    and only its id set changes, so an edit costs the affected coins' entities
+    instead of reloading the entry.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: CryptoDataCoordinator,
+        async_add_entities: AddEntitiesCallback,
+        descriptions: tuple[CryptoSensorEntityDescription, ...],
+        currency_name: str,
+        unit_of_measurement: str,
+        id_name: str,
+    ) -> None:
+        """Initialize the watchlist with the metric descriptions created per coin."""
+        self._hass = hass
+        self._coordinator = coordinator
+        self._async_add_entities = async_add_entities
+        self._descriptions = descriptions
+        self._currency_name = currency_name
+        self._unit_of_measurement = unit_of_measurement
+        self._id_name = id_name
+        self.entities: dict[str, list[SensorEntity]] = {}
+
+    def build(self, crypto_ids: list[str], multipliers: list[str]) -> list[SensorEntity]:
+        """Create (and track) the sensors of ``crypto_ids`` not tracked yet."""
+        entities: list[SensorEntity] = []
+        for crypto_id, multiplier in zip(crypto_ids, multipliers, strict=True):
+            if crypto_id in self.entities:
+                continue
+            sensors: list[SensorEntity] = [
+                CryptoinfoSensor(
+                    coordinator=self._coordinator,
+                    cryptocurrency_id=crypto_id,
+                    currency_name=self._currency_name,
+                    unit_of_measurement=self._unit_of_measurement,
+                    multiplier=multiplier,
+                    id_name=self._id_name,
+                )
+            ]
+            base_unique_id = build_price_unique_id(self._id_name, crypto_id, self._currency_name)
+            sensors.extend(
+                CryptoinfoDerivedSensor(
+                    coordinator=self._coordinator,
+                    description=description,
+                    cryptocurrency_id=crypto_id,
+                    currency_name=self._currency_name,
+                    unit_of_measurement=self._unit_of_measurement,
+                    base_unique_id=base_unique_id,
+                    id_name=self._id_name,
+                )
+                for description in self._descriptions
+            )
+            self.entities[crypto_id] = sensors
+            entities.extend(sensors)
+        return entities
+
+    @callback
+    def async_remove_excluded(self, crypto_ids: list[str]) -> None:
+        """Delete the registry entries of metrics the entry's profile no longer creates."""
+        registry = er.async_get(self._hass)
+        keys = {description.key for description in self._descriptions}
+        for crypto_id in crypto_ids:
+            base_unique_id = build_price_unique_id(self._id_name, crypto_id, self._currency_name)
+            for description in PRICE_DESCRIPTIONS:
+                if description.key in keys:
+                    continue
+                unique_id = f"{base_unique_id}_{description.key}"
+                if entity_id := registry.async_get_entity_id("sensor", DOMAIN, unique_id):
+                    registry.async_remove(entity_id)
+
+    @callback
+    def async_update(self, crypto_ids: list[str], multipliers: list[str]) -> None:
+        """Reconcile the sensors and the coordinator with a reconfigured coin list."""
+        self._coordinator.async_set_cryptocurrency_ids(", ".join(crypto_ids))
+
+        registry = er.async_get(self._hass)
+        for crypto_id in self.entities.keys() - set(crypto_ids):
+            for sensor in self.entities.pop(crypto_id):
+                # The reconfigure flow may already have removed the registry entry.
+                if sensor.entity_id and registry.async_get(sensor.entity_id) is not None:
+                    registry.async_remove(sensor.entity_id)
+                elif sensor.hass is not None:
+                    self._hass.async_create_task(sensor.async_remove())
+
+        for crypto_id, multiplier in zip(crypto_ids, multipliers, strict=True):
+            for sensor in self.entities.get(crypto_id, ()):
+                if isinstance(sensor, CryptoinfoSensor) and sensor.multiplier != multiplier:
+                    sensor.multiplier = multiplier
+                    if sensor.hass is not None:
+                        sensor.async_write_ha_state()
+
+        if added := self.build(crypto_ids, multipliers):
+            self._async_add_entities(added)
+
+
 class CryptoinfoSensor(CoordinatorEntity[CryptoDataCoordinator], SensorEntity):
     """Cryptocurrency price sensor."""
 
@@ -187,6 +305,12 @@ class CryptoinfoSensor(CoordinatorEntity[CryptoDataCoordinator], SensorEntity):
             model="Cryptocurrency Tracker",
         )
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when this coin's market data changed."""
+        if self.coordinator.coin_changed(self.cryptocurrency_id):
+            super()._handle_coordinator_update()
+
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
@@ -221,6 +345,7 @@ class CryptoinfoSensor(CoordinatorEntity[CryptoDataCoordinator], SensorEntity):
                 ATTR_CURRENCY_NAME: self.currency_name,
                 ATTR_MULTIPLIER: self.multiplier,
                 ATTR_IMAGE: None,
+                ATTR_LAST_UPDATE: None,
             }
         return {
             ATTR_CRYPTOCURRENCY_ID: self.cryptocurrency_id,
@@ -229,6 +354,7 @@ class CryptoinfoSensor(CoordinatorEntity[CryptoDataCoordinator], SensorEntity):
             ATTR_CURRENCY_NAME: self.currency_name,
             ATTR_MULTIPLIER: self.multiplier,
             ATTR_IMAGE: data.get("image"),
+            ATTR_LAST_UPDATE: data.get("last_updated"),
         }
 
 
@@ -267,6 +393,12 @@ class CryptoinfoDerivedSensor(CoordinatorEntity[CryptoDataCoordinator], SensorEn
             model="Cryptocurrency Tracker",
         )
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when this coin's market data changed."""
+        if self.coordinator.coin_changed(self.cryptocurrency_id):
+            super()._handle_coordinator_update()
+
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
@@ -2,19 +2,37 @@
 
 Frozen + kw_only is mandatory for EntityDescription subclasses since HA 2025.1.
 Each description carries a ``value_fn`` mapping a raw API record to the sensor
-state, so the platform files stay free of business logic.
+state, so the platform files stay free of business logic. Price descriptions also
+list the record fields their ``value_fn`` reads (``source_fields``) so the
+coordinator only requests and keeps what enabled entities actually use. Entity
+profiles (``PRICE_PROFILES``) pick which price descriptions are created per coin.
 """
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from dataclasses import dataclass
-from typing import Any
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import (
+    SensorDeviceClass,
     SensorEntityDescription,
     SensorStateClass,
 )
+from homeassistant.const import EntityCategory, UnitOfTime
+
+from .const import (
+    ENTITY_PROFILE_CUSTOM,
+    ENTITY_PROFILE_FULL,
+    ENTITY_PROFILE_MINIMAL,
+    ENTITY_PROFILE_STANDARD,
+)
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from .api.coingecko_api import CoinGeckoAPI
+    from .api.telemetry import RequestTelemetry
 
 # Price sensor unit marker: the currency symbol configured by the user.
 UNIT_PRICE = "price_unit"
@@ -25,6 +43,21 @@ class CryptoSensorEntityDescription(SensorEntityDescription):
     """Description for a Cryptoinfo sensor with a value extractor."""
 
     value_fn: Callable[[dict[str, Any]], Any] = lambda data: None
+    source_fields: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True, kw_only=True)
+class TelemetrySensorEntityDescription(SensorEntityDescription):
+    """Description for a diagnostic sensor reading an API client's request telemetry."""
+
+    value_fn: Callable[[RequestTelemetry], float | int | None]
+
+
+@dataclass(frozen=True, kw_only=True)
+class LimiterSensorEntityDescription(SensorEntityDescription):
+    """Description for a diagnostic sensor reading the CoinGecko limiter state."""
+
+    value_fn: Callable[[CoinGeckoAPI], datetime | int | str | None]
 
 
 PRICE_DESCRIPTIONS: tuple[CryptoSensorEntityDescription, ...] = (
@@ -34,6 +67,7 @@ PRICE_DESCRIPTIONS: tuple[CryptoSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UNIT_PRICE,
         value_fn=lambda data: data.get("market_cap"),
+        source_fields=("market_cap",),
     ),
     CryptoSensorEntityDescription(
         key="volume_24h",
@@ -41,6 +75,7 @@ PRICE_DESCRIPTIONS: tuple[CryptoSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UNIT_PRICE,
         value_fn=lambda data: data.get("total_volume"),
+        source_fields=("total_volume",),
     ),
     CryptoSensorEntityDescription(
         key="change_1h",
@@ -49,6 +84,7 @@ PRICE_DESCRIPTIONS: tuple[CryptoSensorEntityDescription, ...] = (
         native_unit_of_measurement="%",
         suggested_display_precision=2,
         value_fn=lambda data: data.get("price_change_percentage_1h_in_currency"),
+        source_fields=("price_change_percentage_1h_in_currency",),
     ),
     CryptoSensorEntityDescription(
         key="change_24h",
@@ -57,6 +93,7 @@ PRICE_DESCRIPTIONS: tuple[CryptoSensorEntityDescription, ...] = (
         native_unit_of_measurement="%",
         suggested_display_precision=2,
         value_fn=lambda data: data.get("price_change_percentage_24h_in_currency"),
+        source_fields=("price_change_percentage_24h_in_currency",),
     ),
     CryptoSensorEntityDescription(
         key="change_7d",
@@ -65,6 +102,7 @@ PRICE_DESCRIPTIONS: tuple[CryptoSensorEntityDescription, ...] = (
         native_unit_of_measurement="%",
         suggested_display_precision=2,
         value_fn=lambda data: data.get("price_change_percentage_7d_in_currency"),
+        source_fields=("price_change_percentage_7d_in_currency",),
     ),
     CryptoSensorEntityDescription(
         key="change_14d",
@@ -73,6 +111,7 @@ PRICE_DESCRIPTIONS: tuple[CryptoSensorEntityDescription, ...] = (
         native_unit_of_measurement="%",
         suggested_display_precision=2,
         value_fn=lambda data: data.get("price_change_percentage_14d_in_currency"),
+        source_fields=("price_change_percentage_14d_in_currency",),
     ),
     CryptoSensorEntityDescription(
         key="change_30d",
@@ -81,6 +120,7 @@ PRICE_DESCRIPTIONS: tuple[CryptoSensorEntityDescription, ...] = (
         native_unit_of_measurement="%",
         suggested_display_precision=2,
         value_fn=lambda data: data.get("price_change_percentage_30d_in_currency"),
+        source_fields=("price_change_percentage_30d_in_currency",),
     ),
     CryptoSensorEntityDescription(
         key="change_1y",
@@ -89,18 +129,23 @@ PRICE_DESCRIPTIONS: tuple[CryptoSensorEntityDescription, ...] = (
         native_unit_of_measurement="%",
         suggested_display_precision=2,
         value_fn=lambda data: data.get("price_change_percentage_1y_in_currency"),
+        source_fields=("price_change_percentage_1y_in_currency",),
     ),
     CryptoSensorEntityDescription(
         key="circulating_supply",
         translation_key="crypto_circulating_supply",
         state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
         value_fn=lambda data: data.get("circulating_supply"),
+        source_fields=("circulating_supply",),
     ),
     CryptoSensorEntityDescription(
         key="total_supply",
         translation_key="crypto_total_supply",
         state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
         value_fn=lambda data: data.get("total_supply"),
+        source_fields=("total_supply",),
     ),
     CryptoSensorEntityDescription(
         key="ath",
@@ -109,6 +154,7 @@ PRICE_DESCRIPTIONS: tuple[CryptoSensorEntityDescription, ...] = (
         native_unit_of_measurement=UNIT_PRICE,
         suggested_display_precision=2,
         value_fn=lambda data: data.get("ath"),
+        source_fields=("ath",),
     ),
     CryptoSensorEntityDescription(
         key="ath_change",
@@ -117,15 +163,46 @@ PRICE_DESCRIPTIONS: tuple[CryptoSensorEntityDescription, ...] = (
         native_unit_of_measurement="%",
         suggested_display_precision=2,
         value_fn=lambda data: data.get("ath_change_percentage"),
+        source_fields=("ath_change_percentage",),
     ),
     CryptoSensorEntityDescription(
         key="rank",
         translation_key="crypto_rank",
         state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
         value_fn=lambda data: data.get("market_cap_rank"),
+        source_fields=("market_cap_rank",),
     ),
 )
 
+# Metric keys created per coin by each entity profile (the price sensor is always created).
+PRICE_PROFILES: dict[str, tuple[str, ...]] = {
+    ENTITY_PROFILE_MINIMAL: ("change_24h",),
+    ENTITY_PROFILE_STANDARD: ("market_cap", "volume_24h", "change_1h", "change_24h", "change_7d", "change_30d"),
+    ENTITY_PROFILE_FULL: tuple(description.key for description in PRICE_DESCRIPTIONS),
+}
+
+
+def price_descriptions(profile: str, metrics: Iterable[str] = ()) -> tuple[CryptoSensorEntityDescription, ...]:
+    """Return the metric descriptions instantiated per coin by ``profile``.
+
+    A custom profile creates the ``metrics`` listed, enabled even when the
+    description is disabled by default since they were picked explicitly.
+    """
+    if profile == ENTITY_PROFILE_CUSTOM:
+        keys = set(metrics)
+        return tuple(
+            replace(description, entity_registry_enabled_default=True)
+            for description in PRICE_DESCRIPTIONS
+            if description.key in keys
+        )
+    keys = set(PRICE_PROFILES.get(profile, PRICE_PROFILES[ENTITY_PROFILE_FULL]))
+    return tuple(description for description in PRICE_DESCRIPTIONS if description.key in keys)
+
+
+# Record fields always kept for the main price sensor (state + identity attributes).
+PRICE_RECORD_FIELDS: tuple[str, ...] = ("id", "symbol", "name", "image", "current_price", "last_updated")
+
 MINING_NETWORK_DESCRIPTIONS: tuple[CryptoSensorEntityDescription, ...] = (
     CryptoSensorEntityDescription(
         key="difficulty",
@@ -271,6 +348,110 @@ CKPOOL_DESCRIPTIONS: tuple[CryptoSensorEntityDescription, ...] = (
 )
 
 
+# Per-worker CKPool sensors; ``value_fn`` reads one entry of ``worker_stats``.
+CKPOOL_WORKER_DESCRIPTIONS: tuple[CryptoSensorEntityDescription, ...] = (
+    CryptoSensorEntityDescription(
+        key="hashrate",
+        translation_key="ckpool_worker_hashrate",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement="GH/s",
+        suggested_display_precision=2,
+        value_fn=lambda worker: worker.get("hashrate"),
+    ),
+    CryptoSensorEntityDescription(
+        key="last_share",
+        translation_key="ckpool_worker_last_share",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=lambda worker: worker.get("last_share"),
+    ),
+)
+
+# Optional diagnostic sensors on each entry's API client (disabled by default).
+TELEMETRY_DESCRIPTIONS: tuple[TelemetrySensorEntityDescription, ...] = (
+    TelemetrySensorEntityDescription(
+        key="api_requests",
+        translation_key="api_requests",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda telemetry: telemetry.requests,
+    ),
+    TelemetrySensorEntityDescription(
+        key="api_errors",
+        translation_key="api_errors",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda telemetry: telemetry.errors,
+    ),
+    TelemetrySensorEntityDescription(
+        key="api_rate_limited",
+        translation_key="api_rate_limited",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda telemetry: telemetry.rate_limited,
+    ),
+    TelemetrySensorEntityDescription(
+        key="api_latency",
+        translation_key="api_latency",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=0,
+        value_fn=lambda telemetry: telemetry.latency_mean_ms,
+    ),
+)
+
+
+# Rate limiter and circuit breaker state of the CoinGecko client (disabled by default).
+LIMITER_DESCRIPTIONS: tuple[LimiterSensorEntityDescription, ...] = (
+    LimiterSensorEntityDescription(
+        key="rate_limit_calls",
+        translation_key="rate_limit_calls",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda api: api.calls_in_window(),
+    ),
+    LimiterSensorEntityDescription(
+        key="rate_limit_remaining",
+        translation_key="rate_limit_remaining",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda api: api.rate_budget_remaining(),
+    ),
+    LimiterSensorEntityDescription(
+        key="rate_limit_queued",
+        translation_key="rate_limit_queued",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda api: api.queued_requests,
+    ),
+    LimiterSensorEntityDescription(
+        key="circuit_breaker",
+        translation_key="circuit_breaker",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        device_class=SensorDeviceClass.ENUM,
+        options=["closed", "open"],
+        value_fn=lambda api: "open" if api.circuit_open else "closed",
+    ),
+    LimiterSensorEntityDescription(
+        key="next_request_allowed",
+        translation_key="next_request_allowed",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=lambda api: api.next_request_allowed(),
+    ),
+)
+
+
 def resolve_price_unit(description: CryptoSensorEntityDescription, unit: str) -> str | None:
     """Return the real unit string, replacing the UNIT_PRICE marker when needed."""
     if description.native_unit_of_measurement == UNIT_PRICE:
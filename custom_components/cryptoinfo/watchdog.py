@@ -0,0 +1,168 @@
+"""Opt-in event-loop lag watchdog for the coordinators.
+
+With the ``loop_watchdog`` option on, a probe callback is scheduled every
+``PROBE_INTERVAL`` seconds while a coordinator refresh or its entity fan-out is
+running, and how late it fires is the loop lag. Lag is also checked when a stage
+starts or ends, so a stage that blocks the loop and returns before the probe
+could run is still caught and blamed. Stages are the coordinator ``update`` and
+``fan_out`` plus the phases API clients mark with ``profile_phase()`` (decode,
+transform, ...); lag is blamed on the most recently entered stage still running.
+
+Lag above ``LOOP_LAG_THRESHOLD`` is logged with the stage; the worst lag and the
+last slow events are dumped in diagnostics. Nothing is scheduled outside a
+refresh, and with the option off ``watch()`` returns a shared no-op context.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from contextlib import AbstractContextManager, nullcontext
+from contextvars import ContextVar, Token
+from datetime import UTC, datetime
+import logging
+from types import TracebackType
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+# Lag (seconds) above which a stage is reported; asyncio's slow callback threshold.
+LOOP_LAG_THRESHOLD = 0.1
+# Probe period while a refresh is running.
+PROBE_INTERVAL = 0.05
+# Number of slow events kept per coordinator.
+SLOW_EVENT_WINDOW = 20
+
+_NO_WATCH: AbstractContextManager[None] = nullcontext()
+
+_current_watchdog: ContextVar[LoopWatchdog | None] = ContextVar("cryptoinfo_loop_watchdog", default=None)
+
+
+def current_watchdog() -> LoopWatchdog | None:
+    """Return the watchdog of the refresh running in this context, if any."""
+    return _current_watchdog.get()
+
+
+class _StageWatch:
+    """Watch one stage and publish the watchdog to nested phases meanwhile."""
+
+    __slots__ = ("_stage", "_token", "_watchdog")
+
+    def __init__(self, watchdog: LoopWatchdog, stage: str) -> None:
+        self._watchdog = watchdog
+        self._stage = stage
+        self._token: Token[LoopWatchdog | None] | None = None
+
+    def __enter__(self) -> None:
+        self._token = _current_watchdog.set(self._watchdog)
+        self._watchdog.enter_stage(self._stage)
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._watchdog.exit_stage(self._stage)
+        if self._token is not None:
+            _current_watchdog.reset(self._token)
+
+
+class LoopWatchdog:
+    """Event-loop lag measured around one coordinator's refreshes."""
+
+    __slots__ = (
+        "_expected",
+        "_handle",
+        "_stages",
+        "checks",
+        "enabled",
+        "events",
+        "name",
+        "threshold",
+        "worst_at",
+        "worst_lag",
+        "worst_stage",
+    )
+
+    def __init__(self, name: str, enabled: bool = False, threshold: float = LOOP_LAG_THRESHOLD) -> None:
+        """Initialize the watchdog."""
+        self.name = name
+        self.enabled = enabled
+        self.threshold = threshold
+        self.checks = 0
+        self.worst_lag = 0.0
+        self.worst_stage: str | None = None
+        self.worst_at: datetime | None = None
+        self.events: deque[dict[str, Any]] = deque(maxlen=SLOW_EVENT_WINDOW)
+        self._stages: list[str] = []
+        self._handle: asyncio.TimerHandle | None = None
+        self._expected = 0.0
+
+    def watch(self, stage: str) -> AbstractContextManager[None]:
+        """Return a context manager watching ``stage``."""
+        if not self.enabled:
+            return _NO_WATCH
+        return _StageWatch(self, stage)
+
+    def enter_stage(self, stage: str) -> None:
+        """Start watching ``stage``; lag so far is blamed on the enclosing stage."""
+        loop = asyncio.get_running_loop()
+        if self._handle is None:
+            self._schedule(loop, loop.time())
+        else:
+            self._check(loop)
+        self._stages.append(stage)
+
+    def exit_stage(self, stage: str) -> None:
+        """Stop watching ``stage``; lag so far is blamed on it."""
+        loop = asyncio.get_running_loop()
+        self._check(loop)
+        # Stages of concurrent requests may end out of order: drop the latest match.
+        for index in range(len(self._stages) - 1, -1, -1):
+            if self._stages[index] == stage:
+                del self._stages[index]
+                break
+        if not self._stages and self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _schedule(self, loop: asyncio.AbstractEventLoop, now: float) -> None:
+        self._expected = now + PROBE_INTERVAL
+        self._handle = loop.call_at(self._expected, self._probe, loop)
+
+    def _probe(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._handle = None
+        self._check(loop)
+
+    def _check(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Record the lag of an overdue probe and schedule the next one."""
+        now = loop.time()
+        lag = now - self._expected
+        if lag < 0:
+            return
+        self.checks += 1
+        stage = self._stages[-1] if self._stages else "update"
+        if lag > self.worst_lag:
+            self.worst_lag = lag
+            self.worst_stage = stage
+            self.worst_at = datetime.now(UTC)
+        if lag > self.threshold:
+            self.events.append({"stage": stage, "lag_ms": round(lag * 1000, 1), "at": datetime.now(UTC).isoformat()})
+            _LOGGER.warning("%s blocked the event loop for %.0f ms during %s", self.name, lag * 1000, stage)
+        if self._handle is not None:
+            self._handle.cancel()
+        if self._stages:
+            self._schedule(loop, now)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable snapshot."""
+        return {
+            "enabled": self.enabled,
+            "threshold_ms": round(self.threshold * 1000, 1),
+            "checks": self.checks,
+            "worst_lag_ms": round(self.worst_lag * 1000, 1),
+            "worst_stage": self.worst_stage,
+            "worst_at": self.worst_at.isoformat() if self.worst_at else None,
+            "slow_events": list(self.events),
+        }
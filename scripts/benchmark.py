@@ -0,0 +1,349 @@
+"""Micro-benchmarks for the integration's hot paths.
+
+Runs each benchmark on recorded fixtures (``tests/fixtures``), reports the best
+per-operation time over several rounds and compares it with the baseline stored
+in ``scripts/benchmark_baseline.json``.
+
+    scripts/benchmark                  # run and compare with the baseline
+    scripts/benchmark --check          # exit 1 when a benchmark regressed, or a fast
+                                       # path (COMPARISONS) is slower than the one it replaces
+    scripts/benchmark --save           # record the current numbers as baseline
+    scripts/benchmark --only html      # run benchmarks whose name contains "html"
+
+Timings depend on the machine: refresh the baseline with ``--save`` on the
+machine that runs ``--check`` and keep the tolerance generous (default 1.5x).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+import json
+from pathlib import Path
+import platform
+import re
+import sys
+import time
+from types import SimpleNamespace
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from custom_components.cryptoinfo.api.blockchain_api import CKPoolAPI  # noqa: E402
+from custom_components.cryptoinfo.api.coin_index import CoinIndex, parse_coin_list  # noqa: E402
+from custom_components.cryptoinfo.api.coingecko_api import SIMPLE_PRICE_BATCH_SIZE, CoinGeckoAPI  # noqa: E402
+from custom_components.cryptoinfo.api.json_codec import json_loads, json_loads_stdlib  # noqa: E402
+from custom_components.cryptoinfo.helpers import records_by_id  # noqa: E402
+from custom_components.cryptoinfo.sensor import CryptoinfoDerivedSensor  # noqa: E402
+from custom_components.cryptoinfo.sensor_descriptions import (  # noqa: E402
+    PRICE_DESCRIPTIONS,
+    PRICE_RECORD_FIELDS,
+)
+
+FIXTURES = ROOT / "tests" / "fixtures"
+BASELINE = Path(__file__).with_name("benchmark_baseline.json")
+DEFAULT_TOLERANCE = 1.5
+
+# /coins/list is ~15k entries; the 50-coin fixture is replicated to that size.
+COIN_LIST_FACTOR = 300
+# A full /coins/markets page is 250 records.
+MARKETS_RECORDS = 250
+DERIVED_COINS = 100
+# Size of the padded CKPool page, close to what the EU front-end serves.
+LARGE_HTML_BYTES = 200_000
+
+Benchmark = Callable[[], Any]
+
+# Fast paths that must not be slower than the path they replace (beyond the tolerance).
+COMPARISONS = {
+    "json_decode_simple_price": "json_decode_simple_price_stdlib",
+    "json_decode_markets": "json_decode_markets_stdlib",
+    "extract_json_from_html": "extract_json_from_html_multi_search",
+    "extract_json_from_html_large": "extract_json_from_html_large_multi_search",
+}
+
+
+def _fixture(name: str) -> bytes:
+    return (FIXTURES / name).read_bytes()
+
+
+def _markets_records(count: int) -> list[dict[str, Any]]:
+    template: list[dict[str, Any]] = json.loads(_fixture("coins_markets.json"))
+    return [template[i % len(template)] | {"id": f"coin-{i}"} for i in range(count)]
+
+
+def _simple_price_body(count: int) -> bytes:
+    """Return a /simple/price body for ``count`` coins, every include_* flag set."""
+    records = _markets_records(count)
+    return json.dumps(
+        {
+            record["id"]: {
+                "usd": record["current_price"],
+                "usd_market_cap": record["market_cap"],
+                "usd_24h_vol": record["total_volume"],
+                "usd_24h_change": record["price_change_percentage_24h"],
+                "last_updated_at": 1760000000,
+            }
+            for record in records
+        }
+    ).encode()
+
+
+def bench_coin_list_search() -> Benchmark:
+    """Substring search over a ~15k coin index, limit 100."""
+    records = json.loads(_fixture("coins_list.json")) * COIN_LIST_FACTOR
+    index = CoinIndex.from_records(
+        {"id": f"{record['id']}-{i}", "symbol": record["symbol"], "name": record["name"]}
+        for i, record in enumerate(records)
+    )
+    return lambda: index.search("bit", limit=100)
+
+
+def bench_coin_list_search_miss() -> Benchmark:
+    """Search that matches nothing, i.e. a full scan of the index."""
+    records = json.loads(_fixture("coins_list.json")) * COIN_LIST_FACTOR
+    index = CoinIndex.from_records(records)
+    return lambda: index.search("no-such-coin-anywhere", limit=100)
+
+
+def bench_parse_coin_list() -> Benchmark:
+    """Build the coin index from a ~15k entry /coins/list body, as get_coin_list does."""
+    records = json.loads(_fixture("coins_list.json")) * COIN_LIST_FACTOR
+    raw = json.dumps([record | {"id": f"{record['id']}-{i}"} for i, record in enumerate(records)]).encode()
+    return lambda: parse_coin_list(raw)
+
+
+def bench_check_rate_limit() -> Benchmark:
+    """One pass of the sliding-window limiter with a half-full window."""
+    api = CoinGeckoAPI(None)  # type: ignore[arg-type]
+    loop = asyncio.new_event_loop()
+    now = datetime.now(UTC)
+    window = [now - timedelta(seconds=50 - i) for i in range(5)]
+
+    def run() -> None:
+        api._request_timestamps = list(window)
+        loop.run_until_complete(api._check_rate_limit())
+
+    return run
+
+
+def bench_markets_transform() -> Benchmark:
+    """Decode a 250-record markets page and key it by coin id, projected."""
+    raw = json.dumps(_markets_records(MARKETS_RECORDS)).encode()
+    fields = frozenset((*PRICE_RECORD_FIELDS, "market_cap", "total_volume", "price_change_percentage_24h_in_currency"))
+    return lambda: records_by_id(json_loads(raw), fields)
+
+
+def bench_json_decode_simple_price() -> Benchmark:
+    """Decode a full-batch /simple/price body with the integration's decoder."""
+    raw = _simple_price_body(SIMPLE_PRICE_BATCH_SIZE)
+    return lambda: json_loads(raw)
+
+
+def bench_json_decode_simple_price_stdlib() -> Benchmark:
+    """Decode the same body with the stdlib decoder."""
+    raw = _simple_price_body(SIMPLE_PRICE_BATCH_SIZE)
+    return lambda: json_loads_stdlib(raw)
+
+
+def bench_json_decode_markets() -> Benchmark:
+    """Decode a 250-record markets page with the integration's decoder."""
+    raw = json.dumps(_markets_records(MARKETS_RECORDS)).encode()
+    return lambda: json_loads(raw)
+
+
+def bench_json_decode_markets_stdlib() -> Benchmark:
+    """Decode the same page with the stdlib decoder."""
+    raw = json.dumps(_markets_records(MARKETS_RECORDS)).encode()
+    return lambda: json_loads_stdlib(raw)
+
+
+def bench_derived_native_value() -> Benchmark:
+    """native_value of every derived sensor for 100 coins."""
+    data = {record["id"]: record for record in _markets_records(DERIVED_COINS)}
+    coordinator = SimpleNamespace(data=data, last_update_success=True)
+    sensors = [
+        CryptoinfoDerivedSensor(
+            coordinator=coordinator,  # type: ignore[arg-type]
+            description=description,
+            cryptocurrency_id=coin_id,
+            currency_name="usd",
+            unit_of_measurement="$",
+            base_unique_id=f"cryptoinfo_bench_{coin_id}_usd",
+            id_name="bench",
+        )
+        for coin_id in data
+        for description in PRICE_DESCRIPTIONS
+    ]
+    return lambda: [sensor.native_value for sensor in sensors]
+
+
+def _ckpool_html(size: int | None = None) -> str:
+    html = _fixture("ckpool_eu_user.html").decode()
+    if size is None or len(html) >= size:
+        return html
+    # Pad with markup ahead of the data script, as a busier page would.
+    head, tail = html.split("<script>", 1)
+    row = '<div class="flex rounded-lg border p-4 text-sm"><span class="tabular-nums">0.12345678</span></div>'
+    padding = row * ((size - len(html)) // len(row) + 1)
+    return f"{head}{padding}<script>{tail}"
+
+
+def _extract_multi_search(html: str) -> dict[str, Any] | None:
+    """Extract like the former extractor did: one regex scan of the page per field."""
+    hashrate1m = re.search(r'\\"hashrate1m\\":\\"(\d+)\\"', html)
+    hashrate1hr = re.search(r'\\"hashrate1hr\\":\\"(\d+)\\"', html)
+    hashrate1d = re.search(r'\\"hashrate1d\\":\\"(\d+)\\"', html)
+    workers_match = re.search(r'\\"workers\\":\[([^\]]+)\]', html)
+    workers_count = len(re.findall(r'\\"id\\"', workers_match.group(1))) if workers_match else 0
+    best_share = re.search(r'\\"bestShare\\":(\d+\.?\d*)', html)
+    best_ever = re.search(r'\\"bestEver\\":\\"(\d+)', html)
+    if not hashrate1m:
+        return None
+    return {
+        "hashrate1m": int(hashrate1m.group(1)),
+        "hashrate1hr": int(hashrate1hr.group(1)) if hashrate1hr else 0,
+        "hashrate1d": int(hashrate1d.group(1)) if hashrate1d else 0,
+        "workers": workers_count,
+        "bestshare": float(best_share.group(1)) if best_share else 0,
+        "bestever": float(best_ever.group(1)) if best_ever else 0,
+    }
+
+
+def bench_extract_json_from_html() -> Benchmark:
+    """Extract from the CKPool EU Next.js page (recorded fixture, ~16 KB)."""
+    api = CKPoolAPI(None)  # type: ignore[arg-type]
+    html = _ckpool_html()
+    return lambda: api._extract_json_from_html(html)
+
+
+def bench_extract_json_from_html_large() -> Benchmark:
+    """Extract from the same page padded to ~200 KB."""
+    api = CKPoolAPI(None)  # type: ignore[arg-type]
+    html = _ckpool_html(LARGE_HTML_BYTES)
+    return lambda: api._extract_json_from_html(html)
+
+
+def bench_extract_json_from_html_multi_search() -> Benchmark:
+    """Extract from the recorded page with the former per-field regex scans."""
+    html = _ckpool_html()
+    return lambda: _extract_multi_search(html)
+
+
+def bench_extract_json_from_html_large_multi_search() -> Benchmark:
+    """Extract from the ~200 KB page with the former per-field regex scans."""
+    html = _ckpool_html(LARGE_HTML_BYTES)
+    return lambda: _extract_multi_search(html)
+
+
+BENCHMARKS: dict[str, Callable[[], Benchmark]] = {
+    "coin_list_search": bench_coin_list_search,
+    "coin_list_search_miss": bench_coin_list_search_miss,
+    "parse_coin_list": bench_parse_coin_list,
+    "check_rate_limit": bench_check_rate_limit,
+    "markets_transform": bench_markets_transform,
+    "json_decode_simple_price": bench_json_decode_simple_price,
+    "json_decode_simple_price_stdlib": bench_json_decode_simple_price_stdlib,
+    "json_decode_markets": bench_json_decode_markets,
+    "json_decode_markets_stdlib": bench_json_decode_markets_stdlib,
+    "derived_native_value": bench_derived_native_value,
+    "extract_json_from_html": bench_extract_json_from_html,
+    "extract_json_from_html_large": bench_extract_json_from_html_large,
+    "extract_json_from_html_multi_search": bench_extract_json_from_html_multi_search,
+    "extract_json_from_html_large_multi_search": bench_extract_json_from_html_large_multi_search,
+}
+
+
+def measure(func: Benchmark, rounds: int, min_time: float) -> float:
+    """Return the best per-call time (seconds) over ``rounds`` timed batches."""
+    # Calibrate the batch size so each round lasts at least ``min_time``.
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2
+    best = elapsed / number
+    for _ in range(rounds - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def _format(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.2f} {unit}"
+    return f"{seconds / 1e-9:8.2f} ns"
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmarks; return the process exit code."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--save", action="store_true", help="store the results as the new baseline")
+    parser.add_argument("--check", action="store_true", help="exit 1 if a benchmark is slower than the baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="allowed slowdown factor")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05, help="minimum duration of a round (seconds)")
+    parser.add_argument("--only", default="", help="run benchmarks whose name contains this string")
+    args = parser.parse_args(argv)
+
+    baseline: dict[str, float] = {}
+    if BASELINE.exists():
+        baseline = json.loads(BASELINE.read_text())["results"]
+
+    results: dict[str, float] = {}
+    regressions: list[str] = []
+    print(f"{'benchmark':42} {'per call':>12} {'baseline':>12} {'ratio':>7}")  # noqa: T201
+    for name, factory in BENCHMARKS.items():
+        if args.only not in name:
+            continue
+        results[name] = seconds = measure(factory(), args.rounds, args.min_time)
+        reference = baseline.get(name)
+        ratio = seconds / reference if reference else None
+        flag = ""
+        if ratio is not None and ratio > args.tolerance:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(  # noqa: T201
+            f"{name:42} {_format(seconds):>12} "
+            f"{_format(reference) if reference else '-':>12} "
+            f"{f'{ratio:.2f}x' if ratio is not None else '-':>7}{flag}"
+        )
+
+    for name, replaced in COMPARISONS.items():
+        if name in results and replaced in results and results[name] > results[replaced] * args.tolerance:
+            regressions.append(f"{name} (vs {replaced})")
+            print(f"{name} is {results[name] / results[replaced]:.2f}x slower than {replaced}")  # noqa: T201
+
+    if args.save:
+        saved = baseline | results
+        BASELINE.write_text(
+            json.dumps(
+                {
+                    "python": platform.python_version(),
+                    "machine": platform.machine(),
+                    "results": {name: saved[name] for name in BENCHMARKS if name in saved},
+                },
+                indent=2,
+            )
+            + "\n"
+        )
+        print(f"Baseline written to {BASELINE.relative_to(ROOT)}")  # noqa: T201
+
+    if args.check and regressions:
+        print(f"Regressed (> {args.tolerance}x baseline): {', '.join(regressions)}")  # noqa: T201
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Generator
+from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, patch
 
@@ -31,12 +32,29 @@ from custom_components.cryptoinfo.const import (
 
 MEMPOOL_SPACE_API = "https://mempool.space/api"
 
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def load_fixture(name: str) -> bytes:
+    """Return the raw bytes of a recorded API payload under tests/fixtures."""
+    return (FIXTURES_DIR / name).read_bytes()
+
 
 @pytest.fixture(autouse=True)
 def auto_enable_custom_integrations(enable_custom_integrations: Any) -> None:
     """Enable loading of custom integrations in all tests."""
 
 
+@pytest.fixture
+def aioclient_mock(aioclient_mock: AiohttpClientMocker) -> Generator[AiohttpClientMocker]:
+    """Serve the dedicated provider sessions from the mocker as well."""
+    with patch(
+        "custom_components.cryptoinfo.api.sessions.create_session",
+        side_effect=lambda hass, _provider, _trace: aioclient_mock.create_session(hass.loop),
+    ):
+        yield aioclient_mock
+
+
 @pytest.fixture
 def no_sleep() -> Generator[None]:
     """Skip retry/backoff sleeps in the API helpers to keep tests fast."""
@@ -70,6 +88,7 @@ MARKETS_RESPONSE: list[dict[str, Any]] = [
         "ath": 69000,
         "ath_date": "2021-11-10T00:00:00.000Z",
         "ath_change_percentage": -27.0,
+        "last_updated": "2024-01-01T00:00:00.000Z",
     },
 ]
 
@@ -0,0 +1,354 @@
+"""Local stand-in for the providers used by Cryptoinfo, for load and soak tests.
+
+Serves CoinGecko, mempool.space and both CKPool front-ends (global JSON API and
+the EU Next.js page) from one aiohttp application, with injectable faults:
+latency and jitter, a CoinGecko rate limit answering 429 with ``Retry-After``,
+bursts of 5xx and slow (chunked) bodies. Payloads are synthesised from the
+fixtures under ``tests/fixtures``, for any coin id or address, and prices move a
+little on every request so coordinators see real changes.
+
+    python -m tests.mock_providers --port 8765 --latency 0.2 --rate-limit 30 --error-rate 0.02
+
+then run Home Assistant in-process inside ``redirect_providers(base_url)``, which
+points the API clients at the stand-in (a pytest fixture or a soak script).
+Network and mempool entries of a regular instance can use it as a mirror
+(option ``mempool_mirrors`` = ``http://127.0.0.1:8765/mempool/api``).
+
+Faults can be changed while running (``POST /_mock/config`` with a JSON object of
+``FaultConfig`` fields) and request volume is read from ``GET /_mock/stats``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter, deque
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import ExitStack, contextmanager
+from dataclasses import asdict, dataclass, fields
+from datetime import UTC, datetime
+import json
+from pathlib import Path
+import random
+import time
+from typing import Any
+from unittest.mock import patch
+
+from aiohttp import web
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+COINGECKO_PREFIX = "/coingecko/api/v3"
+MEMPOOL_PREFIX = "/mempool/api"
+CKPOOL_PREFIX = "/ckpool"
+CONTROL_PREFIX = "/_mock"
+
+# Body chunk size when a slow body is injected.
+SLOW_BODY_CHUNK = 1024
+
+Handler = Callable[[web.Request], Awaitable[web.StreamResponse]]
+
+
+@dataclass
+class FaultConfig:
+    """Faults applied to provider routes (control routes are never faulted)."""
+
+    latency: float = 0.0  # seconds added before every response
+    jitter: float = 0.0  # extra uniform random delay, up to this many seconds
+    rate_limit: int = 0  # CoinGecko calls per minute before 429 (0 disables)
+    retry_after: int = 60  # Retry-After seconds sent with a 429
+    error_rate: float = 0.0  # probability that a request starts a 5xx burst
+    error_burst: int = 1  # consecutive 5xx responses per burst
+    error_status: int = 503
+    slow_body: float = 0.0  # seconds over which each body is trickled out
+
+    def update(self, values: dict[str, Any]) -> None:
+        """Update known fields from ``values``, coercing to the field type."""
+        for item in fields(self):
+            if item.name in values:
+                setattr(self, item.name, type(getattr(self, item.name))(values[item.name]))
+
+
+class MockProviders:
+    """State of the mock server: fault configuration, payload templates and counters."""
+
+    def __init__(self, faults: FaultConfig | None = None, seed: int | None = None) -> None:
+        """Initialize the server state."""
+        self.faults = faults or FaultConfig()
+        self._random = random.Random(seed)  # noqa: S311 - fault injection, not cryptography
+        self._markets: list[dict[str, Any]] = json.loads((FIXTURES_DIR / "coins_markets.json").read_bytes())
+        self._coin_list = (FIXTURES_DIR / "coins_list.json").read_bytes()
+        self._ckpool_html = (FIXTURES_DIR / "ckpool_eu_user.html").read_text()
+        self._coingecko_calls: deque[float] = deque()
+        self._burst_remaining = 0
+        self._started = time.monotonic()
+        self.requests: Counter[str] = Counter()
+        self.statuses: Counter[int] = Counter()
+        self.bytes_sent = 0
+
+    # =========================================================================
+    # APPLICATION
+    # =========================================================================
+
+    def application(self) -> web.Application:
+        """Return the aiohttp application serving every provider."""
+        app = web.Application(middlewares=[self._faults_middleware])
+        app.add_routes(
+            [
+                web.get(f"{COINGECKO_PREFIX}/coins/markets", self._coins_markets),
+                web.get(f"{COINGECKO_PREFIX}/coins/list", self._coins_list),
+                web.get(f"{COINGECKO_PREFIX}/simple/price", self._simple_price),
+                web.get(f"{MEMPOOL_PREFIX}/v1/mining/hashrate/3d", self._hashrate),
+                web.get(f"{MEMPOOL_PREFIX}/blocks/tip/height", self._tip_height),
+                web.get(f"{MEMPOOL_PREFIX}/v1/difficulty-adjustment", self._difficulty),
+                web.get(f"{MEMPOOL_PREFIX}/mempool", self._mempool),
+                web.get(f"{MEMPOOL_PREFIX}/v1/fees/recommended", self._fees),
+                web.get(CKPOOL_PREFIX + "/{pool}/users/{address}", self._ckpool_user),
+                web.get(f"{CONTROL_PREFIX}/config", self._get_config),
+                web.post(f"{CONTROL_PREFIX}/config", self._set_config),
+                web.get(f"{CONTROL_PREFIX}/stats", self._get_stats),
+            ]
+        )
+        return app
+
+    @web.middleware
+    async def _faults_middleware(self, request: web.Request, handler: Handler) -> web.StreamResponse:
+        """Count the request and apply latency, rate limit, 5xx bursts and slow bodies."""
+        if request.path.startswith(CONTROL_PREFIX):
+            return await handler(request)
+
+        route = request.match_info.route.resource.canonical if request.match_info.route.resource else "unknown"
+        self.requests[route] += 1
+        faults = self.faults
+
+        delay = faults.latency + (self._random.uniform(0, faults.jitter) if faults.jitter else 0.0)
+        if delay:
+            await asyncio.sleep(delay)
+
+        if request.path.startswith(COINGECKO_PREFIX) and self._rate_limited():
+            response = web.json_response(
+                {"status": {"error_code": 429, "error_message": "You've exceeded the Rate Limit."}},
+                status=429,
+                headers={"Retry-After": str(faults.retry_after)},
+            )
+        elif self._server_error():
+            response = web.Response(status=faults.error_status, text="Service Unavailable")
+        else:
+            response = await handler(request)
+
+        self.statuses[response.status] += 1
+        if faults.slow_body and isinstance(response, web.Response) and response.body:
+            return await self._trickle(request, response)
+        if isinstance(response, web.Response) and response.body:
+            self.bytes_sent += len(response.body)  # type: ignore[arg-type]
+        return response
+
+    def _rate_limited(self) -> bool:
+        """Return True when the call exceeds the per-minute CoinGecko budget."""
+        if not self.faults.rate_limit:
+            return False
+        now = time.monotonic()
+        while self._coingecko_calls and now - self._coingecko_calls[0] >= 60:
+            self._coingecko_calls.popleft()
+        if len(self._coingecko_calls) >= self.faults.rate_limit:
+            return True
+        self._coingecko_calls.append(now)
+        return False
+
+    def _server_error(self) -> bool:
+        """Return True while a 5xx burst is running, possibly starting a new one."""
+        if self._burst_remaining:
+            self._burst_remaining -= 1
+            return True
+        if self.faults.error_rate and self._random.random() < self.faults.error_rate:
+            self._burst_remaining = max(self.faults.error_burst - 1, 0)
+            return True
+        return False
+
+    async def _trickle(self, request: web.Request, response: web.Response) -> web.StreamResponse:
+        """Send ``response`` in chunks spread over ``slow_body`` seconds."""
+        body = bytes(response.body)  # type: ignore[arg-type]
+        stream = web.StreamResponse(status=response.status, headers=response.headers)
+        stream.content_type = response.content_type
+        await stream.prepare(request)
+        chunks = [body[i : i + SLOW_BODY_CHUNK] for i in range(0, len(body), SLOW_BODY_CHUNK)]
+        pause = self.faults.slow_body / len(chunks)
+        for chunk in chunks:
+            await stream.write(chunk)
+            self.bytes_sent += len(chunk)
+            await asyncio.sleep(pause)
+        await stream.write_eof()
+        return stream
+
+    # =========================================================================
+    # COINGECKO
+    # =========================================================================
+
+    def _market_record(self, index: int, coin_id: str | None = None) -> dict[str, Any]:
+        """Return a markets record derived from the fixture, with a moving price."""
+        template = self._markets[index % len(self._markets)]
+        price = template["current_price"] * (1 + self._random.uniform(-0.002, 0.002))
+        record = dict(template)
+        if coin_id is not None and coin_id != template["id"]:
+            record.update(id=coin_id, symbol=coin_id[:4], name=coin_id.replace("-", " ").title())
+        record.update(
+            current_price=round(price, 8),
+            market_cap_rank=index + 1,
+            last_updated=datetime.now(UTC).isoformat(timespec="milliseconds").replace("+00:00", "Z"),
+        )
+        return record
+
+    def _records_for(self, ids: str) -> list[dict[str, Any]]:
+        """Return one record per requested id; fixture coins keep their own template."""
+        known = {record["id"]: index for index, record in enumerate(self._markets)}
+        return [
+            self._market_record(known.get(coin_id, index), coin_id)
+            for index, coin_id in enumerate(coin_id for coin_id in ids.split(",") if coin_id)
+        ]
+
+    async def _coins_markets(self, request: web.Request) -> web.Response:
+        if ids := request.query.get("ids"):
+            return web.json_response(self._records_for(ids))
+        per_page = int(request.query.get("per_page", 100))
+        return web.json_response([self._market_record(index) for index in range(per_page)])
+
+    async def _coins_list(self, request: web.Request) -> web.Response:
+        return web.Response(body=self._coin_list, content_type="application/json")
+
+    async def _simple_price(self, request: web.Request) -> web.Response:
+        vs_currency = request.query.get("vs_currencies", "usd").split(",")[0]
+        flags = {
+            "include_market_cap": ("market_cap", f"{vs_currency}_market_cap"),
+            "include_24hr_vol": ("total_volume", f"{vs_currency}_24h_vol"),
+            "include_24hr_change": ("price_change_percentage_24h", f"{vs_currency}_24h_change"),
+        }
+        payload: dict[str, dict[str, Any]] = {}
+        for record in self._records_for(request.query.get("ids", "")):
+            entry = {vs_currency: record["current_price"]}
+            for flag, (field, key) in flags.items():
+                if request.query.get(flag) == "true":
+                    entry[key] = record.get(field)
+            if request.query.get("include_last_updated_at") == "true":
+                entry["last_updated_at"] = int(time.time())
+            payload[record["id"]] = entry
+        return web.json_response(payload)
+
+    # =========================================================================
+    # MEMPOOL.SPACE
+    # =========================================================================
+
+    async def _hashrate(self, request: web.Request) -> web.Response:
+        return web.json_response({"currentHashrate": 6.0e20 * self._random.uniform(0.95, 1.05)})
+
+    async def _tip_height(self, request: web.Request) -> web.Response:
+        # One block every ten minutes of uptime.
+        return web.Response(text=str(870_000 + int((time.monotonic() - self._started) // 600)))
+
+    async def _difficulty(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {
+                "difficulty": 1.0e14,
+                "nextRetargetHeight": 870_912,
+                "remainingBlocks": 912,
+                "difficultyChange": round(self._random.uniform(-3, 3), 2),
+            }
+        )
+
+    async def _mempool(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {"count": self._random.randint(5_000, 80_000), "vsize": self._random.randint(2_000_000, 90_000_000)}
+        )
+
+    async def _fees(self, request: web.Request) -> web.Response:
+        economy = self._random.randint(1, 5)
+        return web.json_response(
+            {
+                "fastestFee": economy + 15,
+                "halfHourFee": economy + 10,
+                "hourFee": economy + 5,
+                "economyFee": economy,
+                "minimumFee": 1,
+            }
+        )
+
+    # =========================================================================
+    # CKPOOL
+    # =========================================================================
+
+    async def _ckpool_user(self, request: web.Request) -> web.Response:
+        """Serve the EU Next.js page for ``eu*`` pools and the global JSON API otherwise."""
+        if request.match_info["pool"].startswith("eu"):
+            return web.Response(text=self._ckpool_html, content_type="text/html")
+        return web.json_response(
+            {
+                "hashrate1m": f"{self._random.uniform(2.5, 3.5):.2f}T",
+                "hashrate1hr": "3.05T",
+                "hashrate1d": "2.98T",
+                "workers": 2,
+                "bestshare": 1234567.891,
+                "bestever": 98765432,
+            }
+        )
+
+    # =========================================================================
+    # CONTROL
+    # =========================================================================
+
+    async def _get_config(self, request: web.Request) -> web.Response:
+        return web.json_response(asdict(self.faults))
+
+    async def _set_config(self, request: web.Request) -> web.Response:
+        try:
+            self.faults.update(await request.json())
+        except (TypeError, ValueError) as err:
+            return web.json_response({"error": str(err)}, status=400)
+        return web.json_response(asdict(self.faults))
+
+    async def _get_stats(self, request: web.Request) -> web.Response:
+        uptime = time.monotonic() - self._started
+        total = sum(self.requests.values())
+        return web.json_response(
+            {
+                "uptime_s": round(uptime, 1),
+                "requests": total,
+                "requests_per_minute": round(total / uptime * 60, 2) if uptime else 0.0,
+                "bytes_sent": self.bytes_sent,
+                "by_route": dict(self.requests),
+                "by_status": {str(status): count for status, count in self.statuses.items()},
+            }
+        )
+
+
+@contextmanager
+def redirect_providers(base_url: str) -> Iterator[None]:
+    """Point the integration's API clients at the stand-in served on ``base_url``."""
+    base_url = base_url.rstrip("/")
+    with ExitStack() as stack:
+        for target, url in (
+            ("custom_components.cryptoinfo.api.coingecko_api.API_ENDPOINT", f"{base_url}{COINGECKO_PREFIX}/"),
+            ("custom_components.cryptoinfo.api.coingecko_api.PRO_API_ENDPOINT", f"{base_url}{COINGECKO_PREFIX}/"),
+            ("custom_components.cryptoinfo.api.blockchain_api.MEMPOOL_SPACE_API", f"{base_url}{MEMPOOL_PREFIX}"),
+            ("custom_components.cryptoinfo.api.blockchain_api.CKPOOL_URL", f"{base_url}{CKPOOL_PREFIX}/{{pool}}"),
+        ):
+            stack.enter_context(patch(target, url))
+        yield
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the mock providers until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--seed", type=int, default=None, help="seed of the fault and price generator")
+    for item in fields(FaultConfig):
+        parser.add_argument(f"--{item.name.replace('_', '-')}", type=type(item.default), default=item.default)
+    args = parser.parse_args(argv)
+
+    faults = FaultConfig(**{item.name: getattr(args, item.name) for item in fields(FaultConfig)})
+    base = f"http://{args.host}:{args.port}"
+    print(f"Serving mock providers on {base} (redirect_providers({base!r}))")  # noqa: T201
+    web.run_app(MockProviders(faults, args.seed).application(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,16 +2,31 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+
+import aiohttp
 from homeassistant.core import HomeAssistant
 import pytest
-from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClientMocker
+from pytest_homeassistant_custom_component.test_util.aiohttp import (
+    AiohttpClientMocker,
+    AiohttpClientMockResponse,
+)
+from yarl import URL
 
+from custom_components.cryptoinfo.api import blockchain_api
 from custom_components.cryptoinfo.api.blockchain_api import (
+    CKPOOL_REPROBE_EVERY,
+    REGION_COOLDOWN,
+    REGION_UNHEALTHY_AFTER,
     BlockchainAPI,
     CKPoolAPI,
+    worker_name,
 )
+from custom_components.cryptoinfo.const import CKPOOL_REGION_AUTO
+from custom_components.cryptoinfo.exceptions import CryptoInfoConnectionError
 
-from .conftest import MEMPOOL_SPACE_API
+from .conftest import MEMPOOL_SPACE_API, load_fixture
 
 
 async def test_network_stats(hass: HomeAssistant, mock_mempool: AiohttpClientMocker) -> None:
@@ -54,6 +69,7 @@ async def test_ckpool_404_returns_empty(hass: HomeAssistant, aioclient_mock: Aio
         "best_ever": 0,
         "workers": 0,
         "blocks_found": 0,
+        "worker_stats": {},
     }
 
 
@@ -84,6 +100,67 @@ def test_extract_json_from_html_returns_none_on_garbage(hass: HomeAssistant) ->
     assert api._extract_json_from_html("<html>nothing useful</html>") is None
 
 
+def test_extract_json_from_recorded_page(hass: HomeAssistant) -> None:
+    """The recorded EU Next.js page (escaped JSON in a push script) is parsed."""
+    api = CKPoolAPI(hass)
+    data = api._extract_json_from_html(load_fixture("ckpool_eu_user.html").decode())
+    assert data is not None
+    assert data["hashrate1m"] == 1060000000000
+    assert data["workers"] == 6
+    assert data["bestshare"] == 1234567.891
+    assert data["bestever"] == 98765432.0
+    # Worker fields do not leak into the user's, and each worker gets its own.
+    assert [worker["workername"] for worker in data["worker"]] == [f"bc1qexampleaddress.rig{i}" for i in range(6)]
+    assert data["worker"][0]["hashrate1m"] == 534439589175
+    assert data["worker"][5]["bestever"] == 62502024.0
+    stats = api._parse_ckpool_data(data)["worker_stats"]
+    assert list(stats) == [f"rig{i}" for i in range(6)]
+    assert stats["rig0"]["hashrate"] == pytest.approx(534.439589175)
+
+
+@pytest.mark.parametrize(
+    ("workername", "expected"),
+    [("bc1qaddr.rig1", "rig1"), ("bc1qaddr.rig.a", "rig.a"), ("bc1qaddr", "default"), ("", None), (None, None)],
+)
+def test_worker_name(workername: object, expected: str | None) -> None:
+    """The rig part of a worker name is its entity name."""
+    assert worker_name(workername) == expected
+
+
+def test_extract_json_from_html_fields_after_workers(hass: HomeAssistant) -> None:
+    """User fields following the workers array are still the user's, first occurrence wins."""
+    html = (
+        '\\"hashrate1m\\":\\"5\\",\\"workers\\":[{\\"id\\":\\"a.w1\\",\\"hashrate1m\\":\\"3\\"}],'
+        '\\"bestShare\\":7.5,\\"bestShare\\":1.0,\\"bestEver\\":\\"9\\"'
+    )
+    data = CKPoolAPI(hass)._extract_json_from_html(html)
+    assert data is not None
+    assert (data["hashrate1m"], data["bestshare"], data["bestever"]) == (5, 7.5, 9)
+    assert data["worker"] == [{"workername": "a.w1", "hashrate1m": 3}]
+
+
+def test_extract_json_from_html_blob_split_over_pushes(hass: HomeAssistant) -> None:
+    """Workers ahead of the first hashrate1m or in a later push script are still found."""
+    html = (
+        '<div>padding</div><script>self.__next_f.push([1,"\\"workers\\":[{\\"id\\":\\"a.w1\\",'
+        '\\"hashrate1m\\":\\"3\\"},"])</script><script>self.__next_f.push([1,"{\\"id\\":\\"a.w2\\",'
+        '\\"hashrate1m\\":\\"4\\"}],\\"hashrate1m\\":\\"7\\",\\"bestEver\\":\\"9\\""])</script>'
+        '<script>self.__next_f.push([1,"\\"workers\\":[{\\"id\\":\\"other.w\\"}]"])</script>'
+    )
+    data = CKPoolAPI(hass)._extract_json_from_html(html)
+    assert data is not None
+    assert (data["hashrate1m"], data["bestever"], data["workers"]) == (7, 9, 2)
+    assert data["worker"] == [{"workername": "a.w1", "hashrate1m": 3}, {"workername": "a.w2", "hashrate1m": 4}]
+
+
+def test_extract_json_from_html_empty_workers(hass: HomeAssistant) -> None:
+    """An empty workers array does not turn later ids into workers."""
+    html = '\\"hashrate1m\\":\\"5\\",\\"workers\\":[],\\"pool\\":{\\"id\\":\\"eu\\"}'
+    data = CKPoolAPI(hass)._extract_json_from_html(html)
+    assert data is not None
+    assert (data["workers"], data["worker"]) == (0, [])
+
+
 @pytest.mark.parametrize(
     ("raw", "expected"),
     [
@@ -119,14 +196,18 @@ async def test_ckpool_unexpected_content_type(hass: HomeAssistant, aioclient_moc
 
 
 async def test_ckpool_circuit_breaker_open(hass: HomeAssistant) -> None:
-    """An open circuit breaker blocks CKPool requests."""
+    """An open circuit breaker blocks CKPool requests for its address only."""
     from custom_components.cryptoinfo.exceptions import CryptoInfoConnectionError
 
     api = CKPoolAPI(hass, "solo.ckpool.org")
     for _ in range(5):
-        api._record_failure()
+        api._record_failure("addr")
     with pytest.raises(CryptoInfoConnectionError):
         await api.get_user_stats("addr")
+    api._check_circuit_breaker("other")
+    assert api.open_circuits() == 1
+    api._record_success("addr")
+    assert api.open_circuits() == 0
 
 
 async def test_ckpool_connection_error(
@@ -152,6 +233,54 @@ async def test_ckpool_http_error(hass: HomeAssistant, aioclient_mock: AiohttpCli
         await api.get_user_stats("addr")
 
 
+async def test_ckpool_auto_region_fails_over(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker, no_sleep: None
+) -> None:
+    """In automatic mode a failing front-end is left for the other one, in the same call."""
+    aioclient_mock.get("https://eusolostats.ckpool.org/users/addr", status=503)
+    aioclient_mock.get(
+        "https://solo.ckpool.org/users/addr",
+        json={"hashrate1m": "2T", "workers": 1},
+        headers={"Content-Type": "application/json"},
+    )
+    api = CKPoolAPI(hass, CKPOOL_REGION_AUTO)
+    data = await api.get_user_stats("addr")
+    assert data is not None
+    assert data["hashrate"] == 2000.0
+    assert aioclient_mock.call_count == 2
+
+    # The failed region now ranks behind the one that answered.
+    assert await api.get_user_stats("addr") is not None
+    assert aioclient_mock.mock_calls[-1][1].host == "solo.ckpool.org"
+    state = api.region_state()
+    assert state is not None
+    assert state["eusolostats.ckpool.org"]["failures"] == 1
+    assert state["solo.ckpool.org"]["success_rate"] == 1.0
+    assert CKPoolAPI(hass, "solo.ckpool.org").region_state() is None
+
+
+def test_ckpool_auto_region_routing(hass: HomeAssistant) -> None:
+    """The fastest healthy region is picked; unhealthy regions cool down; the other is re-probed."""
+    api = CKPoolAPI(hass, CKPOOL_REGION_AUTO)
+    assert api.regions is not None
+    eu, world = api.regions["eusolostats.ckpool.org"], api.regions["solo.ckpool.org"]
+    eu.observe(0.8, 1.0)
+    world.observe(0.2, 2.0)
+    assert api._route([]) == "solo.ckpool.org"
+    assert api._route(["solo.ckpool.org"]) == "eusolostats.ckpool.org"
+
+    for _ in range(REGION_UNHEALTHY_AFTER):
+        world.observe(None, time.monotonic())
+    assert not world.healthy(time.monotonic())
+    assert api._route([]) == "eusolostats.ckpool.org"
+    assert world.healthy(time.monotonic() + REGION_COOLDOWN)
+
+    world.observe(0.2, time.monotonic())
+    eu.last_used = 0.0
+    routes = [api._route([]) for _ in range(CKPOOL_REPROBE_EVERY)]
+    assert routes.count("eusolostats.ckpool.org") == 1
+
+
 async def test_ckpool_html_unparsable(hass: HomeAssistant, aioclient_mock: AiohttpClientMocker) -> None:
     """HTML that cannot be parsed yields no data."""
     aioclient_mock.get(
@@ -222,6 +351,81 @@ async def test_network_bad_height(hass: HomeAssistant, aioclient_mock: AiohttpCl
     assert await api.get_network_stats() is None
 
 
+PRIMARY = "https://primary.example/api"
+MIRROR = "https://mirror.example/api"
+MEMPOOL_JSON = {"count": 10, "vsize": 1_000_000}
+
+
+async def test_hedged_request_on_slow_mirror(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A mirror slower than its hedge delay is hedged on the next one and the loser is cancelled."""
+    monkeypatch.setattr(blockchain_api, "HEDGE_DEFAULT_DELAY", 0.01)
+    cancelled = asyncio.Event()
+
+    async def hang(method: str, url: URL, data: object) -> AiohttpClientMockResponse:
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        raise AssertionError("unreachable")
+
+    aioclient_mock.get(f"{PRIMARY}/mempool", side_effect=hang)
+    aioclient_mock.get(f"{MIRROR}/mempool", json=MEMPOOL_JSON)
+    api = BlockchainAPI(hass, [PRIMARY, f"{MIRROR}/"])
+
+    assert await api._request("/mempool") == MEMPOOL_JSON
+    # The loser was cancelled and awaited before the request returned.
+    assert cancelled.is_set()
+    stats = api.telemetry.endpoint("mempool")
+    assert (stats.hedged, stats.hedge_wins, stats.retries) == (1, 1, 0)
+    assert api.mirror_state()["mirror_1"]["mempool"]["answered"] == 1
+
+
+async def test_hedged_request_fails_over_at_once(hass: HomeAssistant, aioclient_mock: AiohttpClientMocker) -> None:
+    """A failing mirror is hedged without waiting; a fast one is not hedged."""
+    aioclient_mock.get(f"{PRIMARY}/mempool", status=503)
+    aioclient_mock.get(f"{MIRROR}/mempool", json=MEMPOOL_JSON)
+    api = BlockchainAPI(hass, [PRIMARY, MIRROR])
+    assert await api._request("/mempool") == MEMPOOL_JSON
+    assert api.telemetry.endpoint("mempool").hedge_wins == 1
+
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(f"{PRIMARY}/mempool", json=MEMPOOL_JSON)
+    assert await api._request("/mempool") == MEMPOOL_JSON
+    assert aioclient_mock.call_count == 1
+    assert api.telemetry.endpoint("mempool").hedged == 1
+
+
+async def test_hedged_request_all_mirrors_fail(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker, no_sleep: None
+) -> None:
+    """When every mirror fails the attempt fails, and retries start from the next mirror."""
+    aioclient_mock.get(f"{PRIMARY}/mempool", exc=aiohttp.ClientError())
+    aioclient_mock.get(f"{MIRROR}/mempool", exc=aiohttp.ClientError())
+    api = BlockchainAPI(hass, [PRIMARY, MIRROR])
+    with pytest.raises(CryptoInfoConnectionError):
+        await api._request("/mempool")
+    assert [call[1].host for call in aioclient_mock.mock_calls[:4]] == [
+        "primary.example",
+        "mirror.example",
+        "mirror.example",
+        "primary.example",
+    ]
+
+
+def test_hedge_delay_follows_p90(hass: HomeAssistant) -> None:
+    """The hedge delay is the mirror's p90 latency on the route once enough answers were seen."""
+    api = BlockchainAPI(hass, [PRIMARY, MIRROR])
+    assert api.hedge_delay(PRIMARY, "mempool") == blockchain_api.HEDGE_DEFAULT_DELAY
+    for _ in range(blockchain_api.HEDGE_MIN_SAMPLES):
+        api._mirror_stats(PRIMARY, "mempool").observe(0.2, 200, 0, failed=False)
+    assert api.hedge_delay(PRIMARY, "mempool") == 0.25
+    assert api.hedge_delay(MIRROR, "mempool") == blockchain_api.HEDGE_DEFAULT_DELAY
+    assert BlockchainAPI(hass).base_urls == (MEMPOOL_SPACE_API,)
+
+
 async def test_mempool_bad_data(hass: HomeAssistant, aioclient_mock: AiohttpClientMocker) -> None:
     """A malformed mempool payload is handled and returns None."""
     aioclient_mock.get(f"{MEMPOOL_SPACE_API}/mempool", json={"count": 10, "vsize": "oops"})
@@ -238,3 +442,15 @@ async def test_ckpool_timeout(hass: HomeAssistant, aioclient_mock: AiohttpClient
     aioclient_mock.get("https://solo.ckpool.org/users/addr", exc=TimeoutError())
     api = CKPoolAPI(hass, "solo.ckpool.org")
     assert await api.get_user_stats("addr") is None
+
+
+async def test_invalid_json_is_not_retried(hass: HomeAssistant, aioclient_mock: AiohttpClientMocker) -> None:
+    """An undecodable JSON body fails fast instead of being retried."""
+    aioclient_mock.get(f"{MEMPOOL_SPACE_API}/mempool", text="{oops")
+    aioclient_mock.get(
+        f"{MEMPOOL_SPACE_API}/v1/fees/recommended",
+        json={"fastestFee": 1, "halfHourFee": 1, "hourFee": 1, "economyFee": 1, "minimumFee": 1},
+    )
+    api = BlockchainAPI(hass)
+    assert await api.get_mempool_stats() is None
+    assert aioclient_mock.call_count == 2
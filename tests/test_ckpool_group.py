@@ -0,0 +1,166 @@
+"""Tests for the per-region CKPool polling group."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from typing import Any
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClientMocker
+
+from custom_components.cryptoinfo.api.blockchain_api import CIRCUIT_BREAKER_THRESHOLD, CKPoolAPI
+from custom_components.cryptoinfo.ckpool_group import _DATA_KEY, CKPOOL_MAX_CONCURRENCY, ckpool_group
+from custom_components.cryptoinfo.const import (
+    CONF_BTC_ADDRESS,
+    CONF_CKPOOL_REGION,
+    CONF_ID,
+    CONF_SENSOR_TYPE,
+    CONF_UPDATE_FREQUENCY,
+    DOMAIN,
+    SENSOR_TYPE_CKPOOL_MINING,
+)
+from custom_components.cryptoinfo.diagnostics import async_get_config_entry_diagnostics
+from custom_components.cryptoinfo.mining_sensor import CKPoolCoordinator
+
+SECOND_ADDRESS = "bc1qsecondaddress000000000000000000000000"
+
+
+async def test_group_fan_out_is_bounded(hass: HomeAssistant) -> None:
+    """A poll keeps at most CKPOOL_MAX_CONCURRENCY requests in flight and feeds every address."""
+    in_flight = peak = 0
+
+    async def get_user_stats(_api: CKPoolAPI, address: str, _deadline: object = None) -> dict[str, Any]:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return {"hashrate": float(address.removeprefix("addr"))}
+
+    members = [
+        CKPoolCoordinator(hass, f"addr{index}", "solo.ckpool.org", timedelta(minutes=5 + index)) for index in range(10)
+    ]
+    group = members[0].group
+    assert all(member.api is group.api for member in members)
+    unregister = [group.async_register(member) for member in members]
+    assert group.update_interval == timedelta(minutes=5)
+
+    with patch.object(CKPoolAPI, "get_user_stats", get_user_stats):
+        await group.async_poll()
+
+    assert 1 < peak <= CKPOOL_MAX_CONCURRENCY
+    assert [member.data["hashrate"] for member in members] == [float(index) for index in range(10)]
+    assert group.as_dict()["addresses"] == 10
+
+    for remove in unregister:
+        remove()
+    assert "solo.ckpool.org" not in hass.data[_DATA_KEY]
+
+
+async def test_group_isolates_failing_address(hass: HomeAssistant) -> None:
+    """A failing address only fails its own coordinators; shared addresses are fetched once."""
+    calls: list[str] = []
+
+    async def get_user_stats(_api: CKPoolAPI, address: str, _deadline: object = None) -> dict[str, Any]:
+        calls.append(address)
+        if address == "bad":
+            raise TimeoutError
+        return {"hashrate": 1.0}
+
+    group = ckpool_group(hass, "solo.ckpool.org")
+    good = CKPoolCoordinator(hass, "good", "solo.ckpool.org", timedelta(minutes=5))
+    good_twin = CKPoolCoordinator(hass, "good", "solo.ckpool.org", timedelta(minutes=5))
+    bad = CKPoolCoordinator(hass, "bad", "solo.ckpool.org", timedelta(minutes=5))
+    for member in (good, good_twin, bad):
+        group.async_register(member)
+
+    with patch.object(CKPoolAPI, "get_user_stats", get_user_stats):
+        await group.async_poll()
+
+    assert sorted(calls) == ["bad", "good"]
+    assert good.last_update_success
+    assert good_twin.data == {"hashrate": 1.0}
+    assert not bad.last_update_success
+
+
+async def test_group_circuit_breaker_per_address(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker, no_sleep: None
+) -> None:
+    """An address failing until its circuit breaker opens does not block the other addresses."""
+    aioclient_mock.get("https://solo.ckpool.org/users/bad", text="nope", headers={"Content-Type": "text/plain"})
+    aioclient_mock.get(
+        "https://solo.ckpool.org/users/good", json={"hashrate1m": "1T"}, headers={"Content-Type": "application/json"}
+    )
+    group = ckpool_group(hass, "solo.ckpool.org")
+    good = CKPoolCoordinator(hass, "good", "solo.ckpool.org", timedelta(minutes=5))
+    bad = CKPoolCoordinator(hass, "bad", "solo.ckpool.org", timedelta(minutes=5))
+    for member in (good, bad):
+        group.async_register(member)
+
+    for _ in range(CIRCUIT_BREAKER_THRESHOLD):
+        await group.async_poll()
+    assert group.as_dict()["open_circuits"] == 1
+
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(
+        "https://solo.ckpool.org/users/good", json={"hashrate1m": "2T"}, headers={"Content-Type": "application/json"}
+    )
+    await group.async_poll()
+    assert good.last_update_success
+    assert good.data["hashrate"] == 2000.0
+    assert not bad.last_update_success
+    assert "Circuit breaker open" in str(bad.last_exception)
+    assert [str(call[1]) for call in aioclient_mock.mock_calls] == ["https://solo.ckpool.org/users/good"]
+
+
+async def test_entries_share_region_group(
+    hass: HomeAssistant,
+    ckpool_config_entry: MockConfigEntry,
+    aioclient_mock: AiohttpClientMocker,
+) -> None:
+    """Entries of one region share the client and are polled together until the last unloads."""
+    second_entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="CKPool Mining 2",
+        data={
+            CONF_SENSOR_TYPE: SENSOR_TYPE_CKPOOL_MINING,
+            CONF_ID: "second",
+            CONF_BTC_ADDRESS: SECOND_ADDRESS,
+            CONF_CKPOOL_REGION: "solo.ckpool.org",
+            CONF_UPDATE_FREQUENCY: 2,
+        },
+        unique_id="ckpool_mining_second",
+    )
+    first_address = ckpool_config_entry.data[CONF_BTC_ADDRESS]
+    aioclient_mock.get(
+        f"https://solo.ckpool.org/users/{first_address}",
+        json={"hashrate1m": "1T"},
+        headers={"Content-Type": "application/json"},
+    )
+    aioclient_mock.get(f"https://solo.ckpool.org/users/{SECOND_ADDRESS}", status=500)
+
+    for entry in (ckpool_config_entry, second_entry):
+        entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    first = ckpool_config_entry.runtime_data.coordinators[ckpool_config_entry.entry_id]
+    second = second_entry.runtime_data.coordinators[second_entry.entry_id]
+    assert first.group is second.group
+    assert first.group.update_interval == timedelta(minutes=2)
+
+    await first.group.async_poll()
+    assert first.last_update_success
+    assert first.data["hashrate"] == 1000.0
+    assert not second.last_update_success
+
+    diag = await async_get_config_entry_diagnostics(hass, second_entry)
+    assert diag["runtime_data"]["coordinators"][second_entry.entry_id]["ckpool_group"]["entries"] == 2
+
+    assert await hass.config_entries.async_unload(second_entry.entry_id)
+    assert first.group.update_interval == timedelta(minutes=5)
+    assert await hass.config_entries.async_unload(ckpool_config_entry.entry_id)
+    assert "solo.ckpool.org" not in hass.data[_DATA_KEY]
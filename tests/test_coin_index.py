@@ -0,0 +1,97 @@
+"""Test the coin list index."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+import pytest
+from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClientMocker
+
+from custom_components.cryptoinfo.api import coin_index
+from custom_components.cryptoinfo.api.coin_index import CoinIndex, parse_coin_list
+from custom_components.cryptoinfo.api.coingecko_api import CoinGeckoAPI
+from custom_components.cryptoinfo.api.json_codec import json_loads, json_loads_stdlib
+from custom_components.cryptoinfo.const import API_ENDPOINT
+from custom_components.cryptoinfo.exceptions import CryptoInfoInvalidResponseError
+
+from .conftest import load_fixture
+
+
+async def test_parse_matches_full_decode(hass: HomeAssistant, aioclient_mock: AiohttpClientMocker) -> None:
+    """Records parsed one at a time match a full decode of the body."""
+    raw = load_fixture("coins_list.json")
+    aioclient_mock.get(f"{API_ENDPOINT}coins/list", content=raw)
+    api = CoinGeckoAPI(hass)
+    index = await api.get_coin_list()
+    expected = [{"id": c["id"], "name": c["name"], "symbol": c["symbol"]} for c in json.loads(raw)]
+    assert index == expected
+
+
+async def test_parse_skips_malformed_records(hass: HomeAssistant, aioclient_mock: AiohttpClientMocker) -> None:
+    """Non-object entries and records without an id are ignored."""
+    body = (
+        b'[{"id":"bitcoin","symbol":"btc","name":"Bitcoin"}, 42, "x", [1, {"id": "nested"}], {"symbol":"x"},'
+        b' {"id":"\\u00e9","name":"\xc3\xa9"}, {"id": "brace", "name": "a } \\" ] {"}]'
+    )
+    aioclient_mock.get(f"{API_ENDPOINT}coins/list", content=body)
+    api = CoinGeckoAPI(hass)
+    index = await api.get_coin_list()
+    assert [coin["id"] for coin in index] == ["bitcoin", "\u00e9", "brace"]
+    assert index[1]["name"] == "\u00e9"
+    assert index[2]["name"] == 'a } " ] {'
+
+
+@pytest.mark.parametrize("body", [b'{"status": {"error_code": 429}}', b'[{"id":"bitcoin"'])
+async def test_parse_invalid_payload(hass: HomeAssistant, aioclient_mock: AiohttpClientMocker, body: bytes) -> None:
+    """Non-list or truncated bodies yield an empty index instead of raising."""
+    aioclient_mock.get(f"{API_ENDPOINT}coins/list", content=body)
+    api = CoinGeckoAPI(hass)
+    index = await api.get_coin_list()
+    assert len(index) == 0
+    assert api._consecutive_failures == 1
+
+
+@pytest.mark.parametrize(
+    "body",
+    [b"", b"[", b' [{"id": "a"}, ', b'[{"id": "a"}', b'[{"id": "a', b'[{"id": "a"}, 42', b'[{"id": "a"}, "b'],
+)
+@pytest.mark.parametrize("decoder", [json_loads, json_loads_stdlib])
+def test_parse_truncated(body: bytes, decoder: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A body cut short is reported as truncated, whichever decoder is active."""
+    monkeypatch.setattr(coin_index, "json_loads", decoder)
+    with pytest.raises(CryptoInfoInvalidResponseError, match="Truncated coin list response"):
+        parse_coin_list(body)
+
+
+@pytest.mark.parametrize(
+    "body", [b'[{"id": "a",}]', b'[{"id": "a"} {"id": "b"}]', b"[nope]", b"[,]", b'[{"id": "a"]}]']
+)
+@pytest.mark.parametrize("decoder", [json_loads, json_loads_stdlib])
+def test_parse_invalid_json(body: bytes, decoder: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A complete but malformed body is reported as invalid JSON, not truncated."""
+    monkeypatch.setattr(coin_index, "json_loads", decoder)
+    with pytest.raises(CryptoInfoInvalidResponseError, match="Invalid JSON in coin list"):
+        parse_coin_list(body)
+
+
+def test_index_lookup_and_search() -> None:
+    index = CoinIndex.from_records(json.loads(load_fixture("coins_list.json")))
+    assert index.has_id("Bitcoin")
+    assert not index.has_id("nope")
+    assert index.get("ethereum") == {"id": "ethereum", "name": "Ethereum", "symbol": "eth"}
+    assert index.get("nope") is None
+    assert [coin["id"] for coin in index.search("ETH", limit=2)] == ["ethereum", "tether"]
+    assert index.search("bitcoin", limit=0) == []
+    assert index[-1] == index[len(index) - 1]
+    assert index[:2] == [index[0], index[1]]
+    with pytest.raises(IndexError):
+        index[len(index)]
+
+
+def test_index_interns_symbols() -> None:
+    index = CoinIndex()
+    index.add("a", "".join(["b", "tc"]), "A")
+    index.add("b", "".join(["bt", "c"]), "B")
+    assert index[0]["symbol"] is index[1]["symbol"]
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
 
 from homeassistant.core import HomeAssistant
 import pytest
@@ -10,9 +11,12 @@ from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClien
 
 from custom_components.cryptoinfo.api.coingecko_api import (
     CIRCUIT_BREAKER_THRESHOLD,
+    MARKETS_BATCH_SIZE,
+    RATE_LIMIT_CALLS,
+    SIMPLE_PRICE_FIELDS,
     CoinGeckoAPI,
 )
-from custom_components.cryptoinfo.const import API_ENDPOINT
+from custom_components.cryptoinfo.const import API_ENDPOINT, API_PLAN_DEMO, API_PLAN_PRO, PRO_API_ENDPOINT
 from custom_components.cryptoinfo.exceptions import (
     CryptoInfoConnectionError,
     CryptoInfoInvalidResponseError,
@@ -37,6 +41,61 @@ async def test_get_coins_markets_invalid(hass: HomeAssistant, aioclient_mock: Ai
         await api.get_coins_markets("bitcoin", "usd")
 
 
+async def test_get_coins_markets_batches_ids(hass: HomeAssistant, aioclient_mock: AiohttpClientMocker) -> None:
+    """Watchlists larger than one page are split into several requests."""
+    aioclient_mock.get(f"{API_ENDPOINT}coins/markets", json=MARKETS_RESPONSE)
+    api = CoinGeckoAPI(hass)
+    ids = ",".join(f"coin{i}" for i in range(MARKETS_BATCH_SIZE + 1))
+    data = await api.get_coins_markets(ids, "usd", ())
+    assert aioclient_mock.call_count == 2
+    assert len(data) == 2
+    url = aioclient_mock.mock_calls[-1][1]
+    assert url.query["ids"] == f"coin{MARKETS_BATCH_SIZE}"
+    assert url.query["per_page"] == str(MARKETS_BATCH_SIZE)
+    assert "price_change_percentage" not in url.query
+
+
+async def test_get_simple_price_normalizes(hass: HomeAssistant, aioclient_mock: AiohttpClientMocker) -> None:
+    """/simple/price entries are mapped onto the markets record shape."""
+    aioclient_mock.get(
+        f"{API_ENDPOINT}simple/price",
+        json={
+            "bitcoin": {
+                "eur": 45000.0,
+                "eur_market_cap": 9.0e11,
+                "eur_24h_vol": 2.0e10,
+                "eur_24h_change": -1.5,
+                "last_updated_at": 1700000000,
+            },
+            "unknown": {},
+        },
+    )
+    api = CoinGeckoAPI(hass)
+    data = await api.get_simple_price(
+        "bitcoin,unknown", "EUR", include_market_cap=True, include_24h_vol=True, include_24h_change=True
+    )
+    assert data == [
+        {
+            "id": "bitcoin",
+            "current_price": 45000.0,
+            "market_cap": 9.0e11,
+            "total_volume": 2.0e10,
+            "price_change_percentage_24h_in_currency": -1.5,
+            "last_updated": "2023-11-14T22:13:20.000Z",
+        }
+    ]
+    assert set(data[0]) <= SIMPLE_PRICE_FIELDS
+    assert aioclient_mock.mock_calls[-1][1].query["vs_currencies"] == "eur"
+
+
+async def test_get_simple_price_invalid(hass: HomeAssistant, aioclient_mock: AiohttpClientMocker) -> None:
+    """A non-dict /simple/price payload raises an invalid-response error."""
+    aioclient_mock.get(f"{API_ENDPOINT}simple/price", json=[1, 2])
+    api = CoinGeckoAPI(hass)
+    with pytest.raises(CryptoInfoInvalidResponseError):
+        await api.get_simple_price("bitcoin", "usd")
+
+
 async def test_coin_list_is_cached(hass: HomeAssistant, aioclient_mock: AiohttpClientMocker) -> None:
     """The coin list is fetched once and cached."""
     aioclient_mock.get(f"{API_ENDPOINT}coins/list", json=COIN_LIST_RESPONSE)
@@ -188,6 +247,47 @@ async def test_sliding_window_rate_limit(hass: HomeAssistant, no_sleep: None) ->
     assert len(api._request_timestamps) >= 10
 
 
+async def test_limiter_state(hass: HomeAssistant) -> None:
+    """The limiter reports window usage, next allowed time and circuit state."""
+    api = CoinGeckoAPI(hass)
+    now = datetime.now(UTC)
+    assert api.next_request_allowed() >= now
+    assert api.limiter_state()["circuit_open"] is False
+
+    api.min_request_interval = 120
+    api._request_timestamps = [now - timedelta(seconds=90), now - timedelta(seconds=30)]
+    assert api.calls_in_window() == 1
+    assert api.rate_budget_remaining() == RATE_LIMIT_CALLS - 1
+    assert abs((api.next_request_allowed() - (now + timedelta(seconds=90))).total_seconds()) < 1
+
+    api.min_request_interval = 0
+    api._request_timestamps = [now - timedelta(seconds=50 - i) for i in range(RATE_LIMIT_CALLS)]
+    assert api.rate_budget_remaining() == 0
+    assert abs((api.next_request_allowed() - (now + timedelta(seconds=10))).total_seconds()) < 1
+
+    for _ in range(CIRCUIT_BREAKER_THRESHOLD):
+        api._record_failure()
+    assert api.circuit_open
+    assert api.next_request_allowed() > now + timedelta(seconds=60)
+    assert api.limiter_state()["consecutive_failures"] == CIRCUIT_BREAKER_THRESHOLD
+
+
+async def test_queued_requests_counted_while_waiting(hass: HomeAssistant) -> None:
+    """Requests sleeping in the limiter are reported as queued."""
+    api = CoinGeckoAPI(hass)
+    seen: list[int] = []
+
+    async def _sleep(_seconds: float) -> None:
+        seen.append(api.queued_requests)
+
+    api.min_request_interval = 60
+    api._request_timestamps = [datetime.now(UTC)]
+    with patch("custom_components.cryptoinfo.api.coingecko_api.asyncio.sleep", _sleep):
+        await api._check_rate_limit()
+    assert seen == [1]
+    assert api.queued_requests == 0
+
+
 async def test_request_timeout(hass: HomeAssistant, aioclient_mock: AiohttpClientMocker, no_sleep: None) -> None:
     """A timeout surfaces as a connection error."""
     aioclient_mock.get(f"{API_ENDPOINT}coins/markets", exc=TimeoutError())
@@ -202,3 +302,31 @@ async def test_client_error_4xx(hass: HomeAssistant, aioclient_mock: AiohttpClie
     api = CoinGeckoAPI(hass)
     with pytest.raises(CryptoInfoConnectionError):
         await api.get_coins_markets("bitcoin", "usd")
+
+
+async def test_api_plan_sets_host_key_and_limit(hass: HomeAssistant, aioclient_mock: AiohttpClientMocker) -> None:
+    """The plan selects the API host, the key header and the sliding window size."""
+    aioclient_mock.get(f"{API_ENDPOINT}coins/markets", json=MARKETS_RESPONSE)
+    aioclient_mock.get(f"{PRO_API_ENDPOINT}coins/markets", json=MARKETS_RESPONSE)
+    api = CoinGeckoAPI(hass)
+    await api.get_coins_markets("bitcoin", "usd")
+    assert aioclient_mock.mock_calls[-1][3] is None
+    assert api.rate_budget_remaining() == RATE_LIMIT_CALLS - 1
+
+    api.configure("demo-key", API_PLAN_DEMO)
+    await api.get_coins_markets("bitcoin", "usd")
+    assert str(aioclient_mock.mock_calls[-1][1]).startswith(API_ENDPOINT)
+    assert aioclient_mock.mock_calls[-1][3] == {"x-cg-demo-api-key": "demo-key"}
+    assert api.rate_budget_remaining() == 30 - 2
+
+    api.configure("pro-key", API_PLAN_PRO)
+    await api.get_coins_markets("bitcoin", "usd")
+    assert str(aioclient_mock.mock_calls[-1][1]).startswith(PRO_API_ENDPOINT)
+    assert aioclient_mock.mock_calls[-1][3] == {"x-cg-pro-api-key": "pro-key"}
+    assert api.limiter_state()["rate_limit_calls"] == 1000
+    assert api.telemetry.as_dict()["coins/markets"]["requests"] == 3
+
+    # A plan without a key falls back to the public API.
+    api.configure("", API_PLAN_PRO)
+    assert api.base_url == API_ENDPOINT
+    assert api.rate_limit_calls == RATE_LIMIT_CALLS
@@ -13,7 +13,8 @@ import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClientMocker
 
-from custom_components.cryptoinfo.const import API_ENDPOINT, DOMAIN
+from custom_components.cryptoinfo.const import API_ENDPOINT, DOMAIN, PRO_API_ENDPOINT
+from custom_components.cryptoinfo.diagnostics import async_get_config_entry_diagnostics
 
 from .conftest import make_price_entry
 
@@ -56,6 +57,8 @@ async def test_user_price_flow(
     )
     assert result["type"] is FlowResultType.CREATE_ENTRY
     assert result["data"]["cryptocurrency_ids"] == "bitcoin"
+    # New entries default to the standard entity profile.
+    assert result["data"]["entity_profile"] == "standard"
 
 
 async def test_user_price_default_browse(
@@ -342,6 +345,42 @@ async def test_reconfigure_removes_entity(
     assert ent_reg.async_get_entity_id("sensor", DOMAIN, "cryptoinfo_test_ethereum_usd") is None
 
 
+async def test_reconfigure_removes_entities_on_reload(
+    hass: HomeAssistant,
+    mock_coingecko: AiohttpClientMocker,
+) -> None:
+    """A dropped crypto's price and metric entities go even when another change reloads the entry."""
+    entry = make_price_entry(cryptocurrency_ids="bitcoin, ethereum", multipliers="1, 1")
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    ent_reg = er.async_get(hass)
+    assert ent_reg.async_get_entity_id("sensor", DOMAIN, "cryptoinfo_test_ethereum_usd_market_cap") is not None
+
+    result = await entry.start_reconfigure_flow(hass)
+    result = await hass.config_entries.flow.async_configure(result["flow_id"], {"action": "modify"})
+    result = await hass.config_entries.flow.async_configure(result["flow_id"], {"search_query": ""})
+    result = await hass.config_entries.flow.async_configure(result["flow_id"], {"selected_cryptos": ["bitcoin"]})
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {
+            "id": "test",
+            "multipliers": "1",
+            "currency_name": "usd",
+            "unit_of_measurement": "EUR",
+            "update_frequency": 5,
+            "min_time_between_requests": 0,
+        },
+    )
+    await hass.async_block_till_done()
+
+    assert result["reason"] == "reconfigure_successful"
+    assert ent_reg.async_get_entity_id("sensor", DOMAIN, "cryptoinfo_test_ethereum_usd") is None
+    assert ent_reg.async_get_entity_id("sensor", DOMAIN, "cryptoinfo_test_ethereum_usd_market_cap") is None
+    assert ent_reg.async_get_entity_id("sensor", DOMAIN, "cryptoinfo_test_bitcoin_usd_market_cap") is not None
+
+
 async def test_reconfigure_modify_price(
     hass: HomeAssistant,
     mock_coingecko: AiohttpClientMocker,
@@ -544,3 +583,72 @@ async def test_options_flow(
     )
     assert result["type"] is FlowResultType.CREATE_ENTRY
     assert price_config_entry.options["update_frequency"] == 10
+    assert price_config_entry.options["profiling"] is False
+    assert price_config_entry.options["loop_watchdog"] is False
+
+
+async def test_options_flow_api_key(
+    hass: HomeAssistant,
+    price_config_entry: MockConfigEntry,
+    mock_coingecko: AiohttpClientMocker,
+) -> None:
+    """A CoinGecko key is checked against its plan before being stored."""
+    price_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(price_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    base = {"update_frequency": 0.5, "min_time_between_requests": 0.0}
+    result = await hass.config_entries.options.async_init(price_config_entry.entry_id)
+    result = await hass.config_entries.options.async_configure(result["flow_id"], {**base, "api_plan": "pro"})
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {"api_key": "api_key_required"}
+
+    mock_coingecko.get(f"{PRO_API_ENDPOINT}ping", status=401)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {**base, "api_plan": "pro", "api_key": "wrong"}
+    )
+    assert result["errors"] == {"api_key": "invalid_api_key"}
+
+    mock_coingecko.clear_requests()
+    mock_coingecko.get(f"{PRO_API_ENDPOINT}ping", json={"gecko_says": "(V3) To the Moon!"})
+    mock_coingecko.get(f"{PRO_API_ENDPOINT}coins/markets", json=[])
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {**base, "api_plan": "pro", "api_key": " secret "}
+    )
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert price_config_entry.options["api_key"] == "secret"
+    await hass.async_block_till_done()
+    api = price_config_entry.runtime_data.shared_data.api
+    assert api.plan == "pro"
+    assert api.base_url == PRO_API_ENDPOINT
+
+    diag = await async_get_config_entry_diagnostics(hass, price_config_entry)
+    assert diag["entry"]["options"]["api_key"] == "**REDACTED**"
+    assert diag["runtime_data"]["api_telemetry"]["coingecko"]["limiter"]["rate_limit_calls"] == 1000
+
+
+async def test_options_flow_mempool_mirrors(
+    hass: HomeAssistant,
+    network_config_entry: MockConfigEntry,
+    mock_mempool: AiohttpClientMocker,
+) -> None:
+    """Network entries take an ordered list of mempool mirrors; invalid URLs are refused."""
+    network_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(network_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    result = await hass.config_entries.options.async_init(network_config_entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"update_frequency": 5, "mempool_mirrors": "mempool.local/api"}
+    )
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {"mempool_mirrors": "invalid_mirror"}
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {"update_frequency": 5, "mempool_mirrors": "http://mempool.local/api/, https://mempool.space/api"},
+    )
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    await hass.async_block_till_done()
+    coordinator = network_config_entry.runtime_data.coordinators[network_config_entry.entry_id]
+    assert coordinator.api.base_urls == ("http://mempool.local/api", "https://mempool.space/api")
@@ -3,13 +3,17 @@
 from __future__ import annotations
 
 from datetime import timedelta
+from typing import Any
 
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
 import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClientMocker
 
-from custom_components.cryptoinfo.api.coingecko_api import CoinGeckoAPI
+from custom_components.cryptoinfo.api.coingecko_api import MARKETS_BATCH_SIZE, SIMPLE_PRICE_BATCH_SIZE, CoinGeckoAPI
 from custom_components.cryptoinfo.const import API_ENDPOINT
 from custom_components.cryptoinfo.coordinator import CryptoDataCoordinator
 
@@ -39,3 +43,164 @@ async def test_update_server_error(hass: HomeAssistant, aioclient_mock: AiohttpC
     coordinator = CryptoDataCoordinator(hass, api, "bitcoin", "usd", timedelta(minutes=5), "test")
     with pytest.raises(UpdateFailed):
         await coordinator._async_update_data()
+
+
+async def test_update_projects_enabled_fields(
+    hass: HomeAssistant,
+    price_config_entry: MockConfigEntry,
+    mock_coingecko: AiohttpClientMocker,
+) -> None:
+    """Disabled derived entities drop their fields from the request and the data."""
+    price_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(price_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    ent_reg = er.async_get(hass)
+    for entity_entry in er.async_entries_for_config_entry(ent_reg, price_config_entry.entry_id):
+        if entity_entry.unique_id.endswith(
+            ("_ath", "_change_1h", "_change_7d", "_change_14d", "_change_30d", "_change_1y")
+        ):
+            ent_reg.async_update_entity(entity_entry.entity_id, disabled_by=er.RegistryEntryDisabler.USER)
+
+    coordinator = price_config_entry.runtime_data.coordinator
+    assert coordinator is not None
+    data = await coordinator._async_update_data()
+
+    url = _last_request_url(mock_coingecko)
+    assert url.query["price_change_percentage"] == "24h"
+    assert url.query["sparkline"] == "false"
+    assert "ath" not in data["bitcoin"]
+    assert "price_change_percentage_1h_in_currency" not in data["bitcoin"]
+    assert data["bitcoin"]["price_change_percentage_24h_in_currency"] == 2.5
+    assert data["bitcoin"]["current_price"] == 50000.0
+
+
+async def test_update_without_entities_keeps_full_record(
+    hass: HomeAssistant, mock_coingecko: AiohttpClientMocker
+) -> None:
+    """Without a config entry nothing is projected and all windows are requested."""
+    api = CoinGeckoAPI(hass)
+    coordinator = CryptoDataCoordinator(hass, api, "bitcoin", "usd", timedelta(minutes=5), "test")
+    data = await coordinator._async_update_data()
+    assert data["bitcoin"]["ath"] == 69000
+    assert _last_request_url(mock_coingecko).query["price_change_percentage"] == "1h,24h,7d,14d,30d,1y"
+
+
+async def test_update_uses_simple_price_when_possible(
+    hass: HomeAssistant,
+    price_config_entry: MockConfigEntry,
+    mock_coingecko: AiohttpClientMocker,
+) -> None:
+    """Once identities are known, price-only entries refresh from /simple/price."""
+    mock_coingecko.get(
+        f"{API_ENDPOINT}simple/price",
+        json={"bitcoin": {"usd": 51000.0, "usd_market_cap": 960000000000, "last_updated_at": 1700000000}},
+    )
+    price_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(price_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    ent_reg = er.async_get(hass)
+    for entity_entry in er.async_entries_for_config_entry(ent_reg, price_config_entry.entry_id):
+        if entity_entry.translation_key not in (None, "crypto_price", "crypto_market_cap"):
+            ent_reg.async_update_entity(entity_entry.entity_id, disabled_by=er.RegistryEntryDisabler.USER)
+
+    coordinator = price_config_entry.runtime_data.coordinator
+    assert coordinator is not None
+    assert not coordinator.simple_price_active
+    data = await coordinator._async_update_data()
+
+    url = _last_request_url(mock_coingecko)
+    assert url.path.endswith("/simple/price")
+    assert url.query["include_market_cap"] == "true"
+    assert url.query["include_24hr_vol"] == "false"
+    assert coordinator.simple_price_active
+    assert data["bitcoin"] == {
+        "id": "bitcoin",
+        "symbol": "btc",
+        "name": "Bitcoin",
+        "image": "https://example.com/btc.png",
+        "current_price": 51000.0,
+        "market_cap": 960000000000,
+        "last_updated": "2023-11-14T22:13:20.000Z",
+    }
+
+
+async def test_update_needs_markets_for_derived_fields(
+    hass: HomeAssistant,
+    price_config_entry: MockConfigEntry,
+    mock_coingecko: AiohttpClientMocker,
+) -> None:
+    """Fields /simple/price cannot serve keep the coordinator on /coins/markets."""
+    price_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(price_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = price_config_entry.runtime_data.coordinator
+    assert coordinator is not None
+    await coordinator._async_update_data()
+    assert _last_request_url(mock_coingecko).path.endswith("/coins/markets")
+    assert not coordinator.simple_price_active
+
+
+async def test_changed_ids_follow_last_updated(hass: HomeAssistant, aioclient_mock: AiohttpClientMocker) -> None:
+    """Only coins whose last_updated moved are reported as changed."""
+    ethereum = {"id": "ethereum", "current_price": 3000.0, "last_updated": "2024-01-01T00:00:00.000Z"}
+    bitcoin = {"id": "bitcoin", "current_price": 50000.0, "last_updated": "2024-01-01T00:00:00.000Z"}
+    aioclient_mock.get(f"{API_ENDPOINT}coins/markets", json=[bitcoin, ethereum])
+    coordinator = CryptoDataCoordinator(
+        hass, CoinGeckoAPI(hass), "bitcoin,ethereum", "usd", timedelta(minutes=5), "test"
+    )
+    await coordinator.async_refresh()
+    assert coordinator.changed_ids is None
+    assert coordinator.coin_changed("bitcoin")
+
+    aioclient_mock.clear_requests()
+    moved = bitcoin | {"current_price": 51000.0, "last_updated": "2024-01-01T00:05:00.000Z"}
+    aioclient_mock.get(f"{API_ENDPOINT}coins/markets", json=[moved, ethereum])
+    await coordinator.async_refresh()
+    assert coordinator.changed_ids == frozenset({"bitcoin"})
+    assert not coordinator.coin_changed("ethereum")
+
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(f"{API_ENDPOINT}coins/markets", json=[moved])
+    await coordinator.async_refresh()
+    assert coordinator.changed_ids == frozenset({"ethereum"})
+
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(f"{API_ENDPOINT}coins/markets", status=400)
+    await coordinator.async_refresh()
+    assert coordinator.changed_ids is None
+
+
+async def test_data_age(hass: HomeAssistant) -> None:
+    """Data age is measured from the coin's last_updated timestamp."""
+    coordinator = CryptoDataCoordinator(hass, CoinGeckoAPI(hass), "bitcoin", "usd", timedelta(minutes=5), "test")
+    assert coordinator.data_age("bitcoin") is None
+    last_updated = dt_util.utcnow() - timedelta(minutes=10)
+    coordinator.data = {
+        "bitcoin": {"last_updated": last_updated.isoformat()},
+        "ethereum": {"last_updated": "garbage"},
+    }
+    age = coordinator.data_age("bitcoin")
+    assert age is not None
+    assert 599 <= age <= 660
+    assert coordinator.data_age("ethereum") is None
+
+
+async def test_requests_per_refresh_follow_endpoint(hass: HomeAssistant) -> None:
+    """Pages per refresh use the batch size of the endpoint serving the refresh."""
+    coin_ids = ",".join(f"coin{number}" for number in range(MARKETS_BATCH_SIZE + 1))
+    coordinator = CryptoDataCoordinator(hass, CoinGeckoAPI(hass), coin_ids, "usd", timedelta(minutes=5), "test")
+    assert coordinator.requests_per_refresh() == 2
+    coordinator.simple_price_active = True
+    assert coordinator.requests_per_refresh() == 1
+    coordinator.cryptocurrency_ids = (
+        f"{coin_ids},{','.join(f'more{number}' for number in range(SIMPLE_PRICE_BATCH_SIZE))}"
+    )
+    assert coordinator.requests_per_refresh() == 2
+
+
+def _last_request_url(aioclient_mock: AiohttpClientMocker) -> Any:
+    """Return the URL of the last mocked request."""
+    return aioclient_mock.mock_calls[-1][1]
@@ -0,0 +1,87 @@
+"""Tests for the refresh deadline used to fit client retries."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+import pytest
+from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClientMocker, AiohttpClientMockResponse
+
+from custom_components.cryptoinfo.api.blockchain_api import CKPOOL_ENDPOINT, BlockchainAPI, CKPoolAPI
+from custom_components.cryptoinfo.api.deadline import MIN_ATTEMPT_TIMEOUT, Deadline
+from custom_components.cryptoinfo.exceptions import CryptoInfoConnectionError
+
+from .conftest import MEMPOOL_SPACE_API
+
+
+def test_attempt_timeout_reserves_retries() -> None:
+    """An attempt gets the time left minus the retries' floor and backoff, within the cap."""
+    deadline = Deadline(29.0)
+    assert deadline.attempt_timeout(3, 30.0, 3.0) == pytest.approx(29.0 - 2 * MIN_ATTEMPT_TIMEOUT - 3.0, abs=0.01)
+    assert deadline.attempt_timeout(3, 30.0) == pytest.approx(29.0 - 2 * MIN_ATTEMPT_TIMEOUT, abs=0.01)
+    assert deadline.attempt_timeout(1, 10.0) == 10.0
+    assert deadline.attempt_timeout(100, 30.0) == MIN_ATTEMPT_TIMEOUT
+    assert Deadline(1.0).attempt_timeout(3, 30.0) <= 1.0
+
+
+def test_retry_delay_fits_or_skips() -> None:
+    """The backoff is shortened to leave a minimal attempt, or the retry is skipped."""
+    assert Deadline(20.0).retry_delay(4.0) == 4.0
+    assert Deadline(MIN_ATTEMPT_TIMEOUT + 1.0).retry_delay(4.0) == pytest.approx(1.0, abs=0.01)
+    assert Deadline(1.0).retry_delay(1.0) is None
+    assert Deadline(-5.0).remaining() == 0.0
+
+
+async def test_request_skips_retry_past_deadline(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker, no_sleep: None
+) -> None:
+    """A retry that cannot complete before the deadline is not attempted."""
+    aioclient_mock.get(f"{MEMPOOL_SPACE_API}/mempool", exc=TimeoutError())
+    api = BlockchainAPI(hass)
+
+    with pytest.raises(CryptoInfoConnectionError):
+        await api._request("/mempool", deadline=Deadline(1.0))
+    assert aioclient_mock.call_count == 1
+    stats = api.telemetry.endpoint("mempool")
+    assert (stats.retries, stats.retries_skipped) == (0, 1)
+
+    # Without a deadline every retry is made.
+    with pytest.raises(CryptoInfoConnectionError):
+        await api._request("/mempool")
+    assert aioclient_mock.call_count == 4
+
+
+async def test_ckpool_skips_retry_past_deadline(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker, no_sleep: None
+) -> None:
+    """CKPool retries are fitted to the deadline too."""
+    aioclient_mock.get("https://solo.ckpool.org/users/addr", exc=TimeoutError())
+    api = CKPoolAPI(hass, "solo.ckpool.org")
+    assert await api.get_user_stats("addr", Deadline(1.0)) is None
+    assert aioclient_mock.call_count == 1
+    assert api.telemetry.as_dict()[CKPOOL_ENDPOINT]["retries_skipped"] == 1
+
+
+async def test_slow_first_attempt_fits_budget(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A request taking ~15 s succeeds on its first attempt within a 29 s refresh budget."""
+    skew = 0.0
+    monotonic = time.monotonic
+    # The event loop reads time.monotonic too, so skewing it lets the attempt's timeout fire.
+    monkeypatch.setattr(time, "monotonic", lambda: monotonic() + skew)
+
+    async def slow_response(method: str, url: Any, data: Any) -> AiohttpClientMockResponse:
+        nonlocal skew
+        skew += 15.0
+        for _ in range(3):
+            await asyncio.sleep(0)
+        return AiohttpClientMockResponse(method, url, json={"count": 1})
+
+    aioclient_mock.get(f"{MEMPOOL_SPACE_API}/mempool", side_effect=slow_response)
+    api = BlockchainAPI(hass)
+    assert await api._request("/mempool", deadline=Deadline(29.0)) == {"count": 1}
+    assert aioclient_mock.call_count == 1
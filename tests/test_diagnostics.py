@@ -6,8 +6,11 @@ from homeassistant.core import HomeAssistant
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClientMocker
 
+from custom_components.cryptoinfo.const import CONF_MEMPOOL_MIRRORS, DOMAIN
 from custom_components.cryptoinfo.diagnostics import async_get_config_entry_diagnostics
 
+from .conftest import MEMPOOL_SPACE_API
+
 
 async def test_diagnostics_price(
     hass: HomeAssistant,
@@ -22,7 +25,11 @@ async def test_diagnostics_price(
     diag = await async_get_config_entry_diagnostics(hass, price_config_entry)
     assert diag["entry"]["domain"] == "cryptoinfo"
     assert "main" in diag["runtime_data"]["coordinators"]
+    assert set(diag["runtime_data"]["coordinators"]["main"]["coin_data_age"]) == {"bitcoin"}
     assert diag["runtime_data"]["shared_data"]["min_time_between_requests"] is not None
+    session = diag["runtime_data"]["api_telemetry"]["coingecko"]["session"]
+    assert session["provider"] == "coingecko"
+    assert session["entries"] == 1
 
 
 async def test_diagnostics_redacts_btc_address(
@@ -43,3 +50,30 @@ async def test_diagnostics_redacts_btc_address(
 
     diag = await async_get_config_entry_diagnostics(hass, ckpool_config_entry)
     assert diag["entry"]["data"]["btc_address"] == "**REDACTED**"
+    # Polled by the region group: the entry's own interval is reported, not the disabled timer.
+    (ckpool,) = diag["runtime_data"]["coordinators"].values()
+    assert ckpool["update_interval"] == "0:05:00"
+    assert ckpool["ckpool_group"]["update_interval"] == "0:05:00"
+
+
+async def test_diagnostics_hide_mirror_hosts(
+    hass: HomeAssistant,
+    mempool_config_entry: MockConfigEntry,
+    mock_mempool: AiohttpClientMocker,
+) -> None:
+    """Mempool mirror URLs are reduced to the mirror keys used by the mirrors section."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title=mempool_config_entry.title,
+        data=dict(mempool_config_entry.data),
+        options={CONF_MEMPOOL_MIRRORS: f"{MEMPOOL_SPACE_API}, http://umbrel.local:3006/api"},
+        unique_id=mempool_config_entry.unique_id,
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    diag = await async_get_config_entry_diagnostics(hass, entry)
+    assert diag["entry"]["options"][CONF_MEMPOOL_MIRRORS] == ["mirror_0", "mirror_1"]
+    assert set(diag["runtime_data"]["api_telemetry"][entry.entry_id]["mirrors"]) == {"mirror_0", "mirror_1"}
+    assert "umbrel.local" not in str(diag)
@@ -10,7 +10,13 @@ from custom_components.cryptoinfo.api.storage_helper import (
     DEFAULT_MIN_TIME_BETWEEN_REQUESTS,
     CryptoInfoStore,
 )
-from custom_components.cryptoinfo.helpers import build_price_unique_id
+from custom_components.cryptoinfo.helpers import (
+    build_price_unique_id,
+    mempool_mirrors,
+    price_change_windows,
+    project_record,
+    records_by_id,
+)
 
 
 @pytest.mark.parametrize(
@@ -26,6 +32,31 @@ def test_build_price_unique_id(id_name: str, cryptocurrency_id: str, currency_na
     assert build_price_unique_id(id_name, cryptocurrency_id, currency_name) == expected
 
 
+def test_price_change_windows() -> None:
+    """Only price_change_percentage_*_in_currency fields map to request windows."""
+    fields = ["current_price", "price_change_percentage_7d_in_currency", "price_change_percentage_1y_in_currency"]
+    assert price_change_windows(fields) == {"7d", "1y"}
+    assert price_change_windows(["market_cap"]) == set()
+
+
+def test_project_record() -> None:
+    """Projection keeps only the requested keys that are present."""
+    record = {"id": "bitcoin", "current_price": 1.0, "ath": 2.0}
+    assert project_record(record, frozenset({"id", "current_price", "missing"})) == {
+        "id": "bitcoin",
+        "current_price": 1.0,
+    }
+
+
+def test_records_by_id() -> None:
+    """Records are keyed by id, projected, and malformed entries are skipped."""
+    records = [{"id": "bitcoin", "current_price": 1.0, "ath": 2.0}, {"symbol": "x"}, "garbage"]
+    assert records_by_id(records, frozenset({"id", "current_price"})) == {
+        "bitcoin": {"id": "bitcoin", "current_price": 1.0}
+    }
+    assert records_by_id(records, None) == {"bitcoin": records[0]}
+
+
 async def test_crypto_info_data_setter(hass: HomeAssistant) -> None:
     """The setter updates the value, the store and exposes a shared API client."""
     data = CryptoInfoData(hass)
@@ -51,3 +82,9 @@ async def test_store_persists(hass: HomeAssistant) -> None:
     store2 = CryptoInfoStore(hass)
     await store2.async_load()
     assert store2.data["min_time_between_requests"] == 2.0
+
+
+def test_mempool_mirrors() -> None:
+    """Mirror lists keep their order and drop blanks and trailing slashes."""
+    assert mempool_mirrors(" http://a/api/ ,, https://b/api") == ["http://a/api", "https://b/api"]
+    assert mempool_mirrors(None) == []
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 from unittest.mock import AsyncMock, patch
 
 from homeassistant.config_entries import ConfigEntryState
@@ -14,7 +15,7 @@ from custom_components.cryptoinfo import async_migrate_entry
 from custom_components.cryptoinfo.const import DOMAIN, CryptoInfoRuntimeData
 from custom_components.cryptoinfo.exceptions import CryptoInfoConnectionError
 
-from .conftest import wait_for_state
+from .conftest import make_price_entry, wait_for_state
 
 
 async def test_setup_and_unload(
@@ -79,3 +80,96 @@ async def test_setup_retry_when_init_fails(
         assert not await hass.config_entries.async_setup(price_config_entry.entry_id)
         await hass.async_block_till_done()
     assert price_config_entry.state is ConfigEntryState.SETUP_RETRY
+
+
+async def test_interval_options_apply_without_reload(
+    hass: HomeAssistant,
+    price_config_entry: MockConfigEntry,
+    mock_coingecko: AiohttpClientMocker,
+) -> None:
+    """Update frequency and request spacing changes reach the running coordinator; other changes reload."""
+    price_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(price_config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = price_config_entry.runtime_data.coordinator
+    assert coordinator is not None
+    calls = mock_coingecko.call_count
+
+    result = await hass.config_entries.options.async_init(price_config_entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"update_frequency": 10, "min_time_between_requests": 0.5}
+    )
+    await hass.async_block_till_done()
+    assert price_config_entry.runtime_data.coordinator is coordinator
+    assert coordinator.update_interval == timedelta(minutes=10)
+    assert coordinator.api.min_request_interval == 30
+    assert mock_coingecko.call_count == calls
+
+    result = await hass.config_entries.options.async_init(price_config_entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"update_frequency": 10, "min_time_between_requests": 0.5, "profiling": True}
+    )
+    await hass.async_block_till_done()
+    assert price_config_entry.state is ConfigEntryState.LOADED
+    assert price_config_entry.runtime_data.coordinator is not coordinator
+
+
+async def test_watchlist_change_applies_without_reload(
+    hass: HomeAssistant,
+    mock_coingecko: AiohttpClientMocker,
+) -> None:
+    """Adding and dropping coins only adds and removes those coins' sensors."""
+    entry = make_price_entry(cryptocurrency_ids="bitcoin", multipliers="1")
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data.coordinator
+    assert coordinator is not None
+    ent_reg = er.async_get(hass)
+    bitcoin_id = ent_reg.async_get_entity_id("sensor", DOMAIN, "cryptoinfo_test_bitcoin_usd")
+    calls = mock_coingecko.call_count
+
+    hass.config_entries.async_update_entry(
+        entry, data={**entry.data, "cryptocurrency_ids": "bitcoin, ethereum", "multipliers": "2, 1"}
+    )
+    await hass.async_block_till_done()
+    assert entry.runtime_data.coordinator is coordinator
+    assert coordinator.coin_ids() == {"bitcoin", "ethereum"}
+    assert ent_reg.async_get_entity_id("sensor", DOMAIN, "cryptoinfo_test_ethereum_usd") is not None
+    assert ent_reg.async_get_entity_id("sensor", DOMAIN, "cryptoinfo_test_ethereum_usd_market_cap") is not None
+    # The price sensor of the kept coin is updated in place with its new multiplier.
+    assert ent_reg.async_get_entity_id("sensor", DOMAIN, "cryptoinfo_test_bitcoin_usd") == bitcoin_id
+    assert hass.states.get(bitcoin_id).state == "100000.0"
+    # The added coin is fetched at once.
+    assert mock_coingecko.call_count == calls + 1
+
+    hass.config_entries.async_update_entry(
+        entry, data={**entry.data, "cryptocurrency_ids": "bitcoin", "multipliers": "2"}
+    )
+    await hass.async_block_till_done()
+    assert entry.runtime_data.coordinator is coordinator
+    assert ent_reg.async_get_entity_id("sensor", DOMAIN, "cryptoinfo_test_ethereum_usd") is None
+    assert ent_reg.async_get_entity_id("sensor", DOMAIN, "cryptoinfo_test_ethereum_usd_market_cap") is None
+    assert mock_coingecko.call_count == calls + 1
+
+
+async def test_ckpool_interval_applies_to_group(
+    hass: HomeAssistant,
+    ckpool_config_entry: MockConfigEntry,
+    aioclient_mock: AiohttpClientMocker,
+) -> None:
+    """A CKPool entry's new update frequency reschedules its region group."""
+    aioclient_mock.get(
+        f"https://solo.ckpool.org/users/{ckpool_config_entry.data['btc_address']}",
+        json={"hashrate1m": "1T", "workers": 1},
+        headers={"Content-Type": "application/json"},
+    )
+    ckpool_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(ckpool_config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = ckpool_config_entry.runtime_data.coordinators[ckpool_config_entry.entry_id]
+
+    hass.config_entries.async_update_entry(ckpool_config_entry, options={"update_frequency": 2})
+    await hass.async_block_till_done()
+    assert ckpool_config_entry.runtime_data.coordinators[ckpool_config_entry.entry_id] is coordinator
+    assert coordinator.group.update_interval == timedelta(minutes=2)
@@ -0,0 +1,47 @@
+"""Test the JSON decoding fast path.
+
+Decoder timings are compared by ``scripts/benchmark`` (``json_decode_*``).
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from typing import Any
+
+import pytest
+
+from custom_components.cryptoinfo.api import json_codec
+from custom_components.cryptoinfo.api.json_codec import json_loads, json_loads_stdlib
+
+from .conftest import load_fixture
+
+
+@pytest.mark.parametrize("name", ["coins_list.json", "coins_markets.json"])
+def test_fast_decoder_matches_stdlib(name: str) -> None:
+    """Both decoders give the same tree from raw bytes and from text."""
+    raw = load_fixture(name)
+    expected = json_loads_stdlib(raw)
+    assert json_loads(raw) == expected
+    assert json_loads(raw.decode()) == expected
+
+
+@pytest.mark.parametrize("decoder", [json_loads, json_loads_stdlib])
+def test_decoders_reject_invalid_json(decoder: Any) -> None:
+    # Callers rely on both decoders raising a ValueError subclass.
+    with pytest.raises(ValueError, match=r"."):
+        decoder(b"{not json")
+
+
+def test_stdlib_fallback_without_orjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Without orjson the module falls back to the stdlib decoder."""
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    spec = importlib.util.spec_from_file_location("json_codec_without_orjson", json_codec.__file__)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    assert module.FAST_JSON_AVAILABLE is False
+    assert module.json_loads is module.json_loads_stdlib
+    assert module.json_loads(b'{"id": "bitcoin"}') == {"id": "bitcoin"}
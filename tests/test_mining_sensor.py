@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
+
+from freezegun.api import FrozenDateTimeFactory
 from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClientMocker
 
 from custom_components.cryptoinfo.const import DOMAIN
-from custom_components.cryptoinfo.mining_sensor import CKPoolMiningSensor
+from custom_components.cryptoinfo.mining_sensor import WORKER_REMOVAL_DELAY, CKPoolMiningSensor
 
 from .conftest import wait_for_state
 
@@ -106,6 +110,130 @@ async def test_ckpool_sensor_global_json(
     assert float(workers_state.state) == 2
 
 
+def ckpool_response(addr: str, *rigs: str) -> dict:
+    """Return a CKPool user response listing ``rigs``."""
+    return {
+        "hashrate1m": "3.12T",
+        "workers": len(rigs),
+        "worker": [{"workername": f"{addr}.{rig}", "hashrate1m": "1.5T", "lastshare": 1700000000} for rig in rigs],
+    }
+
+
+async def test_ckpool_worker_sensors_follow_response(
+    hass: HomeAssistant,
+    ckpool_config_entry: MockConfigEntry,
+    aioclient_mock: AiohttpClientMocker,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Per-worker sensors are added at once, and removed once the worker was missing for the delay."""
+    addr = ckpool_config_entry.data["btc_address"]
+    url = f"https://solo.ckpool.org/users/{addr}"
+
+    def response(*rigs: str) -> dict:
+        return ckpool_response(addr, *rigs)
+
+    aioclient_mock.get(url, json=response("rig1", "rig2"), headers={"Content-Type": "application/json"})
+    ckpool_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(ckpool_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    ent_reg = er.async_get(hass)
+    base = "cryptoinfo_ckpool_bc1qexam_worker"
+    rig1 = ent_reg.async_get_entity_id("sensor", DOMAIN, f"{base}_rig1_hashrate")
+    assert rig1 is not None
+    assert float((await wait_for_state(hass, rig1)).state) == 1500.0
+    last_share = ent_reg.async_get_entity_id("sensor", DOMAIN, f"{base}_rig2_last_share")
+    assert last_share is not None
+    assert (await wait_for_state(hass, last_share)).state == "2023-11-14T22:13:20+00:00"
+
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(url, json=response("rig2", "rig3"), headers={"Content-Type": "application/json"})
+    coordinator = ckpool_config_entry.runtime_data.coordinators[ckpool_config_entry.entry_id]
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    # rig1 went missing: its sensors stay, unavailable, until the delay has passed.
+    assert ent_reg.async_get_entity_id("sensor", DOMAIN, f"{base}_rig1_hashrate") == rig1
+    assert hass.states.get(rig1).state == STATE_UNAVAILABLE
+    assert ent_reg.async_get_entity_id("sensor", DOMAIN, f"{base}_rig2_hashrate") is not None
+    assert ent_reg.async_get_entity_id("sensor", DOMAIN, f"{base}_rig3_hashrate") is not None
+
+    freezer.tick(WORKER_REMOVAL_DELAY - timedelta(minutes=1))
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert ent_reg.async_get_entity_id("sensor", DOMAIN, f"{base}_rig1_hashrate") == rig1
+
+    freezer.tick(timedelta(minutes=1))
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert ent_reg.async_get_entity_id("sensor", DOMAIN, f"{base}_rig1_hashrate") is None
+    assert hass.states.get(rig1) is None
+    assert ent_reg.async_get_entity_id("sensor", DOMAIN, f"{base}_rig2_hashrate") is not None
+    assert ckpool_config_entry.state is ConfigEntryState.LOADED
+
+
+async def test_ckpool_worker_back_in_grace_keeps_sensors(
+    hass: HomeAssistant,
+    ckpool_config_entry: MockConfigEntry,
+    aioclient_mock: AiohttpClientMocker,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """A worker listed again before the delay keeps its sensors, and its delay restarts."""
+    addr = ckpool_config_entry.data["btc_address"]
+    url = f"https://solo.ckpool.org/users/{addr}"
+    headers = {"Content-Type": "application/json"}
+    aioclient_mock.get(url, json=ckpool_response(addr, "rig1", "rig2"), headers=headers)
+    ckpool_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(ckpool_config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = ckpool_config_entry.runtime_data.coordinators[ckpool_config_entry.entry_id]
+    rig1 = er.async_get(hass).async_get_entity_id("sensor", DOMAIN, "cryptoinfo_ckpool_bc1qexam_worker_rig1_hashrate")
+    assert rig1 is not None
+
+    for rigs in (("rig2",), ("rig1", "rig2"), ("rig2",)):
+        aioclient_mock.clear_requests()
+        aioclient_mock.get(url, json=ckpool_response(addr, *rigs), headers=headers)
+        freezer.tick(WORKER_REMOVAL_DELAY / 2)
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+
+    assert hass.states.get(rig1).state == STATE_UNAVAILABLE
+    assert er.async_get(hass).async_get(rig1) is not None
+
+
+async def test_ckpool_stale_workers_removed_after_restart(
+    hass: HomeAssistant,
+    ckpool_config_entry: MockConfigEntry,
+    aioclient_mock: AiohttpClientMocker,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Sensors of a worker gone while Home Assistant was stopped are removed after the delay."""
+    addr = ckpool_config_entry.data["btc_address"]
+    base = "cryptoinfo_ckpool_bc1qexam_worker"
+    ckpool_config_entry.add_to_hass(hass)
+    ent_reg = er.async_get(hass)
+    stale = ent_reg.async_get_or_create(
+        "sensor", DOMAIN, f"{base}_old_rig_hashrate", config_entry=ckpool_config_entry
+    ).entity_id
+    other = ent_reg.async_get_or_create("sensor", DOMAIN, "cryptoinfo_other", config_entry=ckpool_config_entry)
+    aioclient_mock.get(
+        f"https://solo.ckpool.org/users/{addr}",
+        json=ckpool_response(addr, "rig1"),
+        headers={"Content-Type": "application/json"},
+    )
+    assert await hass.config_entries.async_setup(ckpool_config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = ckpool_config_entry.runtime_data.coordinators[ckpool_config_entry.entry_id]
+    assert ent_reg.async_get(stale) is not None
+
+    freezer.tick(WORKER_REMOVAL_DELAY)
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert ent_reg.async_get(stale) is None
+    assert ent_reg.async_get(other.entity_id) is not None
+    assert ent_reg.async_get_entity_id("sensor", DOMAIN, f"{base}_rig1_hashrate") is not None
+
+
 async def test_ckpool_missing_address_fails_setup(
     hass: HomeAssistant,
     aioclient_mock: AiohttpClientMocker,
@@ -0,0 +1,78 @@
+"""Tests for the local provider stand-in used in load tests."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator
+
+from aiohttp.test_utils import TestServer
+from homeassistant.core import HomeAssistant
+import pytest
+
+from custom_components.cryptoinfo.api import coingecko_api
+from custom_components.cryptoinfo.api.blockchain_api import BlockchainAPI, CKPoolAPI
+from custom_components.cryptoinfo.api.coingecko_api import CoinGeckoAPI
+from custom_components.cryptoinfo.exceptions import CryptoInfoConnectionError, CryptoInfoRateLimitError
+
+from .mock_providers import FaultConfig, MockProviders, redirect_providers
+
+
+@pytest.fixture
+async def providers(socket_enabled: None) -> AsyncGenerator[MockProviders]:
+    """Serve the mock providers on localhost and point the API clients at them."""
+    mock = MockProviders(seed=1)
+    server = TestServer(mock.application(), host="127.0.0.1")
+    await server.start_server()
+    with redirect_providers(str(server.make_url(""))):
+        yield mock
+    await server.close()
+
+
+async def test_clients_against_mock(hass: HomeAssistant, providers: MockProviders) -> None:
+    """Every API client gets well-formed payloads from the stand-in."""
+    api = CoinGeckoAPI(hass)
+    api.min_request_interval = 0
+    markets = await api.get_coins_markets("bitcoin,my-token", "usd")
+    assert [record["id"] for record in markets] == ["bitcoin", "my-token"]
+    prices = await api.get_simple_price("bitcoin", "usd", include_market_cap=True)
+    assert prices[0]["current_price"] > 0
+    assert "market_cap" in prices[0]
+
+    mempool = BlockchainAPI(hass)
+    assert (await mempool.get_network_stats())["block_height"] == 870_000  # type: ignore[index]
+    assert (await mempool.get_mempool_stats())["fee_minimum"] == 1  # type: ignore[index]
+
+    eu = await CKPoolAPI(hass, "eusolostats.ckpool.org").get_user_stats("addr")
+    assert eu is not None
+    assert eu["workers"] == 6
+    solo = await CKPoolAPI(hass, "solo.ckpool.org").get_user_stats("addr")
+    assert solo is not None
+    assert solo["workers"] == 2
+
+    assert sum(providers.requests.values()) == 9
+    assert providers.statuses[200] == 9
+
+
+async def test_rate_limit_and_server_errors(hass: HomeAssistant, providers: MockProviders) -> None:
+    """The rate limit answers 429 with Retry-After; error bursts answer 5xx."""
+    providers.faults.update({"rate_limit": 1, "retry_after": 7})
+    api = CoinGeckoAPI(hass)
+    api.min_request_interval = 0
+    await api.get_coins_markets("bitcoin", "usd")
+    with pytest.raises(CryptoInfoRateLimitError) as err:
+        await api._request(f"{coingecko_api.API_ENDPOINT}coins/list", retry=False)
+    assert err.value.retry_after == 7
+
+    providers.faults = FaultConfig(error_rate=1.0, error_burst=3)
+    ckpool = CKPoolAPI(hass)
+    with pytest.raises(CryptoInfoConnectionError):
+        await ckpool.get_user_stats("addr")
+    # The burst outlives the error rate being turned off.
+    providers.faults.error_rate = 0.0
+    for _ in range(2):
+        with pytest.raises(CryptoInfoConnectionError):
+            await ckpool.get_user_stats("addr")
+    assert await ckpool.get_user_stats("addr") is not None
+    assert providers.statuses[503] == 3
+
+    providers.faults = FaultConfig(slow_body=0.05)
+    assert (await BlockchainAPI(hass).get_mempool_stats()) is not None
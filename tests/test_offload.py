@@ -0,0 +1,51 @@
+"""Test the size-aware parse offloading."""
+
+from __future__ import annotations
+
+import threading
+
+from homeassistant.core import HomeAssistant
+import pytest
+from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClientMocker
+
+from custom_components.cryptoinfo.api import offload
+from custom_components.cryptoinfo.api.coingecko_api import CoinGeckoAPI
+from custom_components.cryptoinfo.api.offload import OFFLOAD_THRESHOLD, async_parse
+from custom_components.cryptoinfo.api.telemetry import RequestTelemetry
+from custom_components.cryptoinfo.const import API_ENDPOINT
+
+from .conftest import load_fixture
+
+
+async def test_parse_inline_below_threshold_offloaded_from_it(hass: HomeAssistant) -> None:
+    """Payloads under the threshold are parsed on the loop, from the threshold on in the executor."""
+    loop_thread = threading.get_ident()
+    telemetry = RequestTelemetry()
+
+    def parser(payload: bytes) -> tuple[int, bool]:
+        return len(payload), threading.get_ident() == loop_thread
+
+    small = b"x" * (OFFLOAD_THRESHOLD - 1)
+    large = b"x" * OFFLOAD_THRESHOLD
+    assert await async_parse(hass, telemetry, "coins/list", len(small), parser, small) == (len(small), True)
+    assert await async_parse(hass, telemetry, "coins/list", len(large), parser, large) == (len(large), False)
+
+    stats = telemetry.endpoint("coins/list")
+    assert (stats.parsed_inline, stats.parsed_offloaded) == (1, 1)
+
+
+async def test_coin_list_parsed_through_offload(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The coin list goes through the offloading parser and is counted like other payloads."""
+    raw = load_fixture("coins_list.json")
+    aioclient_mock.get(f"{API_ENDPOINT}coins/list", content=raw)
+    api = CoinGeckoAPI(hass)
+    inline = await api.get_coin_list()
+    api._coin_list_cache = None
+    monkeypatch.setattr(offload, "OFFLOAD_THRESHOLD", len(raw))
+    assert await api.get_coin_list() == inline
+    assert len(inline) > 0
+
+    stats = api.telemetry.endpoint("coins/list")
+    assert (stats.parsed_inline, stats.parsed_offloaded) == (1, 1)
@@ -0,0 +1,106 @@
+"""Test the coordinator refresh profiling."""
+
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClientMocker
+
+from custom_components.cryptoinfo.const import CONF_PROFILING
+from custom_components.cryptoinfo.diagnostics import async_get_config_entry_diagnostics
+from custom_components.cryptoinfo.profiling import PROFILE_WINDOW, RefreshProfiler, profile_phase
+
+from .conftest import make_price_entry
+
+
+def test_disabled_profiler_records_nothing() -> None:
+    """With profiling off, refreshes and phases are not recorded."""
+    profiler = RefreshProfiler()
+    with profiler.refresh(), profile_phase("network"):
+        pass
+    with profiler.fan_out():
+        pass
+    assert profiler.as_dict() == {"enabled": False, "window": 0, "summary": {}, "refreshes": []}
+
+
+def test_nested_phases_are_exclusive() -> None:
+    """A nested phase is not counted in the phase that encloses it."""
+    profiler = RefreshProfiler(enabled=True)
+    with profiler.refresh():
+        with profile_phase("network"), profile_phase("decode"):
+            sum(range(20000))
+        with profile_phase("transform"):
+            pass
+    with profiler.fan_out():
+        pass
+
+    profile = profiler.profiles[-1]
+    assert set(profile.phases) == {"network", "decode", "transform", "fan_out"}
+    assert profile.phases["decode"] > 0
+    assert profile.phases["network"] + profile.phases["decode"] + profile.phases["transform"] <= profile.duration
+    snapshot = profiler.as_dict()
+    assert snapshot["window"] == 1
+    assert set(snapshot["summary"]) == {"duration", "network", "decode", "transform", "fan_out"}
+    # Outside a profiled refresh, phases are no-ops
+    with profile_phase("network"):
+        pass
+    assert len(profiler.profiles) == 1
+
+
+def test_failed_refresh_and_rolling_window() -> None:
+    """Failed refreshes are flagged and only the last PROFILE_WINDOW are kept."""
+    profiler = RefreshProfiler(enabled=True)
+    try:
+        with profiler.refresh():
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+    assert profiler.profiles[-1].success is False
+    for _ in range(PROFILE_WINDOW + 5):
+        with profiler.refresh():
+            pass
+    assert len(profiler.profiles) == PROFILE_WINDOW
+
+
+async def test_price_refresh_profile_in_diagnostics(hass: HomeAssistant, mock_coingecko: AiohttpClientMocker) -> None:
+    """A profiled price entry dumps per-phase timings in diagnostics."""
+    entry = make_price_entry()
+    entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(entry, options={CONF_PROFILING: True})
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    diag = await async_get_config_entry_diagnostics(hass, entry)
+    profiling = diag["runtime_data"]["coordinators"][entry.entry_id]["profiling"]
+    assert profiling["enabled"] is True
+    assert profiling["window"] == 1
+    assert {"network", "decode", "transform", "fan_out"} <= set(profiling["refreshes"][0]["phases_ms"])
+
+
+async def test_mining_refresh_profile(
+    hass: HomeAssistant,
+    mempool_config_entry: MockConfigEntry,
+    mock_mempool: AiohttpClientMocker,
+) -> None:
+    """Mining coordinators are profiled too."""
+    mempool_config_entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(mempool_config_entry, options={CONF_PROFILING: True})
+    assert await hass.config_entries.async_setup(mempool_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    diag = await async_get_config_entry_diagnostics(hass, mempool_config_entry)
+    profiling = diag["runtime_data"]["coordinators"][mempool_config_entry.entry_id]["profiling"]
+    assert profiling["refreshes"][0]["success"] is True
+    assert "network" in profiling["summary"]
+
+
+async def test_profiling_off_by_default(
+    hass: HomeAssistant, price_config_entry: MockConfigEntry, mock_coingecko: AiohttpClientMocker
+) -> None:
+    """Without the option, diagnostics carry no profiling section."""
+    price_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(price_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    diag = await async_get_config_entry_diagnostics(hass, price_config_entry)
+    assert "profiling" not in diag["runtime_data"]["coordinators"][price_config_entry.entry_id]
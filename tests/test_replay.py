@@ -0,0 +1,142 @@
+"""Tests for the record-and-replay HTTP layer."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from homeassistant.core import HomeAssistant
+import pytest
+from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClientMocker
+
+from custom_components.cryptoinfo.api import replay
+from custom_components.cryptoinfo.api.blockchain_api import BlockchainAPI, CKPoolAPI
+from custom_components.cryptoinfo.api.coingecko_api import CoinGeckoAPI
+from custom_components.cryptoinfo.const import API_ENDPOINT
+
+from .conftest import MARKETS_RESPONSE, MEMPOOL_SPACE_API, load_fixture
+
+
+async def test_http_session_default(hass: HomeAssistant) -> None:
+    """Without a mode the shared Home Assistant session is used."""
+    session = replay.http_session(hass)
+    assert not isinstance(session, replay.RecordingSession | replay.ReplaySession)
+
+
+@pytest.mark.parametrize("cassette", [None, "runs/soak.jsonl"])
+async def test_cassette_resolves_in_config_dir(
+    hass: HomeAssistant,
+    aioclient_mock: AiohttpClientMocker,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    cassette: str | None,
+) -> None:
+    """The default cassette and relative paths land in the config directory, not the working one."""
+    monkeypatch.setattr(hass.config, "config_dir", str(tmp_path))
+    monkeypatch.chdir(tmp_path / "..")
+    if cassette is None:
+        monkeypatch.delenv(replay.ENV_HTTP_CASSETTE, raising=False)
+    else:
+        (tmp_path / "runs").mkdir()
+        monkeypatch.setenv(replay.ENV_HTTP_CASSETTE, cassette)
+    monkeypatch.setenv(replay.ENV_HTTP_MODE, replay.MODE_RECORD)
+    aioclient_mock.get(f"{MEMPOOL_SPACE_API}/mempool", json={"count": 12000, "vsize": 5_000_000})
+
+    await BlockchainAPI(hass)._request("/mempool")
+    assert (tmp_path / (cassette or replay.DEFAULT_CASSETTE)).is_file()
+
+
+async def test_record_then_replay(
+    hass: HomeAssistant,
+    aioclient_mock: AiohttpClientMocker,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    no_sleep: None,
+) -> None:
+    """Recorded responses are replayed offline, in order and cycling."""
+    cassette = tmp_path / "cassette.jsonl"
+    monkeypatch.setenv(replay.ENV_HTTP_CASSETTE, str(cassette))
+    monkeypatch.setenv(replay.ENV_HTTP_MODE, replay.MODE_RECORD)
+    aioclient_mock.get(f"{API_ENDPOINT}coins/markets", json=MARKETS_RESPONSE)
+    aioclient_mock.get(f"{API_ENDPOINT}coins/list", content=load_fixture("coins_list.json"))
+    aioclient_mock.get(f"{MEMPOOL_SPACE_API}/mempool", json={"count": 12000, "vsize": 5_000_000})
+    aioclient_mock.get(
+        f"{MEMPOOL_SPACE_API}/v1/fees/recommended",
+        json={"fastestFee": 20, "halfHourFee": 15, "hourFee": 10, "economyFee": 5, "minimumFee": 1},
+    )
+    aioclient_mock.get(
+        "https://eusolostats.ckpool.org/users/addr",
+        text=load_fixture("ckpool_eu_user.html").decode(),
+        headers={"Content-Type": "text/html"},
+    )
+
+    api = CoinGeckoAPI(hass)
+    api.min_request_interval = 0
+    recorded_markets = await api.get_coins_markets("bitcoin,ethereum", "usd")
+    recorded_coins = await api.get_coin_list()
+    recorded_mempool = await BlockchainAPI(hass).get_mempool_stats()
+    recorded_ckpool = await CKPoolAPI(hass, "eusolostats.ckpool.org").get_user_stats("addr")
+    recorder = hass.data[replay._DATA_KEY]
+    assert recorder.recorded == 5
+    assert len(cassette.read_text().splitlines()) == 6  # header + interactions
+
+    # Replay: nothing is served by the mocker any more.
+    aioclient_mock.clear_requests()
+    monkeypatch.setenv(replay.ENV_HTTP_MODE, replay.MODE_REPLAY)
+    monkeypatch.setenv(replay.ENV_HTTP_REPLAY_SPEED, "0")
+
+    api = CoinGeckoAPI(hass)
+    api.min_request_interval = 0
+    assert await api.get_coins_markets("bitcoin,ethereum", "usd") == recorded_markets
+    assert await api.get_coins_markets("bitcoin,ethereum", "usd") == recorded_markets
+    assert len(await api.get_coin_list()) == len(recorded_coins)
+    assert await BlockchainAPI(hass).get_mempool_stats() == recorded_mempool
+    assert await CKPoolAPI(hass, "eusolostats.ckpool.org").get_user_stats("addr") == recorded_ckpool
+    assert api.telemetry.endpoint("coins/markets").bytes_received > 0
+    player = hass.data[replay._DATA_KEY]
+    assert player.replayed == 6
+    assert aioclient_mock.call_count == 0
+
+    # A URL that was never recorded fails like a network error.
+    assert await CKPoolAPI(hass, "solo.ckpool.org").get_user_stats("addr") is None
+    assert player.misses == 3
+
+
+async def test_replay_follows_recorded_offsets(
+    hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Each response is delivered at its recorded time, scaled by the speed, cycling per run."""
+    cassette = tmp_path / "cassette.jsonl"
+    interactions = [
+        replay.Interaction("https://x/a", 200, {}, b"a", 0.5, 0.0),
+        replay.Interaction("https://x/b", 200, {}, b"b", 1.0, 3.0),
+    ]
+    cassette.write_text(
+        f'{{"cassette": {replay.CASSETTE_VERSION}}}\n' + "".join(item.to_json() + "\n" for item in interactions)
+    )
+    monkeypatch.setattr(replay.time, "monotonic", lambda: 100.0)
+    delays: list[float] = []
+
+    async def record_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(replay.asyncio, "sleep", record_sleep)
+    player = replay.ReplaySession(hass, cassette, speed=2.0)
+    for url in ("https://x/b", "https://x/a", "https://x/a"):
+        async with player.get(url) as response:
+            await response.read()
+    # b answered 4s into the run, a 0.5s in, then again one 4s run later.
+    assert delays == [2.0, 0.25, 2.25]
+
+
+def test_load_cassette_rejects_unknown_format(tmp_path: Path) -> None:
+    """A file without a cassette header is refused."""
+    cassette = tmp_path / "cassette.jsonl"
+    cassette.write_text('{"url": "x"}\n')
+    with pytest.raises(ValueError, match="Unsupported cassette format"):
+        replay.load_cassette(cassette)
+
+
+def test_binary_body_round_trip() -> None:
+    """Bodies that are not UTF-8 are stored as base64."""
+    interaction = replay.Interaction("https://x/y", 200, {}, b"\xff\x00", 0.1)
+    assert replay.Interaction.from_json(interaction.to_json()).body == b"\xff\x00"
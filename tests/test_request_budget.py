@@ -0,0 +1,62 @@
+"""Tests for the CoinGecko request budget planner."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from homeassistant.core import HomeAssistant
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClientMocker
+
+from custom_components.cryptoinfo.const import DOMAIN
+from custom_components.cryptoinfo.diagnostics import async_get_config_entry_diagnostics
+from custom_components.cryptoinfo.request_budget import budget_summary, plan_intervals
+
+from .conftest import make_price_entry
+
+
+def test_plan_keeps_intervals_that_fit() -> None:
+    """Requested intervals within the capacity are kept."""
+    assert plan_intervals(1.0, [(1, 5.0), (2, 60.0)]) == [5.0, 60.0]
+
+
+def test_plan_stretches_with_weighted_fairness() -> None:
+    """Slow demands keep their interval; the others share one stretched interval."""
+    intervals = plan_intervals(0.1, [(1, 5.0), (1, 60.0), (2, 10.0)])
+    assert intervals == pytest.approx([36.0, 60.0, 36.0])
+    # The plan uses exactly the capacity.
+    assert sum(requests / interval for requests, interval in zip((1, 1, 2), intervals, strict=True)) == (
+        pytest.approx(0.1)
+    )
+
+
+async def test_entries_share_public_budget(
+    hass: HomeAssistant,
+    mock_coingecko: AiohttpClientMocker,
+) -> None:
+    """Price entries polling faster than the public limit allows are stretched, and relaxed on unload."""
+    first = make_price_entry(update_frequency=0.1)
+    second = MockConfigEntry(
+        domain=DOMAIN, title="Cryptoinfo - Other", data={**first.data, "id": "other"}, unique_id="other"
+    )
+    for entry in (first, second):
+        entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    # 2 x 10 calls/min requested, 8 planned on the public API: 15 s each.
+    coordinator = first.runtime_data.coordinator
+    assert coordinator is not None
+    assert coordinator.requested_interval == timedelta(seconds=6)
+    assert coordinator.update_interval == timedelta(seconds=15)
+    diag = await async_get_config_entry_diagnostics(hass, first)
+    budget = diag["runtime_data"]["coordinators"]["main"]["request_budget"]
+    assert budget["plan"] == "public"
+    assert budget["demand_per_minute"] == 20
+    assert budget["capacity_per_minute"] == 8
+    assert budget["oversubscribed"] is True
+    assert "stretched" in budget_summary(hass)
+
+    assert await hass.config_entries.async_unload(second.entry_id)
+    assert coordinator.update_interval == timedelta(seconds=7.5)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from datetime import timedelta
 from typing import Any
+from unittest.mock import patch
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
@@ -81,12 +82,30 @@ async def test_extra_state_attributes(hass: HomeAssistant) -> None:
     attrs = sensor.extra_state_attributes
     assert attrs["cryptocurrency_id"] == "bitcoin"
     assert attrs["cryptocurrency_symbol"] == "btc"
+    assert attrs["last_update"] == MARKETS_RESPONSE[0]["last_updated"]
     # Metrics are no longer attributes
     assert "baseprice" not in attrs
     assert "market_cap" not in attrs
     assert "rank" not in attrs
 
 
+async def test_unchanged_coin_skips_state_write(hass: HomeAssistant) -> None:
+    """Entities of coins that did not change in the last refresh do not write state."""
+    sensor = _make_sensor(hass)
+    sensor.hass = hass
+    sensor.entity_id = "sensor.test_bitcoin"
+    with patch.object(sensor, "async_write_ha_state") as write_state:
+        sensor.coordinator.changed_ids = frozenset({"ethereum"})
+        sensor._handle_coordinator_update()
+        write_state.assert_not_called()
+        sensor.coordinator.changed_ids = frozenset({"bitcoin"})
+        sensor._handle_coordinator_update()
+        write_state.assert_called_once()
+        sensor.coordinator.changed_ids = None
+        sensor._handle_coordinator_update()
+        assert write_state.call_count == 2
+
+
 async def test_derived_sensor_native_value(hass: HomeAssistant) -> None:
     """Derived sensors read their metric from the API record via value_fn."""
     sensor = _make_sensor(hass)
@@ -190,3 +209,48 @@ async def test_multiplier_mismatch_creates_no_entity(
 
     ent_reg = er.async_get(hass)
     assert ent_reg.async_get_entity_id("sensor", DOMAIN, "cryptoinfo_test_bitcoin_usd") is None
+
+
+async def test_entity_profile_limits_metrics(
+    hass: HomeAssistant,
+    mock_coingecko: AiohttpClientMocker,
+) -> None:
+    """The entity profile decides which metric entities are created per coin."""
+    entry = make_price_entry(entity_profile="minimal")
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    ent_reg = er.async_get(hass)
+    unique_ids = {
+        registry_entry.unique_id
+        for registry_entry in er.async_entries_for_config_entry(ent_reg, entry.entry_id)
+        if registry_entry.unique_id.startswith("cryptoinfo_test_bitcoin_usd")
+    }
+    assert unique_ids == {"cryptoinfo_test_bitcoin_usd", "cryptoinfo_test_bitcoin_usd_change_24h"}
+
+    # Switching to a custom list removes the metrics it leaves out; picked ones are enabled.
+    hass.config_entries.async_update_entry(entry, options={"entity_profile": "custom", "entity_metrics": ["rank"]})
+    await hass.async_block_till_done()
+    assert ent_reg.async_get_entity_id("sensor", DOMAIN, "cryptoinfo_test_bitcoin_usd_change_24h") is None
+    rank_id = ent_reg.async_get_entity_id("sensor", DOMAIN, "cryptoinfo_test_bitcoin_usd_rank")
+    assert rank_id is not None
+    assert ent_reg.async_get(rank_id).disabled_by is None
+
+
+async def test_full_profile_disables_supply_and_rank(
+    hass: HomeAssistant,
+    price_config_entry: Any,
+    mock_coingecko: AiohttpClientMocker,
+) -> None:
+    """Entries without a profile keep every metric, with supply and rank disabled by default."""
+    price_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(price_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    ent_reg = er.async_get(hass)
+    for key in ("circulating_supply", "total_supply", "rank"):
+        entity_id = ent_reg.async_get_entity_id("sensor", DOMAIN, f"cryptoinfo_test_bitcoin_usd_{key}")
+        assert entity_id is not None
+        assert ent_reg.async_get(entity_id).disabled_by is er.RegistryEntryDisabler.INTEGRATION
+    assert ent_reg.async_get_entity_id("sensor", DOMAIN, "cryptoinfo_test_bitcoin_usd_change_1y") is not None
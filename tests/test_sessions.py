@@ -0,0 +1,89 @@
+"""Tests for the dedicated provider sessions."""
+
+from __future__ import annotations
+
+from aiohttp import TCPConnector, hdrs, web
+from aiohttp.test_utils import TestServer
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClientMocker
+
+from custom_components.cryptoinfo.api import sessions
+from custom_components.cryptoinfo.api.replay import http_session
+from custom_components.cryptoinfo.api.sessions import (
+    ACCEPT_ENCODING,
+    LIMIT_PER_HOST,
+    PROVIDER_MEMPOOL,
+    async_acquire_session,
+    session_state,
+)
+
+
+async def test_session_reuses_connections(hass: HomeAssistant, socket_enabled: None) -> None:
+    """Requests share kept-alive connections, counted per provider, with compression advertised."""
+    seen: list[str] = []
+
+    async def handler(request: web.Request) -> web.Response:
+        seen.append(request.headers[hdrs.ACCEPT_ENCODING])
+        assert request.headers[hdrs.USER_AGENT].startswith("HomeAssistant/")
+        return web.json_response({"ok": True})
+
+    application = web.Application()
+    application.router.add_get("/ping", handler)
+    server = TestServer(application, host="127.0.0.1")
+    await server.start_server()
+    url = str(server.make_url("/ping"))
+
+    release_first = async_acquire_session(hass, PROVIDER_MEMPOOL)
+    release_second = async_acquire_session(hass, PROVIDER_MEMPOOL)
+    session = http_session(hass, PROVIDER_MEMPOOL)
+    connector = session.connector
+    assert isinstance(connector, TCPConnector)
+    assert connector is not async_get_clientsession(hass).connector
+    assert connector.limit_per_host == LIMIT_PER_HOST[PROVIDER_MEMPOOL]
+    for _ in range(3):
+        async with session.get(url) as response:
+            assert (await response.json()) == {"ok": True}
+
+    state = session_state(hass, PROVIDER_MEMPOOL)
+    assert state is not None
+    assert state["entries"] == 2
+    assert state["requests"] == 3
+    assert state["connections_created"] == 1
+    assert state["connections_reused"] == 2
+    assert seen == [ACCEPT_ENCODING] * 3
+
+    # The session outlives the first release and closes with the last one.
+    await release_first()
+    assert http_session(hass, PROVIDER_MEMPOOL) is session
+    await release_second()
+    assert session.closed
+    assert connector.closed
+    assert session_state(hass, PROVIDER_MEMPOOL) is None
+    assert http_session(hass, PROVIDER_MEMPOOL) is not session
+    await server.close()
+
+
+async def test_entries_share_provider_session(
+    hass: HomeAssistant,
+    network_config_entry: MockConfigEntry,
+    mempool_config_entry: MockConfigEntry,
+    mock_mempool: AiohttpClientMocker,
+) -> None:
+    """Entries of one provider share its session until the last one unloads."""
+    for entry in (network_config_entry, mempool_config_entry):
+        entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    state = session_state(hass, PROVIDER_MEMPOOL)
+    assert state is not None
+    assert state["entries"] == 2
+    assert mock_mempool.call_count > 0
+
+    assert await hass.config_entries.async_unload(network_config_entry.entry_id)
+    assert session_state(hass, PROVIDER_MEMPOOL) is not None
+    assert await hass.config_entries.async_unload(mempool_config_entry.entry_id)
+    assert session_state(hass, PROVIDER_MEMPOOL) is None
+    assert sessions.PROVIDER_COINGECKO not in hass.data.get(sessions._DATA_KEY, {})
@@ -0,0 +1,224 @@
+"""Test the API request telemetry."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.util import dt as dt_util
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
+from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClientMocker
+
+from custom_components.cryptoinfo.api import offload
+from custom_components.cryptoinfo.api.blockchain_api import CKPOOL_ENDPOINT, CKPoolAPI
+from custom_components.cryptoinfo.api.coingecko_api import CIRCUIT_BREAKER_THRESHOLD, RATE_LIMIT_CALLS, CoinGeckoAPI
+from custom_components.cryptoinfo.api.telemetry import LATENCY_BUCKETS, RequestTelemetry, endpoint_name
+from custom_components.cryptoinfo.const import API_ENDPOINT, DOMAIN
+from custom_components.cryptoinfo.coordinator import CryptoDataCoordinator
+from custom_components.cryptoinfo.diagnostic_sensor import LIMITER_REFRESH_INTERVAL, limiter_sensors, telemetry_sensors
+from custom_components.cryptoinfo.diagnostics import async_get_config_entry_diagnostics
+from custom_components.cryptoinfo.exceptions import CryptoInfoRateLimitError
+
+from .conftest import MARKETS_RESPONSE, load_fixture
+
+
+@pytest.mark.parametrize(
+    ("url", "base", "expected"),
+    [
+        (f"{API_ENDPOINT}coins/markets?ids=bitcoin", API_ENDPOINT, "coins/markets"),
+        ("https://mempool.space/api/v1/fees/recommended", "https://mempool.space/api", "v1/fees/recommended"),
+        (API_ENDPOINT, API_ENDPOINT, "/"),
+    ],
+)
+def test_endpoint_name(url: str, base: str, expected: str) -> None:
+    """Endpoint names are routes relative to the API base, without query."""
+    assert endpoint_name(url, base) == expected
+
+
+def test_endpoint_stats_histogram_and_quantile() -> None:
+    """Latencies land in their bucket and the p90 is the bucket upper bound."""
+    telemetry = RequestTelemetry()
+    stats = telemetry.endpoint("coins/markets")
+    assert stats.latency_quantile(0.9) is None
+    for _ in range(9):
+        stats.observe(0.05, 200, 100, failed=False)
+    stats.observe(3.0, 503, 0, failed=True)
+
+    snapshot = telemetry.as_dict()["coins/markets"]
+    assert snapshot["requests"] == 10
+    assert snapshot["errors"] == 1
+    assert snapshot["server_errors"] == 1
+    assert snapshot["bytes_received"] == 900
+    assert snapshot["latency_histogram"]["le_0.1s"] == 9
+    assert snapshot["latency_histogram"]["le_5s"] == 1
+    assert snapshot["latency_p90_ms"] == 100.0
+    assert stats.latency_quantile(1.0) == 5.0
+    stats.observe(LATENCY_BUCKETS[-1] + 1, 200, 0, failed=False)
+    assert snapshot["latency_histogram"]["inf"] == 0
+    assert telemetry.as_dict()["coins/markets"]["latency_histogram"]["inf"] == 1
+    assert telemetry.requests == 11
+    assert telemetry.errors == 1
+    assert telemetry.latency_mean_ms is not None
+
+
+async def test_coingecko_records_attempts(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker, no_sleep: None
+) -> None:
+    """Every attempt, retry and 429 of the CoinGecko client is recorded."""
+    aioclient_mock.get(f"{API_ENDPOINT}coins/markets", status=429, headers={"Retry-After": "0"})
+    api = CoinGeckoAPI(hass)
+    assert api.rate_budget_remaining() == RATE_LIMIT_CALLS
+    with pytest.raises(CryptoInfoRateLimitError):
+        await api.get_coins_markets("bitcoin", "usd")
+
+    stats = api.telemetry.as_dict()["coins/markets"]
+    assert stats["requests"] == 3
+    assert stats["retries"] == 2
+    assert stats["rate_limited"] == 3
+    assert stats["errors"] == 3
+    assert api.rate_budget_remaining() == RATE_LIMIT_CALLS - 1
+
+
+async def test_coingecko_records_bytes(hass: HomeAssistant, mock_coingecko: AiohttpClientMocker) -> None:
+    """Successful attempts record the body size and no error."""
+    api = CoinGeckoAPI(hass)
+    await api.get_coins_markets("bitcoin", "usd")
+    stats = api.telemetry.as_dict()["coins/markets"]
+    assert stats["requests"] == 1
+    assert stats["errors"] == 0
+    assert stats["bytes_received"] > len(str(MARKETS_RESPONSE[0]["id"]))
+
+
+async def test_diagnostics_and_sensors(
+    hass: HomeAssistant,
+    ckpool_config_entry: MockConfigEntry,
+    aioclient_mock: AiohttpClientMocker,
+) -> None:
+    """CKPool telemetry reaches diagnostics without the address; sensors are opt-in."""
+    addr = ckpool_config_entry.data["btc_address"]
+    aioclient_mock.get(
+        f"https://solo.ckpool.org/users/{addr}",
+        json={"hashrate1m": "1T", "workers": 1, "bestshare": 0, "bestever": "0"},
+        headers={"Content-Type": "application/json"},
+    )
+    ckpool_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(ckpool_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    diag = await async_get_config_entry_diagnostics(hass, ckpool_config_entry)
+    telemetry = diag["runtime_data"]["api_telemetry"][ckpool_config_entry.entry_id]
+    assert telemetry["endpoints"]["ckpool/users"]["requests"] == 1
+    assert addr not in str(diag["runtime_data"])
+
+    ent_reg = er.async_get(hass)
+    entity_id = ent_reg.async_get_entity_id("sensor", DOMAIN, f"cryptoinfo_ckpool_{addr[:8].lower()}_api_requests")
+    assert entity_id is not None
+    entity_entry = ent_reg.async_get(entity_id)
+    assert entity_entry is not None
+    assert entity_entry.disabled_by is er.RegistryEntryDisabler.INTEGRATION
+    assert entity_entry.entity_category == "diagnostic"
+
+
+async def test_telemetry_sensor_value(hass: HomeAssistant) -> None:
+    """Telemetry sensors read the client's counters and stay available."""
+    api = CoinGeckoAPI(hass)
+    coordinator = CryptoDataCoordinator(hass, api, "bitcoin", "usd", timedelta(minutes=5), "test")
+    sensors = {
+        sensor.entity_description.key: sensor
+        for sensor in telemetry_sensors(coordinator, api.telemetry, "cryptoinfo_test", DeviceInfo())
+    }
+    assert sensors["api_latency"].native_value is None
+    api.telemetry.endpoint("coins/markets").observe(0.2, 429, 10, failed=True)
+    assert sensors["api_requests"].native_value == 1
+    assert sensors["api_rate_limited"].native_value == 1
+    assert sensors["api_latency"].native_value == 200.0
+    assert sensors["api_requests"].available is True
+    assert sensors["api_requests"].unique_id == "cryptoinfo_test_api_requests"
+
+
+async def test_limiter_sensor_values(hass: HomeAssistant) -> None:
+    """Limiter sensors read the CoinGecko client's limiter and breaker state."""
+    api = CoinGeckoAPI(hass)
+    sensors = {
+        sensor.entity_description.key: sensor for sensor in limiter_sensors(api, "cryptoinfo_test", DeviceInfo())
+    }
+    api._request_timestamps = [dt_util.utcnow()]
+    assert sensors["rate_limit_calls"].native_value == 1
+    assert sensors["rate_limit_remaining"].native_value == RATE_LIMIT_CALLS - 1
+    assert sensors["rate_limit_queued"].native_value == 0
+    assert sensors["circuit_breaker"].native_value == "closed"
+    assert isinstance(sensors["next_request_allowed"].native_value, datetime)
+    for _ in range(CIRCUIT_BREAKER_THRESHOLD):
+        api._record_failure()
+    assert sensors["circuit_breaker"].native_value == "open"
+
+
+async def test_limiter_sensor_follows_limiter_between_refreshes(
+    hass: HomeAssistant,
+    price_config_entry: MockConfigEntry,
+    mock_coingecko: AiohttpClientMocker,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Limiter sensors re-read the client on their own timer, not on price refreshes."""
+    price_config_entry.add_to_hass(hass)
+    ent_reg = er.async_get(hass)
+    ent_reg.async_get_or_create(
+        "sensor", DOMAIN, "cryptoinfo_test_rate_limit_queued", config_entry=price_config_entry, disabled_by=None
+    )
+    assert await hass.config_entries.async_setup(price_config_entry.entry_id)
+    await hass.async_block_till_done()
+    entity_id = ent_reg.async_get_entity_id("sensor", DOMAIN, "cryptoinfo_test_rate_limit_queued")
+    assert entity_id is not None
+    assert hass.states.get(entity_id).state == "0"
+
+    calls = len(mock_coingecko.mock_calls)
+    api = price_config_entry.runtime_data.shared_data.api
+    api._queued_requests = 2
+    freezer.tick(LIMITER_REFRESH_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == "2"
+    assert len(mock_coingecko.mock_calls) == calls
+
+
+async def test_diagnostics_expose_limiter(
+    hass: HomeAssistant,
+    price_config_entry: MockConfigEntry,
+    mock_coingecko: AiohttpClientMocker,
+) -> None:
+    """Price entry diagnostics include the limiter snapshot and endpoint telemetry."""
+    price_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(price_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    diag = await async_get_config_entry_diagnostics(hass, price_config_entry)
+    coingecko = diag["runtime_data"]["api_telemetry"]["coingecko"]
+    assert coingecko["limiter"]["calls_in_window"] >= 1
+    assert coingecko["limiter"]["circuit_open"] is False
+    assert coingecko["endpoints"]["coins/markets"]["requests"] >= 1
+
+
+async def test_large_payloads_parsed_in_executor(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Bodies over the threshold are parsed in the executor, small ones inline; both are counted."""
+    aioclient_mock.get(f"{API_ENDPOINT}coins/markets", json=MARKETS_RESPONSE)
+    aioclient_mock.get(
+        "https://eusolostats.ckpool.org/users/addr",
+        text=load_fixture("ckpool_eu_user.html").decode(),
+        headers={"Content-Type": "text/html"},
+    )
+    api = CoinGeckoAPI(hass)
+    await api.get_coins_markets("bitcoin", "usd")
+    monkeypatch.setattr(offload, "OFFLOAD_THRESHOLD", 1)
+    await api.get_coins_markets("bitcoin", "usd")
+    ckpool = CKPoolAPI(hass, "eusolostats.ckpool.org")
+    assert (await ckpool.get_user_stats("addr"))["workers"] == 6  # type: ignore[index]
+
+    markets = api.telemetry.as_dict()["coins/markets"]
+    assert (markets["parsed_inline"], markets["parsed_offloaded"]) == (1, 1)
+    assert ckpool.telemetry.as_dict()[CKPOOL_ENDPOINT]["parsed_offloaded"] == 1
@@ -0,0 +1,81 @@
+"""Test the event-loop lag watchdog."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+
+from homeassistant.core import HomeAssistant
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClientMocker
+
+from custom_components.cryptoinfo.const import CONF_LOOP_WATCHDOG
+from custom_components.cryptoinfo.diagnostics import async_get_config_entry_diagnostics
+from custom_components.cryptoinfo.profiling import profile_phase
+from custom_components.cryptoinfo.watchdog import LoopWatchdog, current_watchdog
+
+from .conftest import make_price_entry
+
+
+async def test_disabled_watchdog_schedules_nothing() -> None:
+    """With the option off, watching is a no-op and phases do not see a watchdog."""
+    watchdog = LoopWatchdog("test")
+    with watchdog.watch("update"):
+        assert current_watchdog() is None
+        time.sleep(0.01)  # noqa: ASYNC251 - blocks the loop on purpose
+    assert watchdog.checks == 0
+    assert watchdog.as_dict()["worst_stage"] is None
+
+
+async def test_blocking_stage_is_blamed(caplog: pytest.LogCaptureFixture) -> None:
+    """A nested phase blocking the loop past the threshold is logged and kept as worst case."""
+    watchdog = LoopWatchdog("test coordinator", enabled=True, threshold=0.02)
+    with caplog.at_level(logging.WARNING), watchdog.watch("update"):
+        assert current_watchdog() is watchdog
+        with profile_phase("decode"):
+            time.sleep(0.12)  # noqa: ASYNC251 - blocks past the probe interval plus the threshold
+    snapshot = watchdog.as_dict()
+    assert snapshot["worst_stage"] == "decode"
+    assert snapshot["worst_lag_ms"] >= 20
+    assert snapshot["slow_events"][0]["stage"] == "decode"
+    assert "test coordinator blocked the event loop" in caplog.text
+    # The probe is cancelled once the last stage ends.
+    assert watchdog._handle is None
+
+
+async def test_probe_runs_while_stage_awaits() -> None:
+    """While a stage awaits, the probe fires on time and records no slow event."""
+    watchdog = LoopWatchdog("test", enabled=True)
+    with watchdog.watch("update"):
+        await asyncio.sleep(0.12)
+    assert watchdog.checks >= 2
+    assert not watchdog.events
+
+
+async def test_watchdog_in_diagnostics(hass: HomeAssistant, mock_coingecko: AiohttpClientMocker) -> None:
+    """An entry with the watchdog on dumps its worst case in diagnostics."""
+    entry = make_price_entry()
+    entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(entry, options={CONF_LOOP_WATCHDOG: True})
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    diag = await async_get_config_entry_diagnostics(hass, entry)
+    watchdog = diag["runtime_data"]["coordinators"][entry.entry_id]["loop_watchdog"]
+    assert watchdog["enabled"] is True
+    assert watchdog["threshold_ms"] == 100.0
+    assert "profiling" not in diag["runtime_data"]["coordinators"][entry.entry_id]
+
+
+async def test_watchdog_off_by_default(
+    hass: HomeAssistant, price_config_entry: MockConfigEntry, mock_coingecko: AiohttpClientMocker
+) -> None:
+    """Without the option, diagnostics carry no watchdog section."""
+    price_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(price_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    diag = await async_get_config_entry_diagnostics(hass, price_config_entry)
+    assert "loop_watchdog" not in diag["runtime_data"]["coordinators"][price_config_entry.entry_id]